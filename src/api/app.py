@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -5,9 +6,19 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi_cache import FastAPICache
-from fastapi_cache.backends.inmemory import InMemoryBackend
+from loguru import logger
 
+from src.api.config import Config
+from src.api.database.session import preaquecer_pool
 from src.api.entrypoints.router import api_router
+from src.api.monitoring.logs import CABECALHO_REQUEST_ID, configurar_logs
+from src.api.monitoring.middleware import (
+    ContextoDaRequisicaoMiddleware,
+    MetricsMiddleware,
+)
+from src.api.monitoring.profiler import instalar_sinal
+from src.api.monitoring.tracing import configurar_tracing, encerrar_tracing
+from src.api.utils.cache import InMemoryBackendInstrumentado
 
 # from src.api.mailsender.workers import start_mailer_workers
 
@@ -17,7 +28,22 @@ APP_ROOT = Path(__file__).parent
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # asyncio.create_task(start_mailer_workers())
+    if Config.DB_CONFIG.DB_POOL_PREWARM:
+        await preaquecer_pool()
+    arquivamento = None
+    if Config.ARQUIVAMENTO_ATIVO:
+        from src.api.database.arquivamento import iniciar_arquivamento_periodico
+
+        arquivamento = asyncio.create_task(iniciar_arquivamento_periodico())
+    from src.api.database.revogacao import iniciar_sincronizacao_periodica
+
+    revogacao = asyncio.create_task(iniciar_sincronizacao_periodica())
     yield
+    revogacao.cancel()
+    if arquivamento is not None:
+        arquivamento.cancel()
+    encerrar_tracing()
+    await logger.complete()
 
 
 def get_app() -> FastAPI:
@@ -28,6 +54,9 @@ def get_app() -> FastAPI:
 
     :return: application.
     """
+    configurar_logs()
+    configurar_tracing()
+    instalar_sinal()
     _app = FastAPI(
         title="fastapi-backend",
         default_response_class=JSONResponse,
@@ -40,8 +69,11 @@ def get_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[CABECALHO_REQUEST_ID],
     )
+    _app.add_middleware(MetricsMiddleware)
+    _app.add_middleware(ContextoDaRequisicaoMiddleware)
     _app.include_router(router=api_router)
 
-    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
+    FastAPICache.init(InMemoryBackendInstrumentado(), prefix="fastapi-cache")
     return _app
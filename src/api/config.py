@@ -15,6 +15,27 @@ class AuthConfig:
     ACCESS_TOKEN_EXPIRE_MINUTES: float = float(
         os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", ...)
     )
+    # Biblioteca de JWT: "jose" (python-jose), "pyjwt" ou "auto" (PyJWT quando
+    # instalado). Tokens já validados ficam em cache até o exp; zero desativa.
+    JWT_BACKEND = os.getenv("JWT_BACKEND", "jose")
+    JWT_CACHE_SIZE: int = int(os.getenv("JWT_CACHE_SIZE", "4096"))
+    # Refresh tokens renovam o access token sem a senha; cada um vale uma vez.
+    REFRESH_TOKEN_EXPIRE_DAYS: float = float(
+        os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+    )
+    # Tokens revogados mantidos em memória por worker e intervalo de
+    # sincronização dessa lista com a tabela tokens_revogados.
+    REVOGACAO_TAMANHO_MAXIMO: int = int(
+        os.getenv("REVOGACAO_TAMANHO_MAXIMO", "100000")
+    )
+    REVOGACAO_INTERVALO_SEGUNDOS: float = float(
+        os.getenv("REVOGACAO_INTERVALO_SEGUNDOS", "30")
+    )
+    # Validade e número máximo de tentativas do código de redefinição de senha.
+    NOVA_SENHA_TOKEN_MINUTOS: float = float(
+        os.getenv("NOVA_SENHA_TOKEN_MINUTOS", "15")
+    )
+    NOVA_SENHA_MAX_TENTATIVAS: int = int(os.getenv("NOVA_SENHA_MAX_TENTATIVAS", "5"))
 
 
 class DBConfig:
@@ -29,6 +50,25 @@ class DBConfig:
     DB_ENABLE_CONNECTION_POOLING: bool = (
         os.getenv("DB_ENABLE_CONNECTION_POOLING", "True") == "True"
     )
+    # Parâmetros do pool (por processo/worker): o total de conexões abertas no
+    # banco é no máximo workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "False") == "True"
+    # Abre DB_POOL_SIZE conexões no startup, antes de aceitar requisições.
+    DB_POOL_PREWARM: bool = os.getenv("DB_POOL_PREWARM", "True") == "True"
+    # Modo serverless: engine criada no primeiro uso e sem pool (uma conexão por
+    # sessão), ignorando DB_POOL_SIZE e o pré-aquecimento. Use com um pooler
+    # externo e DB_TRANSACTION_POOLER.
+    DB_SERVERLESS: bool = os.getenv("DB_SERVERLESS", "False") == "True"
+    # Conexão via pooler em modo transação (PgBouncer, Supavisor): desativa o
+    # cache de prepared statements do asyncpg.
+    DB_TRANSACTION_POOLER: bool = os.getenv("DB_TRANSACTION_POOLER", "False") == "True"
+    # Loga a rota quando o mesmo formato de comando SQL se repete mais que N vezes
+    # em uma requisição (detecção de N+1). Zero desativa a detecção.
+    DB_N_PLUS_ONE_THRESHOLD: int = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "0"))
 
 
 class SendGridConfig:
@@ -50,6 +90,33 @@ class Config:
     WORKERS_COUNT = int(os.getenv("WORKERS_COUNT", "1"))
     RELOAD = os.getenv("RELOAD", "true").lower() == "true"
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    # Logs em JSON, um objeto por linha. Logs abaixo de WARNING são mantidos
+    # só em uma fração das requisições: LOG_AMOSTRAGEM_INFO para todas as rotas
+    # e LOG_AMOSTRAGEM_ROTAS por prefixo de rota (ex.: "/alunos=0.1,/token=0").
+    LOG_JSON: bool = os.getenv("LOG_JSON", "False") == "True"
+    LOG_AMOSTRAGEM_INFO: float = float(os.getenv("LOG_AMOSTRAGEM_INFO", 1))
+    LOG_AMOSTRAGEM_ROTAS = os.getenv("LOG_AMOSTRAGEM_ROTAS", "")
+    # Tracing no formato do OpenTelemetry, desativado por padrão. Os spans vão
+    # para TRACING_ARQUIVO (OTLP/JSON, um lote por linha) e/ou para o coletor
+    # OTLP/HTTP em TRACING_COLETOR. TRACING_AMOSTRAGEM é a fração dos traces
+    # iniciados aqui que são registrados; os recebidos seguem o `traceparent`.
+    TRACING_ATIVO: bool = os.getenv("TRACING_ATIVO", "False") == "True"
+    TRACING_NOME_SERVICO = os.getenv("TRACING_NOME_SERVICO", "pgcop-api")
+    TRACING_ARQUIVO = os.getenv("TRACING_ARQUIVO", "")
+    TRACING_COLETOR = os.getenv("TRACING_COLETOR", "")
+    TRACING_AMOSTRAGEM: float = float(os.getenv("TRACING_AMOSTRAGEM", 1))
+    TRACING_INTERVALO_SEGUNDOS: float = float(
+        os.getenv("TRACING_INTERVALO_SEGUNDOS", 5)
+    )
+    TRACING_TAMANHO_DO_LOTE: int = int(os.getenv("TRACING_TAMANHO_DO_LOTE", 512))
+    # Profiler por amostragem: rota /profiler, só para coordenadores, quando
+    # PROFILER_ATIVO; e/ou o sinal PROFILER_SINAL (ex.: "SIGUSR2"), que grava
+    # PROFILER_SEGUNDOS_SINAL segundos de pilhas em PROFILER_DIRETORIO.
+    PROFILER_ATIVO: bool = os.getenv("PROFILER_ATIVO", "False") == "True"
+    PROFILER_SEGUNDOS_MAXIMO: float = float(os.getenv("PROFILER_SEGUNDOS_MAXIMO", 60))
+    PROFILER_SINAL = os.getenv("PROFILER_SINAL", "")
+    PROFILER_SEGUNDOS_SINAL: float = float(os.getenv("PROFILER_SEGUNDOS_SINAL", 30))
+    PROFILER_DIRETORIO = os.getenv("PROFILER_DIRETORIO", "")
 
     APPLICATION_ROOT = os.getenv("APPLICATION_ROOT", "")
 
@@ -60,4 +127,30 @@ class Config:
 
     SEM_ORIENTADOR_ID: int = int(os.getenv("SEM_ORIENTADOR_ID", 1))
 
-    MINUTOS_DE_CACHE_REQUISICOES: int = int(os.getenv("MINUTOS_DE_CACHE_REQUISICOES", 1))
\ No newline at end of file
+    MINUTOS_DE_CACHE_REQUISICOES: int = int(os.getenv("MINUTOS_DE_CACHE_REQUISICOES", 1))
+    SEGUNDOS_DE_CACHE_DASHBOARD: int = int(os.getenv("SEGUNDOS_DE_CACHE_DASHBOARD", 30))
+    # Tarefas pendentes com prazo dentro deste intervalo são "próximas do prazo".
+    DIAS_PARA_PRAZO_PROXIMO: int = int(os.getenv("DIAS_PARA_PRAZO_PROXIMO", 30))
+
+    # Registros removidos logicamente há mais de DIAS_PARA_ARQUIVAR_REMOVIDOS dias
+    # são movidos periodicamente para as tabelas de arquivo.
+    ARQUIVAMENTO_ATIVO: bool = os.getenv("ARQUIVAMENTO_ATIVO", "False") == "True"
+    DIAS_PARA_ARQUIVAR_REMOVIDOS: int = int(
+        os.getenv("DIAS_PARA_ARQUIVAR_REMOVIDOS", 90)
+    )
+    ARQUIVAMENTO_TAMANHO_DO_LOTE: int = int(
+        os.getenv("ARQUIVAMENTO_TAMANHO_DO_LOTE", 500)
+    )
+    ARQUIVAMENTO_INTERVALO_HORAS: float = float(
+        os.getenv("ARQUIVAMENTO_INTERVALO_HORAS", 24)
+    )
+
+    BCRYPT_POOL_WORKERS: int = int(os.getenv("BCRYPT_POOL_WORKERS", 2))
+
+    READINESS_CACHE_SECONDS: float = float(os.getenv("READINESS_CACHE_SECONDS", 5))
+    READINESS_DB_TIMEOUT_SECONDS: float = float(
+        os.getenv("READINESS_DB_TIMEOUT_SECONDS", 2)
+    )
+    READINESS_MAX_POOL_SATURATION: float = float(
+        os.getenv("READINESS_MAX_POOL_SATURATION", 1)
+    )
\ No newline at end of file
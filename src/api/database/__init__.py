@@ -1,9 +1,13 @@
 from src.api.database.models import (  # noqa
     aluno,
+    arquivo,
     professor,
+    progresso_aluno,
     solicitacoes,
     tarefa,
     tarefas_base,
     tipo_usuario,
+    token_nova_senha,
+    token_revogado,
     usuario,
 )
@@ -0,0 +1,130 @@
+"""tabelas de arquivo
+
+Revision ID: 3b9e5f1a7c24
+Revises: 8d41b6e2c7a0
+Create Date: 2024-09-16 14:05:52.271930
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e5f1a7c24"
+down_revision: Union[str, None] = "8d41b6e2c7a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Mesmas colunas das tabelas de origem nesta revisão, sem chaves
+    # estrangeiras nem índices secundários (`src.api.database.models.arquivo`).
+    op.create_table(
+        "arquivo_usuarios",
+        sa.Column("nome", sa.String(length=255), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("senha_hash", sa.String(length=255), nullable=False),
+        sa.Column("token_nova_senha", sa.String(length=255), nullable=True),
+        sa.Column("tipo_usuario_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("arquivado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "arquivo_professores",
+        sa.Column("usuario_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("arquivado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "arquivo_alunos",
+        sa.Column("cpf", sa.String(length=14), nullable=False),
+        sa.Column("telefone", sa.String(length=23), nullable=False),
+        sa.Column("matricula", sa.String(length=20), nullable=False),
+        sa.Column("lattes", sa.String(length=255), nullable=True),
+        sa.Column("curso", sa.String(length=255), nullable=False),
+        sa.Column("data_ingresso", sa.Date(), nullable=False),
+        sa.Column("data_qualificacao", sa.Date(), nullable=True),
+        sa.Column("data_defesa", sa.Date(), nullable=True),
+        sa.Column("orientador_id", sa.Integer(), nullable=True),
+        sa.Column("usuario_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("arquivado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "arquivo_tarefas",
+        sa.Column("nome", sa.String(length=255), nullable=False),
+        sa.Column("descricao", sa.String(length=255), nullable=False),
+        sa.Column("data_ultima_notificacao", sa.DateTime(), nullable=False),
+        sa.Column("data_prazo", sa.Date(), nullable=False),
+        sa.Column("concluida", sa.Boolean(), nullable=False),
+        sa.Column("data_conclusao", sa.Date(), nullable=True),
+        sa.Column("data_proxima_notificacao", sa.DateTime(), nullable=True),
+        sa.Column("aluno_id", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("arquivado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "arquivo_solicitacoes",
+        sa.Column("aluno_id", sa.Integer(), nullable=False),
+        sa.Column("professor_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=255), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("arquivado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "arquivo_tarefas_base",
+        sa.Column("nome", sa.String(length=255), nullable=False),
+        sa.Column("descricao", sa.String(length=255), nullable=False),
+        sa.Column("prazo_em_meses", sa.Integer(), nullable=False),
+        sa.Column("curso", sa.String(length=255), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("arquivado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "arquivo_progresso_aluno",
+        sa.Column("aluno_id", sa.Integer(), nullable=False),
+        sa.Column("total_tarefas", sa.Integer(), nullable=False),
+        sa.Column("tarefas_concluidas", sa.Integer(), nullable=False),
+        sa.Column("proximo_prazo", sa.Date(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("arquivado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("arquivo_progresso_aluno")
+    op.drop_table("arquivo_tarefas_base")
+    op.drop_table("arquivo_solicitacoes")
+    op.drop_table("arquivo_tarefas")
+    op.drop_table("arquivo_alunos")
+    op.drop_table("arquivo_professores")
+    op.drop_table("arquivo_usuarios")
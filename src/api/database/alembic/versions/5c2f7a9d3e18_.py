@@ -0,0 +1,79 @@
+"""progresso_aluno
+
+Revision ID: 5c2f7a9d3e18
+Revises: 10e4f2e0b261
+Create Date: 2024-09-02 10:12:41.318207
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2f7a9d3e18"
+down_revision: Union[str, None] = "10e4f2e0b261"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "progresso_aluno",
+        sa.Column("aluno_id", sa.Integer(), nullable=False),
+        sa.Column("total_tarefas", sa.Integer(), nullable=False),
+        sa.Column("tarefas_concluidas", sa.Integer(), nullable=False),
+        sa.Column("proximo_prazo", sa.Date(), nullable=True),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["aluno_id"], ["alunos.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_progresso_aluno_aluno_id"),
+        "progresso_aluno",
+        ["aluno_id"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_progresso_aluno_id"), "progresso_aluno", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_progresso_aluno_proximo_prazo"),
+        "progresso_aluno",
+        ["proximo_prazo"],
+        unique=False,
+    )
+
+    # Preenche o resumo dos alunos existentes a partir das tarefas atuais.
+    op.execute(
+        """
+        INSERT INTO progresso_aluno (
+            aluno_id, total_tarefas, tarefas_concluidas, proximo_prazo,
+            created_at, updated_at
+        )
+        SELECT
+            alunos.id,
+            COUNT(tarefas.id),
+            COALESCE(SUM(CASE WHEN tarefas.concluida THEN 1 ELSE 0 END), 0),
+            MIN(CASE WHEN NOT tarefas.concluida THEN tarefas.data_prazo END),
+            CURRENT_TIMESTAMP,
+            CURRENT_TIMESTAMP
+        FROM alunos
+        LEFT JOIN tarefas
+            ON tarefas.aluno_id = alunos.id AND tarefas.deleted_at IS NULL
+        WHERE alunos.deleted_at IS NULL
+        GROUP BY alunos.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_progresso_aluno_proximo_prazo"), table_name="progresso_aluno"
+    )
+    op.drop_index(op.f("ix_progresso_aluno_id"), table_name="progresso_aluno")
+    op.drop_index(op.f("ix_progresso_aluno_aluno_id"), table_name="progresso_aluno")
+    op.drop_table("progresso_aluno")
@@ -0,0 +1,49 @@
+"""tokens_revogados
+
+Revision ID: 6e1a4c8b2d93
+Revises: 3b9e5f1a7c24
+Create Date: 2024-09-23 09:41:17.503126
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6e1a4c8b2d93"
+down_revision: Union[str, None] = "3b9e5f1a7c24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tokens_revogados",
+        sa.Column("jti", sa.String(length=64), nullable=False),
+        sa.Column("expira_em", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_tokens_revogados_jti"), "tokens_revogados", ["jti"], unique=True
+    )
+    op.create_index(
+        op.f("ix_tokens_revogados_expira_em"),
+        "tokens_revogados",
+        ["expira_em"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_tokens_revogados_id"), "tokens_revogados", ["id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_tokens_revogados_id"), table_name="tokens_revogados")
+    op.drop_index(op.f("ix_tokens_revogados_expira_em"), table_name="tokens_revogados")
+    op.drop_index(op.f("ix_tokens_revogados_jti"), table_name="tokens_revogados")
+    op.drop_table("tokens_revogados")
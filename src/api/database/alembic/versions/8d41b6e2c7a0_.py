@@ -0,0 +1,84 @@
+"""tarefas proxima notificacao
+
+Revision ID: 8d41b6e2c7a0
+Revises: 5c2f7a9d3e18
+Create Date: 2024-09-09 09:27:15.604183
+
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41b6e2c7a0"
+down_revision: Union[str, None] = "5c2f7a9d3e18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAREFA_PENDENTE = "concluida = false AND deleted_at IS NULL"
+
+# `DIAS_PARA_PRAZO_PROXIMO` quando esta revisão foi criada.
+DIAS_DA_JANELA = 30
+
+
+def _inicio_da_janela(dialeto: str) -> str:
+    """Meia-noite de `DIAS_DA_JANELA` dias antes do prazo, na sintaxe do banco."""
+    if dialeto == "mysql":
+        return f"TIMESTAMP(DATE_SUB(data_prazo, INTERVAL {DIAS_DA_JANELA} DAY))"
+    if dialeto == "sqlite":
+        return f"datetime(data_prazo, '-{DIAS_DA_JANELA} days')"
+    return f"CAST(data_prazo - INTERVAL '{DIAS_DA_JANELA} days' AS TIMESTAMP)"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tarefas", sa.Column("data_proxima_notificacao", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "ix_tarefas_pendentes_data_prazo",
+        "tarefas",
+        ["data_prazo"],
+        unique=False,
+        postgresql_where=sa.text(TAREFA_PENDENTE),
+        sqlite_where=sa.text(TAREFA_PENDENTE),
+    )
+    op.create_index(
+        "ix_tarefas_pendentes_data_proxima_notificacao",
+        "tarefas",
+        ["data_proxima_notificacao"],
+        unique=False,
+        postgresql_where=sa.text(TAREFA_PENDENTE),
+        sqlite_where=sa.text(TAREFA_PENDENTE),
+    )
+
+    # Agenda o primeiro aviso das tarefas pendentes existentes: a entrada na
+    # janela de prazo próximo, ou agora se a tarefa já está dentro dela.
+    agora = datetime.utcnow()
+    op.execute(
+        sa.text(
+            f"""
+            UPDATE tarefas
+            SET data_proxima_notificacao = CASE
+                WHEN data_prazo > :ultimo_dia_na_janela
+                    THEN {_inicio_da_janela(op.get_bind().dialect.name)}
+                ELSE :agora
+            END
+            WHERE {TAREFA_PENDENTE}
+            """
+        ).bindparams(
+            sa.bindparam("agora", agora, type_=sa.DateTime()),
+            sa.bindparam(
+                "ultimo_dia_na_janela",
+                (agora + timedelta(days=DIAS_DA_JANELA)).date(),
+                type_=sa.Date(),
+            ),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tarefas_pendentes_data_proxima_notificacao", table_name="tarefas")
+    op.drop_index("ix_tarefas_pendentes_data_prazo", table_name="tarefas")
+    op.drop_column("tarefas", "data_proxima_notificacao")
@@ -0,0 +1,58 @@
+"""tokens_nova_senha
+
+Revision ID: 9a7d3f2e6b15
+Revises: 6e1a4c8b2d93
+Create Date: 2024-09-30 16:22:05.914380
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a7d3f2e6b15"
+down_revision: Union[str, None] = "6e1a4c8b2d93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tokens_nova_senha",
+        sa.Column("usuario_id", sa.Integer(), nullable=False),
+        sa.Column("token_hash", sa.String(length=64), nullable=False),
+        sa.Column("expira_em", sa.DateTime(), nullable=False),
+        sa.Column("tentativas", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["usuario_id"], ["usuarios.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_tokens_nova_senha_usuario_id"),
+        "tokens_nova_senha",
+        ["usuario_id"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_tokens_nova_senha_id"), "tokens_nova_senha", ["id"], unique=False
+    )
+    # Os códigos pendentes em texto puro são descartados: basta solicitar outro.
+    op.drop_column("usuarios", "token_nova_senha")
+    op.drop_column("arquivo_usuarios", "token_nova_senha")
+
+
+def downgrade() -> None:
+    for tabela in ("usuarios", "arquivo_usuarios"):
+        op.add_column(
+            tabela,
+            sa.Column("token_nova_senha", sa.String(length=255), nullable=True),
+        )
+    op.drop_index(op.f("ix_tokens_nova_senha_id"), table_name="tokens_nova_senha")
+    op.drop_index(
+        op.f("ix_tokens_nova_senha_usuario_id"), table_name="tokens_nova_senha"
+    )
+    op.drop_table("tokens_nova_senha")
@@ -0,0 +1,29 @@
+"""usuarios.senha_alterada_em
+
+Revision ID: c7f2d9a4e1b8
+Revises: 9a7d3f2e6b15
+Create Date: 2024-10-07 11:08:36.402157
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7f2d9a4e1b8"
+down_revision: Union[str, None] = "9a7d3f2e6b15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for tabela in ("usuarios", "arquivo_usuarios"):
+        op.add_column(
+            tabela, sa.Column("senha_alterada_em", sa.DateTime(), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    for tabela in ("usuarios", "arquivo_usuarios"):
+        op.drop_column(tabela, "senha_alterada_em")
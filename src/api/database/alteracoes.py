@@ -0,0 +1,40 @@
+"""
+Rastreamento das tabelas alteradas em cada sessão.
+
+Os eventos registram as tabelas tocadas por flush de entidades e por
+`update`/`delete`/`insert` em massa; após o commit, `get_session` usa esse
+conjunto para invalidar os caches que dependem delas.
+"""
+
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+_CHAVE = "tabelas_alteradas"
+
+
+@event.listens_for(Session, "before_flush")
+def _registrar_flush(session: Session, flush_context, instances) -> None:
+    tabelas = session.info.setdefault(_CHAVE, set())
+    for entidade in chain(session.new, session.dirty, session.deleted):
+        tabelas.add(entidade.__table__.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _registrar_comando(estado: ORMExecuteState) -> None:
+    if (estado.is_update or estado.is_delete or estado.is_insert) and (
+        estado.bind_mapper is not None
+    ):
+        tabelas = estado.session.info.setdefault(_CHAVE, set())
+        tabelas.add(estado.bind_mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar(session: Session) -> None:
+    session.info.pop(_CHAVE, None)
+
+
+def tabelas_alteradas(session: Session) -> set[str]:
+    """Retorna e limpa as tabelas alteradas desde a última consulta."""
+    return session.info.pop(_CHAVE, set())
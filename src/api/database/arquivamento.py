@@ -0,0 +1,127 @@
+"""
+Arquivamento periódico dos registros removidos logicamente.
+
+Registros com `deleted_at` anterior a `DIAS_PARA_ARQUIVAR_REMOVIDOS` dias são
+movidos, em lotes de `ARQUIVAMENTO_TAMANHO_DO_LOTE`, para as tabelas de
+arquivo (`src.api.database.models.arquivo`), para que as tabelas quentes e
+seus índices cresçam apenas com os registros ativos. Cada lote é uma
+transação: copia as linhas para o arquivo e as remove da tabela de origem.
+
+As tabelas dependentes são processadas antes das referenciadas, e uma linha só
+é arquivada quando nenhuma outra linha da tabela quente ainda a referencia.
+
+Execução avulsa: `python -m src.api.database.arquivamento`.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from loguru import logger
+from sqlalchemy import DateTime, Table, exists, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.config import Config
+from src.api.database.models.arquivo import TABELAS_ARQUIVADAS, TABELAS_DE_ARQUIVO
+from src.api.database.models.entity_model_base import EntityModelBase
+from src.api.database.remocao_logica import INCLUIR_REMOVIDOS
+from src.api.database.session import get_sessionmaker
+from src.api.monitoring.readiness import registrar_execucao_worker
+
+
+def _ordem_de_arquivamento() -> list[Table]:
+    """Tabelas arquivadas, das dependentes para as referenciadas."""
+    return [
+        tabela
+        for tabela in reversed(EntityModelBase.metadata.sorted_tables)
+        if tabela in TABELAS_ARQUIVADAS
+    ]
+
+
+def _sem_referencias(tabela: Table) -> list:
+    """Condições que garantem que nenhuma linha quente referencia a tabela."""
+    condicoes = []
+    for dependente in TABELAS_ARQUIVADAS:
+        for fk in dependente.foreign_keys:
+            if fk.column.table is tabela:
+                condicoes.append(~exists().where(fk.parent == tabela.c[fk.column.name]))
+    return condicoes
+
+
+async def _arquivar_lote(
+    session: AsyncSession, tabela: Table, limite: datetime, tamanho_do_lote: int
+) -> int:
+    ids = (
+        (
+            await session.execute(
+                select(tabela.c.id)
+                .where(tabela.c.deleted_at < limite, *_sem_referencias(tabela))
+                .order_by(tabela.c.id)
+                .limit(tamanho_do_lote)
+                .execution_options(**{INCLUIR_REMOVIDOS: True})
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not ids:
+        return 0
+
+    arquivo = TABELAS_DE_ARQUIVO[tabela.name]
+    await session.execute(
+        arquivo.insert().from_select(
+            [*tabela.c.keys(), "arquivado_em"],
+            select(*tabela.c, literal(datetime.utcnow(), DateTime())).where(
+                tabela.c.id.in_(ids)
+            ),
+        )
+    )
+    await session.execute(tabela.delete().where(tabela.c.id.in_(ids)))
+    await session.commit()
+    return len(ids)
+
+
+async def arquivar_removidos(
+    dias: Optional[int] = None,
+    tamanho_do_lote: Optional[int] = None,
+    sessoes: Optional[Callable[[], AsyncSession]] = None,
+) -> dict[str, int]:
+    """
+    Move para o arquivo os registros removidos há mais de `dias` dias.
+    Retorna a quantidade de linhas arquivadas por tabela.
+    """
+    dias = Config.DIAS_PARA_ARQUIVAR_REMOVIDOS if dias is None else dias
+    tamanho_do_lote = tamanho_do_lote or Config.ARQUIVAMENTO_TAMANHO_DO_LOTE
+    limite = datetime.utcnow() - timedelta(days=dias)
+
+    arquivadas = {}
+    async with (sessoes or get_sessionmaker())() as session:
+        for tabela in _ordem_de_arquivamento():
+            total = 0
+            while True:
+                quantidade = await _arquivar_lote(
+                    session, tabela, limite, tamanho_do_lote
+                )
+                total += quantidade
+                if quantidade < tamanho_do_lote:
+                    break
+            arquivadas[tabela.name] = total
+            if total:
+                logger.info(f"{tabela.name} | {total} registros arquivados.")
+    return arquivadas
+
+
+async def iniciar_arquivamento_periodico(stop_function: Optional[Callable] = None):
+    """Executa o arquivamento a cada `ARQUIVAMENTO_INTERVALO_HORAS` horas."""
+    while stop_function is None or not stop_function():
+        try:
+            await arquivar_removidos()
+        except Exception as e:
+            logger.error(f"Falha no arquivamento de registros removidos: {e}")
+        else:
+            registrar_execucao_worker("arquivamento")
+        await asyncio.sleep(Config.ARQUIVAMENTO_INTERVALO_HORAS * 60 * 60)
+
+
+if __name__ == "__main__":
+    print(asyncio.run(arquivar_removidos()))
@@ -0,0 +1,66 @@
+"""
+Tabelas de arquivo dos registros removidos logicamente.
+
+Cada tabela `arquivo_<tabela>` tem as mesmas colunas da tabela de origem, sem
+chaves estrangeiras nem índices secundários, mais a data do arquivamento.
+Enums são guardados como texto para que o arquivo não dependa dos tipos da
+tabela quente.
+"""
+
+from sqlalchemy import Column, DateTime, Enum, String, Table
+from sqlalchemy.types import NullType, TypeEngine
+
+from src.api.database.models.aluno import Aluno
+from src.api.database.models.entity_model_base import EntityModelBase
+from src.api.database.models.professor import Professor
+from src.api.database.models.progresso_aluno import ProgressoAluno
+from src.api.database.models.solicitacoes import Solicitacao
+from src.api.database.models.tarefa import Tarefa
+from src.api.database.models.tarefas_base import TarefaBase
+from src.api.database.models.tipo_usuario import TipoUsuario  # noqa: F401
+from src.api.database.models.usuario import Usuario
+
+TABELAS_ARQUIVADAS: list[Table] = [
+    model.__table__
+    for model in (
+        Usuario,
+        Professor,
+        Aluno,
+        Tarefa,
+        Solicitacao,
+        TarefaBase,
+        ProgressoAluno,
+    )
+]
+
+
+def _tipo_no_arquivo(coluna: Column) -> TypeEngine:
+    if isinstance(coluna.type, Enum):
+        return String(255)
+    if isinstance(coluna.type, NullType) and coluna.foreign_keys:
+        # Chaves estrangeiras sem tipo explícito herdam o da coluna referenciada.
+        return next(iter(coluna.foreign_keys)).column.type
+    return coluna.type
+
+
+def _criar_tabela_de_arquivo(tabela: Table) -> Table:
+    return Table(
+        f"arquivo_{tabela.name}",
+        EntityModelBase.metadata,
+        *(
+            Column(
+                coluna.name,
+                _tipo_no_arquivo(coluna),
+                primary_key=coluna.primary_key,
+                autoincrement=False,
+                nullable=coluna.nullable,
+            )
+            for coluna in tabela.columns
+        ),
+        Column("arquivado_em", DateTime(), nullable=False),
+    )
+
+
+TABELAS_DE_ARQUIVO: dict[str, Table] = {
+    tabela.name: _criar_tabela_de_arquivo(tabela) for tabela in TABELAS_ARQUIVADAS
+}
@@ -0,0 +1,25 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.api.database.models.entity_model_base import EntityModelBase
+
+
+class ProgressoAluno(EntityModelBase):
+    """
+    Resumo das tarefas de cada aluno, mantido a cada alteração de tarefa para
+    que listagens e o worker de notificações leiam uma linha por aluno.
+    """
+
+    __tablename__ = "progresso_aluno"
+
+    aluno_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("alunos.id"), nullable=False, unique=True, index=True
+    )
+    total_tarefas: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    tarefas_concluidas: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    proximo_prazo: Mapped[Optional[date]] = mapped_column(
+        Date(), nullable=True, index=True
+    )
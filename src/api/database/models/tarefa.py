@@ -1,7 +1,16 @@
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, Boolean
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    false,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.api.database.models.entity_model_base import EntityModelBase
@@ -18,6 +27,11 @@ class Tarefa(EntityModelBase):
     data_prazo: Mapped[date] = mapped_column(Date(), nullable=False)
     concluida: Mapped[bool] = mapped_column(Boolean(), nullable=False, default=False)
     data_conclusao: Mapped[Optional[date]] = mapped_column(Date(), nullable=True)
+    # Próximo aviso por email devido para a tarefa; nulo quando não há aviso
+    # pendente (tarefa concluída, removida ou já notificada após o prazo).
+    data_proxima_notificacao: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(), nullable=True
+    )
 
     aluno_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("alunos.id"), nullable=False, unique=False, index=True
@@ -27,3 +41,22 @@ class Tarefa(EntityModelBase):
         back_populates="tarefas",
         lazy="joined",
     )
+
+
+# Índices parciais sobre as tarefas pendentes: a varredura de notificações e as
+# consultas por prazo percorrem apenas as tarefas em aberto. No MySQL, que não
+# tem índices parciais, são criados como índices comuns.
+_tarefa_pendente = (Tarefa.concluida == false()) & (Tarefa.deleted_at.is_(None))
+
+Index(
+    "ix_tarefas_pendentes_data_prazo",
+    Tarefa.data_prazo,
+    postgresql_where=_tarefa_pendente,
+    sqlite_where=_tarefa_pendente,
+)
+Index(
+    "ix_tarefas_pendentes_data_proxima_notificacao",
+    Tarefa.data_proxima_notificacao,
+    postgresql_where=_tarefa_pendente,
+    sqlite_where=_tarefa_pendente,
+)
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.api.database.models.entity_model_base import EntityModelBase
+
+
+class TokenNovaSenha(EntityModelBase):
+    """
+    Código de redefinição de senha pendente de cada usuário. Apenas o HMAC do
+    código é guardado; o código vale até `expira_em` e por no máximo
+    `NOVA_SENHA_MAX_TENTATIVAS` tentativas.
+    """
+
+    __tablename__ = "tokens_nova_senha"
+
+    usuario_id: Mapped[int] = mapped_column(
+        ForeignKey("usuarios.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    expira_em: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
+    tentativas: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
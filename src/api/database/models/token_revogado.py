@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.api.database.models.entity_model_base import EntityModelBase
+
+
+class TokenRevogado(EntityModelBase):
+    """
+    Tokens revogados antes do vencimento, identificados pelo `jti`. A linha só
+    precisa existir até `expira_em`: depois disso o token já é recusado.
+    """
+
+    __tablename__ = "tokens_revogados"
+
+    jti: Mapped[str] = mapped_column(
+        String(64), nullable=False, unique=True, index=True
+    )
+    expira_em: Mapped[datetime] = mapped_column(DateTime(), nullable=False, index=True)
@@ -1,4 +1,7 @@
-from sqlalchemy import ForeignKey, String
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.api.database.models.entity_model_base import EntityModelBase
@@ -14,7 +17,10 @@ class Usuario(EntityModelBase):
         String(255), nullable=False, unique=False, index=True
     )
     senha_hash: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    token_nova_senha: Mapped[str] = mapped_column(String(255), nullable=True)
+    # Refresh tokens emitidos antes da última troca de senha são recusados.
+    senha_alterada_em: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(), nullable=True
+    )
 
     tipo_usuario: Mapped["TipoUsuario"] = relationship(  # noqa: F821
         "TipoUsuario", lazy="joined"
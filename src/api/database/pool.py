@@ -0,0 +1,19 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.api.monitoring import metrics
+
+
+class AsyncAdaptedQueuePoolMedido(AsyncAdaptedQueuePool):
+    """
+    Pool assíncrono que registra o tempo de espera por uma conexão, seja
+    aguardando uma conexão livre ou abrindo uma nova.
+    """
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.DB_POOL_WAIT.observe(time.perf_counter() - inicio)
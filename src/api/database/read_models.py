@@ -0,0 +1,109 @@
+"""
+Modelos de leitura das listagens.
+
+Cada modelo corresponde exatamente às colunas que o schema de resposta usa,
+consultadas em um único join plano. São tuplas imutáveis: não passam pelo
+identity map da sessão nem carregam os relacionamentos das entidades.
+"""
+
+from datetime import date
+from typing import NamedTuple, Optional
+
+from src.api.utils.enums import CursoAlunoEnum, StatusSolicitacaoEnum, TipoUsuarioEnum
+
+
+class ProgressoLeitura(NamedTuple):
+    """Colunas de `ProgressoAlunoInDB`, lidas de `progresso_aluno`."""
+
+    aluno_id: int
+    total_tarefas: int
+    tarefas_concluidas: int
+    proximo_prazo: Optional[date]
+
+    def como_dict(self) -> dict:
+        progresso = self._asdict()
+        progresso["percentual_concluido"] = (
+            round(100 * self.tarefas_concluidas / self.total_tarefas, 1)
+            if self.total_tarefas
+            else 0.0
+        )
+        return progresso
+
+
+class TarefaLeitura(NamedTuple):
+    """Colunas de `TarefaInDB`."""
+
+    nome: str
+    descricao: str
+    data_prazo: date
+    aluno_id: int
+    concluida: bool
+    data_conclusao: Optional[date]
+    id: int
+
+    def como_dict(self) -> dict:
+        return self._asdict()
+
+
+class SolicitacaoLeitura(NamedTuple):
+    """Colunas de `SolicitacaoInDB`."""
+
+    aluno_id: int
+    professor_id: int
+    status: StatusSolicitacaoEnum
+    id: int
+    nome_aluno: str
+    nome_professor: str
+
+    def como_dict(self) -> dict:
+        return self._asdict()
+
+
+class AlunoLeitura(NamedTuple):
+    """Colunas de `AlunoInDB`, com os dados do orientador achatados."""
+
+    nome: str
+    email: str
+    tipo_usuario: TipoUsuarioEnum
+    cpf: str
+    telefone: str
+    matricula: str
+    lattes: Optional[str]
+    curso: CursoAlunoEnum
+    data_ingresso: date
+    data_qualificacao: Optional[date]
+    data_defesa: Optional[date]
+    id: int
+    usuario_id: int
+    orientador_id: Optional[int]
+    orientador_nome: Optional[str]
+    orientador_email: Optional[str]
+    orientador_tipo_usuario: Optional[TipoUsuarioEnum]
+    total_tarefas: Optional[int]
+    tarefas_concluidas: Optional[int]
+    proximo_prazo: Optional[date]
+
+    def como_dict(self) -> dict:
+        """
+        Dicionário no formato de `AlunoInDB`, com o orientador e o progresso
+        aninhados.
+        """
+        aluno = self._asdict()
+        progresso = ProgressoLeitura(
+            aluno_id=self.id,
+            total_tarefas=aluno.pop("total_tarefas"),
+            tarefas_concluidas=aluno.pop("tarefas_concluidas"),
+            proximo_prazo=aluno.pop("proximo_prazo"),
+        )
+        aluno["progresso"] = (
+            progresso.como_dict() if progresso.total_tarefas is not None else None
+        )
+        orientador_id = aluno.pop("orientador_id")
+        orientador = {
+            "nome": aluno.pop("orientador_nome"),
+            "email": aluno.pop("orientador_email"),
+            "tipo_usuario": aluno.pop("orientador_tipo_usuario"),
+            "id": orientador_id,
+        }
+        aluno["orientador"] = orientador if orientador_id is not None else None
+        return aluno
@@ -0,0 +1,34 @@
+"""
+Filtro global de remoção lógica.
+
+Toda consulta ORM exclui automaticamente as entidades com `deleted_at`
+preenchido, inclusive as unidas por joins (também com `aliased`) e os
+relacionamentos carregados pela consulta. Para consultar também as removidas
+use a opção de execução `incluir_removidos`:
+
+    select(Aluno).execution_options(incluir_removidos=True)
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from src.api.database.models.entity_model_base import EntityModelBase
+
+INCLUIR_REMOVIDOS = "incluir_removidos"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _filtrar_removidos(estado: ORMExecuteState) -> None:
+    if (
+        estado.is_select
+        and not estado.is_column_load
+        and not estado.is_relationship_load
+        and not estado.execution_options.get(INCLUIR_REMOVIDOS, False)
+    ):
+        estado.statement = estado.statement.options(
+            with_loader_criteria(
+                EntityModelBase,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
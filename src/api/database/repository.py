@@ -1,16 +1,41 @@
-from typing import Optional
+from datetime import date, datetime
+from typing import Iterable, Optional
 
 from loguru import logger
-from sqlalchemy import and_, or_, select, update
+from sqlalchemy import (
+    Row,
+    and_,
+    case,
+    delete,
+    false,
+    func,
+    insert,
+    or_,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.api.database.models.aluno import Aluno
 from src.api.database.models.entity_model_base import EntityModelBase
 from src.api.database.models.professor import Professor
+from src.api.database.models.progresso_aluno import ProgressoAluno
 from src.api.database.models.solicitacoes import Solicitacao
 from src.api.database.models.tarefa import Tarefa
 from src.api.database.models.tipo_usuario import TipoUsuario
+from src.api.database.models.token_nova_senha import TokenNovaSenha
+from src.api.database.models.token_revogado import TokenRevogado
 from src.api.database.models.usuario import Usuario
+from src.api.database.read_models import (
+    AlunoLeitura,
+    ProgressoLeitura,
+    SolicitacaoLeitura,
+    TarefaLeitura,
+)
 from src.api.utils.enums import StatusSolicitacaoEnum, TipoUsuarioEnum
 
 
@@ -21,14 +46,12 @@ class PGCopRepository:
     async def buscar_por_id(
         self, id: int, model: EntityModelBase
     ) -> Optional[EntityModelBase]:
-        query = select(model).where(
-            and_(model.id == id, model.deleted_at == None)  # noqa: E711
-        )
+        query = select(model).where(model.id == id)
         result = await self._session.execute(query)
         return result.scalar()
 
     async def buscar_todos(self, model: EntityModelBase) -> list[EntityModelBase]:
-        query = select(model).where(model.deleted_at == None)  # noqa: E711
+        query = select(model)
         result = await self._session.execute(query)
         return result.scalars().unique().all()
 
@@ -48,33 +71,138 @@ class PGCopRepository:
         if model:
             await self._session.refresh(model)
 
-    async def atualizar_por_id(self, id: int, model: EntityModelBase, **kwargs) -> None:
-        query = update(model).where(model.id == id).values(**kwargs)
-        await self._session.execute(query)
+    async def liberar_conexao(self) -> None:
+        """Confirma a transação atual, devolvendo a conexão ao pool."""
+        await self._session.commit()
+
+    def _dialeto(self) -> Dialect:
+        return self._session.get_bind().dialect
+
+    async def atualizar_por_id(
+        self, id: int, model: EntityModelBase, **kwargs
+    ) -> Optional[Row]:
+        """
+        Atualiza a linha ativa com um único `UPDATE ... RETURNING`, retornando
+        as colunas já atualizadas, ou `None` quando a linha não existe. Nos
+        bancos sem RETURNING no UPDATE (MySQL), a linha é relida pelo id.
+        """
+        query = (
+            update(model)
+            .where(model.id == id, model.deleted_at == None)  # noqa: E711
+            .values(**kwargs)
+        )
+        if self._dialeto().update_returning:
+            query = query.returning(*model.__table__.columns)
+            linha = (await self._session.execute(query)).first()
+        elif (await self._session.execute(query)).rowcount:
+            query = select(*model.__table__.columns).where(model.id == id)
+            linha = (await self._session.execute(query)).first()
+        else:
+            linha = None
+        if linha is not None:
+            logger.info(f"{model.__name__} {id=} atualizado com sucesso.")
+        return linha
+
+    async def buscar_ids_existentes(
+        self, model: EntityModelBase, ids: Iterable[int]
+    ) -> set[int]:
+        ids = list(ids)
+        if not ids:
+            return set()
+        query = select(model.id).where(model.id.in_(ids))
+        result = await self._session.execute(query)
+        return set(result.scalars())
+
+    async def criar_em_lote(
+        self, model: EntityModelBase, valores: list[dict]
+    ) -> list[int]:
+        """
+        Insere as linhas com um único INSERT de várias linhas e retorna os ids
+        gerados, na ordem de `valores`. Nos bancos que não retornam os ids de
+        um INSERT em lote na ordem dos parâmetros (MySQL), as linhas são
+        inseridas uma a uma pelo flush.
+        """
+        if self._dialeto().insert_executemany_returning_sort_by_parameter_order:
+            query = insert(model).returning(model.id, sort_by_parameter_order=True)
+            result = await self._session.execute(query, valores)
+            return list(result.scalars())
+        entidades = [model(**linha) for linha in valores]
+        self._session.add_all(entidades)
         await self._session.flush()
-        logger.info(f"{model.__name__} {id=} atualizado com sucesso.")
+        return [entidade.id for entidade in entidades]
 
-    async def buscar_usuario_por_email(self, email: str) -> Optional[Usuario]:
-        query = select(Usuario).where(
-            and_(
-                Usuario.email == email,
-                Usuario.deleted_at == None,  # noqa: E711
-            )
+    async def atualizar_em_lote(
+        self, model: EntityModelBase, ids: list[int], **kwargs
+    ) -> None:
+        """Aplica os mesmos valores a todas as linhas de `ids` com um UPDATE."""
+        query = update(model).where(model.id.in_(ids)).values(**kwargs)
+        await self._session.execute(query)
+
+    async def buscar_usuario_id(
+        self, model: EntityModelBase, id: int
+    ) -> Optional[int]:
+        """
+        `usuario_id` de um aluno ou professor ativo, sem carregar a entidade e
+        seus relacionamentos.
+        """
+        query = select(model.usuario_id).where(model.id == id)
+        result = await self._session.execute(query)
+        return result.scalar()
+
+    async def remover_logicamente(
+        self, model: EntityModelBase, *condicoes, removido_em: datetime
+    ) -> int:
+        """
+        Preenche `deleted_at` das linhas ativas de `model` que atendem às
+        condições com um único UPDATE. Retorna a quantidade de linhas afetadas.
+        """
+        query = (
+            update(model)
+            .where(*condicoes, model.deleted_at == None)  # noqa: E711
+            .values(deleted_at=removido_em)
         )
         result = await self._session.execute(query)
+        return result.rowcount
+
+    async def remover_aluno_em_cascata(self, aluno_id: int, usuario_id: int) -> None:
+        """
+        Remove logicamente o aluno, seu usuário, suas tarefas e seu resumo de
+        progresso: um UPDATE por tabela, independente da quantidade de tarefas.
+        """
+        removido_em = datetime.utcnow()
+        for model, condicao in (
+            (Tarefa, Tarefa.aluno_id == aluno_id),
+            (ProgressoAluno, ProgressoAluno.aluno_id == aluno_id),
+            (Aluno, Aluno.id == aluno_id),
+            (Usuario, Usuario.id == usuario_id),
+        ):
+            await self.remover_logicamente(model, condicao, removido_em=removido_em)
+
+    async def remover_professor_em_cascata(
+        self, professor_id: int, usuario_id: int
+    ) -> None:
+        """
+        Remove logicamente o professor, seu usuário e suas solicitações: um
+        UPDATE por tabela, independente da quantidade de solicitações.
+        """
+        removido_em = datetime.utcnow()
+        for model, condicao in (
+            (Solicitacao, Solicitacao.professor_id == professor_id),
+            (Professor, Professor.id == professor_id),
+            (Usuario, Usuario.id == usuario_id),
+        ):
+            await self.remover_logicamente(model, condicao, removido_em=removido_em)
+
+    async def buscar_usuario_por_email(self, email: str) -> Optional[Usuario]:
+        query = select(Usuario).where(Usuario.email == email)
+        result = await self._session.execute(query)
         return result.scalar()
 
     async def buscar_aluno_por_email(self, email: str) -> Optional[Aluno]:
         query = (
             select(Aluno)
             .join(Usuario, Usuario.id == Aluno.usuario_id)
-            .where(
-                and_(
-                    Usuario.email == email,
-                    Aluno.deleted_at == None,  # noqa: E711
-                    Usuario.deleted_at == None,  # noqa: E711
-                )
-            )
+            .where(Usuario.email == email)
         )
         result = await self._session.execute(query)
         return result.scalar()
@@ -91,8 +219,6 @@ class PGCopRepository:
                         TipoUsuario.titulo == TipoUsuarioEnum.PROFESSOR,
                         TipoUsuario.titulo == TipoUsuarioEnum.COORDENADOR,
                     ),
-                    Usuario.deleted_at == None,  # noqa: E711
-                    Professor.deleted_at == None,  # noqa: E711
                 ),
             )
         )
@@ -103,42 +229,26 @@ class PGCopRepository:
         return await self.buscar_por_id(id, Usuario)
 
     async def buscar_tipo_usuario_por_titulo(self, titulo: TipoUsuarioEnum) -> int:
-        query = select(TipoUsuario).where(
-            TipoUsuario.titulo == titulo,
-            TipoUsuario.deleted_at == None,  # noqa: E711
-        )
+        query = select(TipoUsuario).where(TipoUsuario.titulo == titulo)
         result = await self._session.execute(query)
         return result.scalar()
 
     async def buscar_todos_orientandos_de_um_professor(
         self, orientador_id: int
-    ) -> Aluno:
+    ) -> list[Aluno]:
+        usuario_orientador = aliased(Usuario)
         query = (
             select(Aluno)
             .join(Professor, Aluno.orientador_id == Professor.id)
-            .join(
-                Usuario,
-                or_(Usuario.id == Aluno.usuario_id, Usuario.id == Professor.usuario_id),
-            )
-            .where(
-                and_(
-                    Professor.id == orientador_id,
-                    Aluno.deleted_at == None,  # noqa: E711
-                    Professor.deleted_at == None,  # noqa: E711
-                    Usuario.deleted_at == None,  # noqa: E711
-                )
-            )
+            .join(Usuario, Usuario.id == Aluno.usuario_id)
+            .join(usuario_orientador, usuario_orientador.id == Professor.usuario_id)
+            .where(Professor.id == orientador_id)
         )
         result = await self._session.execute(query)
         return result.scalars().unique().all()
 
     async def buscar_aluno_por_cpf(self, cpf: str) -> Optional[Aluno]:
-        query = select(Aluno).where(
-            and_(
-                Aluno.cpf == cpf,
-                Aluno.deleted_at == None,  # noqa: E711
-            )
-        )
+        query = select(Aluno).where(Aluno.cpf == cpf)
         result = await self._session.execute(query)
         return result.scalar()
 
@@ -153,9 +263,6 @@ class PGCopRepository:
                 and_(
                     Professor.id == professor_id,
                     Solicitacao.status == status,
-                    Solicitacao.deleted_at == None,  # noqa: E711
-                    Professor.deleted_at == None,  # noqa: E711
-                    Usuario.deleted_at == None,  # noqa: E711
                 )
             )
         )
@@ -169,19 +276,13 @@ class PGCopRepository:
             and_(
                 Usuario.email == email,
                 Usuario.id != usuario_id,
-                Usuario.deleted_at == None,  # noqa: E711
             )
         )
         result = await self._session.execute(query)
         return result.scalar()
 
     async def buscar_aluno_por_telefone(self, telefone: str) -> Optional[Aluno]:
-        query = select(Aluno).where(
-            and_(
-                Aluno.telefone == telefone,
-                Aluno.deleted_at == None,  # noqa: E711
-            )
-        )
+        query = select(Aluno).where(Aluno.telefone == telefone)
         result = await self._session.execute(query)
         return result.scalar()
 
@@ -192,21 +293,355 @@ class PGCopRepository:
             and_(
                 Aluno.telefone == telefone,
                 Aluno.id != id,
-                Aluno.deleted_at == None,  # noqa: E711
             )
         )
         result = await self._session.execute(query)
         return result.scalar()
 
     async def buscar_aluno_por_matricula(self, matricula: str) -> Optional[Aluno]:
-        query = select(Aluno).where(
-            and_(
-                Aluno.matricula == matricula,
-                Aluno.deleted_at == None,  # noqa: E711
-            )
-        )
+        query = select(Aluno).where(Aluno.matricula == matricula)
         result = await self._session.execute(query)
         return result.scalar()
 
     async def buscar_tarefas_por_aluno_id(self, aluno_id: int) -> list[Tarefa]:
-        return await self.filtrar(Tarefa, aluno_id=aluno_id, deleted_at=None)
+        return await self.filtrar(Tarefa, aluno_id=aluno_id)
+
+    async def buscar_leitura_tarefas_por_aluno(
+        self, aluno_id: int
+    ) -> list[TarefaLeitura]:
+        return await self._buscar_leitura_tarefas(Tarefa.aluno_id == aluno_id)
+
+    async def buscar_leitura_tarefas_por_ids(
+        self, ids: list[int]
+    ) -> list[TarefaLeitura]:
+        return await self._buscar_leitura_tarefas(Tarefa.id.in_(ids))
+
+    async def _buscar_leitura_tarefas(self, *condicoes) -> list[TarefaLeitura]:
+        query = select(
+            Tarefa.nome,
+            Tarefa.descricao,
+            Tarefa.data_prazo,
+            Tarefa.aluno_id,
+            Tarefa.concluida,
+            Tarefa.data_conclusao,
+            Tarefa.id,
+        ).where(*condicoes)
+        result = await self._session.execute(query)
+        return [TarefaLeitura._make(linha) for linha in result]
+
+    async def buscar_estado_de_tarefas(self, ids: list[int]) -> dict[int, Row]:
+        """Linhas (id, aluno_id, data_prazo, concluida) das tarefas, por id."""
+        if not ids:
+            return {}
+        query = select(
+            Tarefa.id, Tarefa.aluno_id, Tarefa.data_prazo, Tarefa.concluida
+        ).where(Tarefa.id.in_(ids))
+        result = await self._session.execute(query)
+        return {linha.id: linha for linha in result}
+
+    async def buscar_leitura_solicitacoes_de_professor(
+        self, professor_id: int, status: StatusSolicitacaoEnum
+    ) -> list[SolicitacaoLeitura]:
+        usuario_aluno = aliased(Usuario)
+        usuario_professor = aliased(Usuario)
+        query = (
+            select(
+                Solicitacao.aluno_id,
+                Solicitacao.professor_id,
+                Solicitacao.status,
+                Solicitacao.id,
+                usuario_aluno.nome,
+                usuario_professor.nome,
+            )
+            .join(Aluno, Aluno.id == Solicitacao.aluno_id)
+            .join(usuario_aluno, usuario_aluno.id == Aluno.usuario_id)
+            .join(Professor, Professor.id == Solicitacao.professor_id)
+            .join(usuario_professor, usuario_professor.id == Professor.usuario_id)
+            .where(
+                and_(
+                    Solicitacao.professor_id == professor_id,
+                    Solicitacao.status == status,
+                )
+            )
+        )
+        result = await self._session.execute(query)
+        return [SolicitacaoLeitura._make(linha) for linha in result]
+
+    async def buscar_leitura_orientandos_de_um_professor(
+        self, orientador_id: int
+    ) -> list[AlunoLeitura]:
+        """
+        Orientandos do professor com as colunas de `AlunoInDB`. Aluno e
+        orientador usam aliases distintos de `Usuario`, então cada aluno gera
+        exatamente uma linha.
+        """
+        usuario_aluno = aliased(Usuario)
+        tipo_aluno = aliased(TipoUsuario)
+        usuario_orientador = aliased(Usuario)
+        tipo_orientador = aliased(TipoUsuario)
+        query = (
+            select(
+                usuario_aluno.nome,
+                usuario_aluno.email,
+                tipo_aluno.titulo,
+                Aluno.cpf,
+                Aluno.telefone,
+                Aluno.matricula,
+                Aluno.lattes,
+                Aluno.curso,
+                Aluno.data_ingresso,
+                Aluno.data_qualificacao,
+                Aluno.data_defesa,
+                Aluno.id,
+                Aluno.usuario_id,
+                Professor.id,
+                usuario_orientador.nome,
+                usuario_orientador.email,
+                tipo_orientador.titulo,
+                ProgressoAluno.total_tarefas,
+                ProgressoAluno.tarefas_concluidas,
+                ProgressoAluno.proximo_prazo,
+            )
+            .join(usuario_aluno, usuario_aluno.id == Aluno.usuario_id)
+            .join(tipo_aluno, tipo_aluno.id == usuario_aluno.tipo_usuario_id)
+            .join(Professor, Professor.id == Aluno.orientador_id)
+            .join(usuario_orientador, usuario_orientador.id == Professor.usuario_id)
+            .join(
+                tipo_orientador,
+                tipo_orientador.id == usuario_orientador.tipo_usuario_id,
+            )
+            .outerjoin(ProgressoAluno, ProgressoAluno.aluno_id == Aluno.id)
+            .where(Aluno.orientador_id == orientador_id)
+        )
+        result = await self._session.execute(query)
+        return [AlunoLeitura._make(linha) for linha in result]
+
+    async def contar_alunos_por_orientador_e_curso(self) -> list[Row]:
+        """Linhas (orientador_id, curso, alunos)."""
+        query = (
+            select(Aluno.orientador_id, Aluno.curso, func.count(Aluno.id))
+            .group_by(Aluno.orientador_id, Aluno.curso)
+        )
+        result = await self._session.execute(query)
+        return result.all()
+
+    async def contar_tarefas_pendentes_por_orientador_e_curso(
+        self, hoje: date, limite_prazo_proximo: date
+    ) -> list[Row]:
+        """
+        Linhas (orientador_id, curso, atrasadas, proximas_do_prazo) das tarefas
+        não concluídas, em uma única passada agregada sobre `tarefas`.
+        """
+        query = (
+            select(
+                Aluno.orientador_id,
+                Aluno.curso,
+                func.sum(case((Tarefa.data_prazo < hoje, 1), else_=0)),
+                func.sum(
+                    case(
+                        (Tarefa.data_prazo.between(hoje, limite_prazo_proximo), 1),
+                        else_=0,
+                    )
+                ),
+            )
+            .join(Aluno, Aluno.id == Tarefa.aluno_id)
+            .where(Tarefa.concluida == False)  # noqa: E712
+            .group_by(Aluno.orientador_id, Aluno.curso)
+        )
+        result = await self._session.execute(query)
+        return result.all()
+
+    async def contar_solicitacoes_pendentes_por_professor_e_curso(self) -> list[Row]:
+        """Linhas (professor_id, curso, solicitacoes_pendentes)."""
+        query = (
+            select(Solicitacao.professor_id, Aluno.curso, func.count(Solicitacao.id))
+            .join(Aluno, Aluno.id == Solicitacao.aluno_id)
+            .where(Solicitacao.status == StatusSolicitacaoEnum.PENDENTE)
+            .group_by(Solicitacao.professor_id, Aluno.curso)
+        )
+        result = await self._session.execute(query)
+        return result.all()
+
+    async def buscar_nomes_de_professores(self) -> list[Row]:
+        """Linhas (professor_id, nome) dos professores ativos."""
+        query = (
+            select(Professor.id, Usuario.nome)
+            .join(Usuario, Usuario.id == Professor.usuario_id)
+        )
+        result = await self._session.execute(query)
+        return result.all()
+
+    async def buscar_tarefas_com_notificacao_devida(
+        self, agora: datetime, limite: int, ignorar: Iterable[int] = ()
+    ) -> list[Row]:
+        """
+        Tarefas pendentes cujo próximo aviso já venceu, exceto as de `ignorar`.
+        A consulta é uma faixa sobre o índice parcial de
+        `data_proxima_notificacao`, então o custo acompanha a quantidade de
+        avisos devidos, não o total de tarefas.
+        """
+        ignorar = list(ignorar)
+        query = (
+            select(
+                Tarefa.id.label("tarefa_id"),
+                Tarefa.nome.label("titulo"),
+                Tarefa.descricao,
+                Tarefa.data_prazo,
+                Usuario.nome,
+                Usuario.email,
+            )
+            .join(Aluno, Aluno.id == Tarefa.aluno_id)
+            .join(Usuario, Usuario.id == Aluno.usuario_id)
+            .where(
+                Tarefa.data_proxima_notificacao <= agora,
+                Tarefa.concluida == False,  # noqa: E712
+            )
+            .order_by(Tarefa.data_proxima_notificacao)
+            .limit(limite)
+        )
+        if ignorar:
+            query = query.where(Tarefa.id.not_in(ignorar))
+        result = await self._session.execute(query)
+        return result.all()
+
+    async def registrar_notificacao_tarefa(
+        self,
+        tarefa_id: int,
+        enviada_em: datetime,
+        proxima_notificacao: Optional[datetime],
+    ) -> None:
+        await self._session.execute(
+            update(Tarefa)
+            .where(Tarefa.id == tarefa_id)
+            .values(
+                data_ultima_notificacao=enviada_em,
+                data_proxima_notificacao=proxima_notificacao,
+            )
+        )
+
+    async def buscar_progresso_aluno(self, aluno_id: int) -> Optional[ProgressoLeitura]:
+        query = select(
+            ProgressoAluno.aluno_id,
+            ProgressoAluno.total_tarefas,
+            ProgressoAluno.tarefas_concluidas,
+            ProgressoAluno.proximo_prazo,
+        ).where(ProgressoAluno.aluno_id == aluno_id)
+        linha = (await self._session.execute(query)).first()
+        return ProgressoLeitura._make(linha) if linha else None
+
+    async def atualizar_progresso_aluno(self, aluno_id: int) -> None:
+        """
+        Atualiza a linha de `progresso_aluno` do aluno após uma alteração nas
+        suas tarefas. A linha é bloqueada antes da agregação, então alterações
+        simultâneas nas tarefas do mesmo aluno recalculam o resumo uma de cada
+        vez, cada uma vendo as tarefas já confirmadas pela anterior. A agregação
+        percorre apenas as tarefas desse aluno (pelo índice de `aluno_id`):
+        contadores poderiam ser ajustados por delta, mas o próximo prazo
+        precisa ser recalculado quando a tarefa mais próxima é concluída ou
+        removida.
+        """
+        progresso = await self._bloquear_progresso_aluno(aluno_id)
+
+        query = select(
+            func.count(Tarefa.id),
+            func.coalesce(func.sum(case((Tarefa.concluida == true(), 1), else_=0)), 0),
+            func.min(case((Tarefa.concluida == false(), Tarefa.data_prazo))),
+        ).where(Tarefa.aluno_id == aluno_id)
+        total, concluidas, proximo_prazo = (await self._session.execute(query)).one()
+
+        progresso.total_tarefas = total
+        progresso.tarefas_concluidas = concluidas
+        progresso.proximo_prazo = proximo_prazo
+        await self._session.flush()
+
+    async def _bloquear_progresso_aluno(self, aluno_id: int) -> ProgressoAluno:
+        query = (
+            select(ProgressoAluno)
+            .where(ProgressoAluno.aluno_id == aluno_id)
+            .with_for_update()
+        )
+        progresso = (await self._session.execute(query)).scalar()
+        if progresso is not None:
+            return progresso
+        # A linha é criada junto com o aluno; alunos inseridos por outros
+        # caminhos a ganham aqui, e o índice único decide entre duas criações
+        # simultâneas.
+        progresso = ProgressoAluno(
+            aluno_id=aluno_id, total_tarefas=0, tarefas_concluidas=0
+        )
+        try:
+            async with self._session.begin_nested():
+                self._session.add(progresso)
+        except IntegrityError:
+            progresso = (await self._session.execute(query)).scalar_one()
+        return progresso
+
+    async def revogar_token(self, jti: str, expira_em: datetime) -> bool:
+        """
+        Registra a revogação do token; retorna `False` se ele já estava
+        revogado. O índice único de `jti` faz da consulta e da revogação uma
+        única operação, sem corrida entre duas renovações simultâneas.
+        """
+        try:
+            async with self._session.begin_nested():
+                self._session.add(TokenRevogado(jti=jti, expira_em=expira_em))
+        except IntegrityError:
+            return False
+        return True
+
+    async def salvar_token_nova_senha(
+        self, usuario_id: int, token_hash: str, expira_em: datetime
+    ) -> None:
+        """Substitui o código de redefinição pendente do usuário."""
+        await self._session.execute(
+            delete(TokenNovaSenha).where(TokenNovaSenha.usuario_id == usuario_id)
+        )
+        self._session.add(
+            TokenNovaSenha(
+                usuario_id=usuario_id,
+                token_hash=token_hash,
+                expira_em=expira_em,
+                tentativas=0,
+            )
+        )
+        await self._session.flush()
+
+    async def consumir_tentativa_nova_senha(
+        self, email: str, max_tentativas: int
+    ) -> Optional[Row]:
+        """
+        Conta uma tentativa no código pendente do usuário do `email` e retorna
+        `(usuario_id, token_hash, expira_em)`, ou `None` se não há código ou as
+        tentativas se esgotaram. É um único `UPDATE ... RETURNING` pelos índices
+        de email e de `usuario_id`; nos bancos sem RETURNING no UPDATE (MySQL),
+        o código é relido na mesma transação, que mantém a linha bloqueada.
+        """
+        usuario_id = (
+            select(Usuario.id)
+            .where(Usuario.email == email, Usuario.deleted_at == None)  # noqa: E711
+            .scalar_subquery()
+        )
+        query = (
+            update(TokenNovaSenha)
+            .where(
+                TokenNovaSenha.usuario_id == usuario_id,
+                TokenNovaSenha.tentativas < max_tentativas,
+            )
+            .values(tentativas=TokenNovaSenha.tentativas + 1)
+        )
+        colunas = (
+            TokenNovaSenha.usuario_id,
+            TokenNovaSenha.token_hash,
+            TokenNovaSenha.expira_em,
+        )
+        if self._dialeto().update_returning:
+            return (await self._session.execute(query.returning(*colunas))).first()
+        if not (await self._session.execute(query)).rowcount:
+            return None
+        query = select(*colunas).where(TokenNovaSenha.usuario_id == usuario_id)
+        return (await self._session.execute(query)).first()
+
+    async def remover_token_nova_senha(self, usuario_id: int) -> None:
+        await self._session.execute(
+            delete(TokenNovaSenha).where(TokenNovaSenha.usuario_id == usuario_id)
+        )
@@ -0,0 +1,108 @@
+"""
+Lista de revogação de tokens, por `jti`.
+
+A tabela `tokens_revogados` é a fonte da verdade. Cada worker mantém em
+memória os `jti` revogados ainda não vencidos, para que a verificação do
+access token em cada requisição seja uma consulta O(1) sem ida ao banco; a
+lista é sincronizada periodicamente com a tabela, então revogações feitas em
+outro worker valem aqui em até `REVOGACAO_INTERVALO_SEGUNDOS`. A renovação com
+refresh token não depende da lista: consulta o índice único de `jti`.
+"""
+
+import asyncio
+import heapq
+from datetime import datetime
+from typing import Callable, Optional
+
+from loguru import logger
+from sqlalchemy import delete, select
+
+from src.api.config import Config
+from src.api.database.models.token_revogado import TokenRevogado
+from src.api.database.session import get_sessionmaker
+from src.api.monitoring.readiness import registrar_execucao_worker
+
+# Ids alocados por transações ainda abertas na sincronização anterior podem
+# ser confirmados depois de ids maiores; a releitura cobre essa janela.
+SOBREPOSICAO_DE_IDS = 100
+
+
+class ListaDeRevogacao:
+    """Conjunto limitado de `jti` revogados, com o vencimento de cada token."""
+
+    def __init__(self, tamanho_maximo: int):
+        self.tamanho_maximo = tamanho_maximo
+        self.ultimo_id = 0
+        self._expiracoes: dict[str, datetime] = {}
+
+    def __contains__(self, jti: Optional[str]) -> bool:
+        return jti is not None and jti in self._expiracoes
+
+    def __len__(self) -> int:
+        return len(self._expiracoes)
+
+    def adicionar(self, jti: str, expira_em: datetime) -> None:
+        self._expiracoes[jti] = expira_em
+        if len(self._expiracoes) > self.tamanho_maximo:
+            self._descartar_excedentes()
+
+    def _descartar_excedentes(self) -> None:
+        agora = datetime.utcnow()
+        self._expiracoes = {
+            jti: expira_em
+            for jti, expira_em in self._expiracoes.items()
+            if expira_em > agora
+        }
+        excedentes = len(self._expiracoes) - self.tamanho_maximo
+        if excedentes > 0:
+            # Os mais próximos do vencimento são os que menos tempo ficariam
+            # aceitos indevidamente.
+            for jti, _ in heapq.nsmallest(
+                excedentes, self._expiracoes.items(), key=lambda item: item[1]
+            ):
+                del self._expiracoes[jti]
+            logger.warning(
+                f"Lista de revogação cheia: {excedentes} tokens descartados."
+            )
+
+
+lista_de_revogacao = ListaDeRevogacao(Config.AUTH.REVOGACAO_TAMANHO_MAXIMO)
+
+
+async def sincronizar_revogacoes(
+    lista: ListaDeRevogacao = lista_de_revogacao,
+) -> int:
+    """
+    Traz para a lista as revogações gravadas desde a última sincronização e
+    apaga do banco as que já venceram. Retorna a quantidade de revogações lidas.
+    """
+    agora = datetime.utcnow()
+    async with get_sessionmaker()() as session:
+        linhas = (
+            await session.execute(
+                select(TokenRevogado.id, TokenRevogado.jti, TokenRevogado.expira_em)
+                .where(TokenRevogado.id > lista.ultimo_id - SOBREPOSICAO_DE_IDS)
+                .where(TokenRevogado.expira_em > agora)
+                .order_by(TokenRevogado.id)
+            )
+        ).all()
+        for id, jti, expira_em in linhas:
+            lista.adicionar(jti, expira_em)
+            lista.ultimo_id = max(lista.ultimo_id, id)
+        await session.execute(
+            delete(TokenRevogado).where(TokenRevogado.expira_em <= agora)
+        )
+        await session.commit()
+    return len(linhas)
+
+
+async def iniciar_sincronizacao_periodica(stop_function: Optional[Callable] = None):
+    """Sincroniza a lista a cada `REVOGACAO_INTERVALO_SEGUNDOS` segundos."""
+    while stop_function is None or not stop_function():
+        try:
+            await sincronizar_revogacoes()
+        except Exception as e:
+            logger.error(f"Falha ao sincronizar a lista de revogação: {e}")
+        else:
+            registrar_execucao_worker("revogacao")
+        await asyncio.sleep(Config.AUTH.REVOGACAO_INTERVALO_SEGUNDOS)
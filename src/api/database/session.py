@@ -1,16 +1,35 @@
-from fastapi import HTTPException
+import asyncio
+import uuid
+from typing import Optional
+
+from fastapi import Depends, HTTPException
 from loguru import logger
 from pydantic import ValidationError
 from sqlalchemy import URL
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.pool import NullPool
 
 from src.api.config import Config
+from src.api.database import remocao_logica  # noqa: F401
+from src.api.database.alteracoes import tabelas_alteradas
+from src.api.database.pool import AsyncAdaptedQueuePoolMedido
 from src.api.database.repository import PGCopRepository
+from src.api.monitoring import metrics
+from src.api.monitoring.sql import instrumentar_engine
+from src.api.utils.cache import invalidar_caches
+
+# A engine é criada apenas no primeiro uso: em ambientes serverless isso tira a
+# criação do pool (e o import do driver) do cold start de rotas sem banco.
+_engine: Optional[AsyncEngine] = None
+_async_session: Optional[sessionmaker] = None
 
-engine = create_async_engine(
-    URL(
+
+def _url() -> URL:
+    query = {}
+    if Config.DB_CONFIG.DB_TRANSACTION_POOLER and _usa_asyncpg():
+        query["prepared_statement_cache_size"] = "0"
+    return URL(
         drivername=Config.DB_CONFIG.DB_DRIVERNAME,
         username=Config.DB_CONFIG.DB_USERNAME,
         password=Config.DB_CONFIG.DB_PASSWORD,
@@ -18,30 +37,133 @@ engine = create_async_engine(
         port=Config.DB_CONFIG.DB_PORT,
         database=Config.DB_CONFIG.DB_DATABASE,
         # query={"charset": "UTF8MB4"},
-        query={},
-    ),
-    poolclass=AsyncAdaptedQueuePool
-    if Config.DB_CONFIG.DB_ENABLE_CONNECTION_POOLING
-    else NullPool,
-)
+        query=query,
+    )
+
+
+def _usa_asyncpg() -> bool:
+    return "asyncpg" in Config.DB_CONFIG.DB_DRIVERNAME
+
+
+def _opcoes_do_pool() -> dict:
+    if Config.DB_CONFIG.DB_SERVERLESS:
+        # Sem pool: cada sessão abre e fecha a própria conexão. O runtime pode
+        # congelar a instância ou trocar o event loop entre invocações, e uma
+        # conexão mantida no pool não poderia ser usada nem fechada no loop
+        # seguinte. O custo de conexão fica com o pooler (DB_TRANSACTION_POOLER).
+        return {"poolclass": NullPool}
+    if not Config.DB_CONFIG.DB_ENABLE_CONNECTION_POOLING:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": AsyncAdaptedQueuePoolMedido,
+        "pool_size": Config.DB_CONFIG.DB_POOL_SIZE,
+        "max_overflow": Config.DB_CONFIG.DB_MAX_OVERFLOW,
+        "pool_timeout": Config.DB_CONFIG.DB_POOL_TIMEOUT,
+        "pool_recycle": Config.DB_CONFIG.DB_POOL_RECYCLE,
+        "pool_pre_ping": Config.DB_CONFIG.DB_POOL_PRE_PING,
+    }
+
+
+def _opcoes_de_conexao() -> dict:
+    if not (Config.DB_CONFIG.DB_TRANSACTION_POOLER and _usa_asyncpg()):
+        return {}
+    # Em pooler no modo transação (PgBouncer, Supavisor) cada transação pode ir
+    # para um backend diferente: prepared statements nomeados não sobrevivem.
+    return {
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    }
+
+
+def get_engine() -> AsyncEngine:
+    """Retorna a engine da aplicação, criando-a no primeiro uso."""
+    global _engine
+
+    if _engine is None:
+        _engine = create_async_engine(
+            _url(), **_opcoes_do_pool(), **_opcoes_de_conexao()
+        )
+        instrumentar_engine(_engine.sync_engine)
+    return _engine
+
+
+def get_sessionmaker() -> sessionmaker:
+    global _async_session
+
+    if _async_session is None:
+        _async_session = sessionmaker(
+            get_engine(), expire_on_commit=False, class_=AsyncSession
+        )
+    return _async_session
+
+
+def _valor_do_pool(nome: str) -> float:
+    if _engine is None or not hasattr(_engine.pool, "checkedout"):
+        return 0
+    return max(getattr(_engine.pool, nome)(), 0)
+
+
+metrics.DB_POOL_SIZE.set_function(lambda: _valor_do_pool("size"))
+metrics.DB_POOL_CHECKED_OUT.set_function(lambda: _valor_do_pool("checkedout"))
+metrics.DB_POOL_OVERFLOW.set_function(lambda: _valor_do_pool("overflow"))
+
+
+async def preaquecer_pool(engine: Optional[AsyncEngine] = None) -> int:
+    """
+    Abre `DB_POOL_SIZE` conexões simultâneas e as devolve ao pool, para que as
+    primeiras requisições após o deploy não paguem o custo de conexão.
+
+    :return: quantidade de conexões abertas.
+    """
+    if (
+        not Config.DB_CONFIG.DB_ENABLE_CONNECTION_POOLING
+        or Config.DB_CONFIG.DB_SERVERLESS
+    ):
+        return 0
+    engine = engine or get_engine()
+
+    conexoes = await asyncio.gather(
+        *(engine.connect() for _ in range(Config.DB_CONFIG.DB_POOL_SIZE)),
+        return_exceptions=True,
+    )
+    abertas = [c for c in conexoes if not isinstance(c, BaseException)]
+    await asyncio.gather(*(conexao.close() for conexao in abertas))
+
+    falhas = [c for c in conexoes if isinstance(c, BaseException)]
+    if falhas:
+        logger.warning(
+            f"Pré-aquecimento do pool abriu {len(abertas)} de {len(conexoes)} "
+            f"conexões; primeiro erro: {falhas[0]}"
+        )
+    return len(abertas)
+
 
-async_session = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+async def get_session():
+    """
+    Sessão da requisição: confirmada ao final, ou desfeita se a rota falhar.
+    Todas as dependências `get_repo()` de uma mesma requisição compartilham esta
+    sessão, e os testes a substituem em `app.dependency_overrides[get_session]`.
+    """
+    async with get_sessionmaker()() as session:
+        try:
+            yield session
+            await session.commit()
+            await invalidar_caches(tabelas_alteradas(session.sync_session))
+        except Exception as e:
+            await session.rollback()
+            if not isinstance(e, (HTTPException, ValidationError)):
+                logger.warning(
+                    f"Rollback realizado na transação atual devido ao erro: {e};"
+                )
+            raise e
+        finally:
+            await session.close()
 
 
 def get_repo(repository=PGCopRepository):
-    async def _get_repo():
-        async with async_session() as session:
-            try:
-                yield repository(session)
-                await session.commit()
-            except Exception as e:
-                await session.rollback()
-                if not isinstance(e, (HTTPException, ValidationError)):
-                    logger.warning(
-                        f"Rollback realizado na transação atual devido ao erro: {e};"
-                    )
-                raise e
-            finally:
-                await session.close()
+    async def _get_repo(session: AsyncSession = Depends(get_session)):
+        return repository(session)
 
     return _get_repo
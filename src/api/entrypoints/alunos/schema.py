@@ -1,17 +1,17 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import Field, constr, field_validator
+from pydantic import BaseModel, Field, constr, field_validator
 from pydantic_br import CPF
 from pydantic_extra_types.phone_numbers import PhoneNumber
 
 from src.api.entrypoints.professores.schema import ProfessorInDB
 from src.api.exceptions.value_error_validation_exception import MatriculaNotNumericError, InvalidLattesError
+from src.api.monitoring import tracing
 from src.api.schemas.usuario import UsuarioBase, UsuarioInDB, UsuarioNovo
 from src.api.utils.decorators import partial_model
 from src.api.utils.enums import CursoAlunoEnum, TipoUsuarioEnum
 
-import httpx
 import re
 
 PhoneNumber.phone_format = "NATIONAL"
@@ -62,13 +62,29 @@ class AlunoBase(UsuarioBase):
 
     @field_validator("lattes", mode='after')
     def validar_lattes(cls, lattes: str):
+        import httpx
+
         match = re.match(r"http(s?):\/\/lattes\.cnpq\.br\/(.+)", lattes)
 
         if match is None:
             raise InvalidLattesError()
 
         lattes_id = match.groups()[1]
-        resp = httpx.head(f"http://buscatextual.cnpq.br/buscatextual/cv?id={lattes_id}", headers={"User-Agent": "Chrome/126.0.0.0"})
+        url = f"http://buscatextual.cnpq.br/buscatextual/cv?id={lattes_id}"
+        with tracing.iniciar_span(
+            "HEAD buscatextual.cnpq.br",
+            tracing.CLIENTE,
+            {"http.method": "HEAD", "http.url": url},
+        ) as span:
+            resp = httpx.head(
+                url,
+                headers={
+                    "User-Agent": "Chrome/126.0.0.0",
+                    **tracing.cabecalhos_de_propagacao(),
+                },
+            )
+            if span is not None:
+                span.atributos["http.status_code"] = resp.status_code
 
         if (resp.headers.get("Location") == "http://buscatextual.cnpq.br/buscatextual/erro.jsp"):
             raise InvalidLattesError()
@@ -86,11 +102,24 @@ class AlunoNovo(AlunoBase, UsuarioNovo):
     )
 
 
+class ProgressoAlunoInDB(BaseModel):
+    aluno_id: int
+    total_tarefas: int
+    tarefas_concluidas: int
+    percentual_concluido: float
+    proximo_prazo: Optional[date] = Field(
+        None, description="Prazo da próxima tarefa pendente, se houver."
+    )
+
+
 class AlunoInDB(AlunoBase, UsuarioInDB):
     usuario_id: int
     orientador: Optional[ProfessorInDB] = Field(
         None, description="Dados do orientador do aluno, se houver."
     )
+    progresso: Optional[ProgressoAlunoInDB] = Field(
+        None, description="Resumo das tarefas do aluno, nas listagens."
+    )
 
 
 @partial_model
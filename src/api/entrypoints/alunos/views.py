@@ -6,9 +6,14 @@ from loguru import logger
 from src.api.database.models.aluno import Aluno
 from src.api.database.models.professor import Professor
 from src.api.database.session import get_repo
-from src.api.entrypoints.alunos.schema import AlunoInDB, AlunoNovo
+from src.api.entrypoints.alunos.schema import (
+    AlunoInDB,
+    AlunoNovo,
+    ProgressoAlunoInDB,
+)
 from src.api.exceptions.credentials_exception import NaoAutorizadoException
 from src.api.services.aluno import ServicoAluno
+from src.api.services.tarefa import ServiceTarefa
 from src.api.services.tipo_usuario import ServicoTipoUsuarioGenerico
 from src.api.utils.enums import TipoUsuarioEnum
 
@@ -44,6 +49,28 @@ async def get_aluno(
 
     return await ServicoAluno(repository).buscar_dados_in_db_por_id(aluno_id)
 
+@router.get("/{aluno_id}/progresso", response_model=ProgressoAlunoInDB)
+async def get_progresso_aluno(
+    aluno_id: int, token: str = Depends(oauth2_scheme), repository=Depends(get_repo())
+):
+    logger.info(f"Solicitado progresso do {aluno_id=} | Autenticando usuário atual.")
+    pessoa: Professor = await ServicoTipoUsuarioGenerico(
+        repository
+    ).buscar_usuario_atual(token=token)
+
+    # Permitir que alunos acessem apenas o próprio progresso.
+    if pessoa.usuario.tipo_usuario.titulo == TipoUsuarioEnum.ALUNO:
+        if pessoa.id != aluno_id:
+            raise NaoAutorizadoException()
+    elif pessoa.usuario.tipo_usuario.titulo not in [
+        TipoUsuarioEnum.COORDENADOR,
+        TipoUsuarioEnum.PROFESSOR,
+    ]:
+        raise NaoAutorizadoException()
+
+    return await ServiceTarefa(repository).buscar_progresso_aluno(aluno_id)
+
+
 @router.delete(
     "/{aluno_id}", response_model=None, status_code=status.HTTP_204_NO_CONTENT
 )
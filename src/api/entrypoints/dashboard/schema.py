@@ -0,0 +1,32 @@
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from src.api.utils.enums import CursoAlunoEnum
+
+
+class ContagensDashboard(BaseModel):
+    alunos: int = 0
+    tarefas_atrasadas: int = 0
+    tarefas_proximas_do_prazo: int = 0
+    solicitacoes_pendentes: int = 0
+
+
+class DashboardProfessor(ContagensDashboard):
+    professor_id: int
+    nome: Optional[str] = None
+
+
+class DashboardCurso(ContagensDashboard):
+    curso: CursoAlunoEnum
+
+
+class Dashboard(BaseModel):
+    gerado_em: datetime
+    prazo_proximo_ate: date = Field(
+        ..., description="Tarefas com prazo até esta data são próximas do prazo."
+    )
+    totais: ContagensDashboard
+    professores: list[DashboardProfessor]
+    cursos: list[DashboardCurso]
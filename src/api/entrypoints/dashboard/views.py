@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+from fastapi.security import OAuth2PasswordBearer
+from loguru import logger
+
+from src.api.database.models.professor import Professor
+from src.api.database.session import get_repo
+from src.api.entrypoints.dashboard.schema import Dashboard
+from src.api.exceptions.credentials_exception import NaoAutorizadoException
+from src.api.services.dashboard import ServicoDashboard
+from src.api.services.tipo_usuario import ServicoTipoUsuarioGenerico
+from src.api.utils.enums import TipoUsuarioEnum
+
+router = APIRouter()
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+
+@router.get("/", response_model=Dashboard)
+async def get_dashboard(
+    token: str = Depends(oauth2_scheme), repository=Depends(get_repo())
+):
+    logger.info("Solicitado dashboard do programa | Autenticando usuário atual.")
+    coordenador: Professor = await ServicoTipoUsuarioGenerico(
+        repository
+    ).buscar_usuario_atual(token=token, tipo_usuario=TipoUsuarioEnum.COORDENADOR)
+    if coordenador.usuario.tipo_usuario.titulo != TipoUsuarioEnum.COORDENADOR:
+        raise NaoAutorizadoException()
+    return await ServicoDashboard(repository).gerar()
@@ -1,6 +1,20 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from fastapi.security import OAuth2PasswordBearer
+
+from src.api.config import Config
+from src.api.database.models.professor import Professor
+from src.api.database.session import get_engine, get_repo
+from src.api.exceptions.credentials_exception import NaoAutorizadoException
+from src.api.monitoring import profiler
+from src.api.monitoring.metrics import CONTENT_TYPE_LATEST, REGISTRY
+from src.api.monitoring.readiness import VerificadorProntidao
+from src.api.services.tipo_usuario import ServicoTipoUsuarioGenerico
+from src.api.utils.enums import TipoUsuarioEnum
 
 router = APIRouter()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+verificador_prontidao = VerificadorProntidao(get_engine)
 
 
 @router.get("/health-check", status_code=200, tags=["Monitoring"])
@@ -11,3 +25,71 @@ async def health_check() -> dict:
     It returns 200 if the project is healthy.
     """
     return {"status": "alive"}
+
+
+@router.get("/ready", status_code=200, tags=["Monitoring"])
+async def readiness() -> JSONResponse:
+    """
+    Checks if this instance can serve traffic.
+
+    It returns 200 when the database answers a ping within the timeout, the
+    schema is at the Alembic head and the connection pool is not exhausted;
+    otherwise 503. The result is cached for a few seconds.
+    """
+    resultado = await verificador_prontidao.verificar()
+    return JSONResponse(
+        content=resultado,
+        status_code=status.HTTP_200_OK
+        if resultado["status"] == "ready"
+        else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+@router.get("/metrics", status_code=200, tags=["Monitoring"])
+async def metrics() -> Response:
+    """
+    Exposes the process metrics in the Prometheus text format.
+
+    Includes request latency per route template, in-flight requests, database
+    pool usage, queries per request, cache hits/misses, bcrypt pool queue depth
+    and mailer outcomes.
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
+
+
+@router.get("/profiler", status_code=200, tags=["Monitoring"])
+async def profiler_de_amostragem(
+    segundos: float = Query(10, gt=0),
+    intervalo_ms: float = Query(5, ge=1, le=1000),
+    token: str = Depends(oauth2_scheme),
+    repository=Depends(get_repo()),
+) -> PlainTextResponse:
+    """
+    Samples the Python stacks of the worker that serves the request.
+
+    Runs for `segundos` seconds (capped by PROFILER_SEGUNDOS_MAXIMO), one
+    sample every `intervalo_ms`, and returns collapsed stacks ready for
+    flamegraph.pl or speedscope. Only coordinators may call it, and only
+    when PROFILER_ATIVO is set; otherwise it answers 404. One collection
+    runs per process at a time (409).
+    """
+    if not Config.PROFILER_ATIVO:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    coordenador: Professor = await ServicoTipoUsuarioGenerico(
+        repository
+    ).buscar_usuario_atual(token=token, tipo_usuario=TipoUsuarioEnum.COORDENADOR)
+    if coordenador.usuario.tipo_usuario.titulo != TipoUsuarioEnum.COORDENADOR:
+        raise NaoAutorizadoException()
+    # A conexão não fica presa durante a coleta.
+    await repository.liberar_conexao()
+
+    try:
+        pilhas = await profiler.coletar(
+            min(segundos, Config.PROFILER_SEGUNDOS_MAXIMO), intervalo_ms / 1000
+        )
+    except profiler.ProfilerEmAndamentoError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Já existe uma coleta do profiler em andamento.",
+        )
+    return PlainTextResponse(pilhas)
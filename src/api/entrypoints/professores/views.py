@@ -18,6 +18,7 @@ from src.api.services.aluno import ServicoAluno
 from src.api.services.professor import ServiceProfessor
 from src.api.services.tipo_usuario import ServicoTipoUsuarioGenerico
 from src.api.utils.enums import TipoUsuarioEnum
+from src.api.utils.respostas import RespostaJSONRapida
 
 router = APIRouter()
 
@@ -114,7 +115,9 @@ async def get_orientandos_por_professor_id(
     )
     if coordenador.usuario.tipo_usuario.titulo != TipoUsuarioEnum.COORDENADOR:
         raise NaoAutorizadoException()
-    return await ServicoAluno(repository).buscar_alunos_por_orientador(professor_id)
+    return RespostaJSONRapida(
+        await ServicoAluno(repository).buscar_alunos_por_orientador(professor_id)
+    )
 
 
 @router.get("/orientandos/", response_model=List[AlunoInDB])
@@ -131,6 +134,8 @@ async def get_orientandos_por_token(
         f"{professor.id=} | "
         f"Tipo usuário atual é {professor.usuario.tipo_usuario.titulo}."
     )
-    return await ServicoAluno(repository).buscar_alunos_por_orientador(professor.id)
+    return RespostaJSONRapida(
+        await ServicoAluno(repository).buscar_alunos_por_orientador(professor.id)
+    )
 
 
@@ -1,6 +1,7 @@
 from fastapi.routing import APIRouter
 
 from src.api.entrypoints.alunos import views as alunos
+from src.api.entrypoints.dashboard import views as dashboard
 from src.api.entrypoints.mailer import views as mailer
 from src.api.entrypoints.monitoring import views as monitoring
 from src.api.entrypoints.new_password import views as new_password
@@ -30,3 +31,4 @@ api_router.include_router(
 api_router.include_router(
     solicitacao.router, prefix="/solicitacoes", tags=["Solicitacoes"]
 )
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["Dashboard"])
@@ -10,6 +10,7 @@ from src.api.exceptions.credentials_exception import NaoAutorizadoException
 from src.api.services.solicitacao import ServicoSolicitacao
 from src.api.services.tipo_usuario import ServicoTipoUsuarioGenerico
 from src.api.utils.enums import StatusSolicitacaoEnum, TipoUsuarioEnum
+from src.api.utils.respostas import RespostaJSONRapida
 
 router = APIRouter()
 
@@ -43,8 +44,10 @@ async def listar_solicitacoes(
         TipoUsuarioEnum.PROFESSOR,
     ]:
         raise NaoAutorizadoException()
-    return await ServicoSolicitacao(repository).listar(
-        professor_id=professor_id, status=status
+    return RespostaJSONRapida(
+        await ServicoSolicitacao(repository).listar(
+            professor_id=professor_id, status=status
+        )
     )
 
 
@@ -1,9 +1,12 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel, constr, field_validator
+from pydantic import BaseModel, conlist, constr, field_validator, model_validator
 
 from src.api.utils.decorators import partial_model
+from src.api.utils.enums import OperacaoLoteEnum
+
+TAMANHO_MAXIMO_DO_LOTE = 500
 
 
 class TarefaBase(BaseModel):
@@ -39,3 +42,43 @@ class TarefaInDB(TarefaBase):
 class TarefaUpdate(BaseModel):
     concluida: Optional[bool] = None
     data_conclusao: Optional[date] = None
+
+
+class OperacaoTarefa(BaseModel):
+    """
+    Uma operação de `POST /tarefas/batch`. `criar` usa `tarefa`; as demais
+    usam `tarefa_id` e, conforme a operação, `atualizacao` ou `conclusao`.
+    """
+
+    operacao: OperacaoLoteEnum
+    tarefa_id: Optional[int] = None
+    tarefa: Optional[TarefaBase] = None
+    atualizacao: Optional[TarefaAtualizada] = None
+    conclusao: Optional[TarefaUpdate] = None
+
+    @model_validator(mode="after")
+    def campos_da_operacao(self):
+        if self.operacao == OperacaoLoteEnum.CRIAR:
+            if self.tarefa is None:
+                raise ValueError("Informe `tarefa` para criar uma tarefa.")
+            return self
+        if self.tarefa_id is None:
+            raise ValueError(f"Informe `tarefa_id` para {self.operacao}.")
+        if self.operacao == OperacaoLoteEnum.ATUALIZAR and self.atualizacao is None:
+            raise ValueError("Informe `atualizacao` para atualizar uma tarefa.")
+        if self.operacao == OperacaoLoteEnum.CONCLUIR and self.conclusao is None:
+            raise ValueError("Informe `conclusao` para concluir uma tarefa.")
+        return self
+
+
+class LoteTarefas(BaseModel):
+    operacoes: conlist(OperacaoTarefa, min_length=1, max_length=TAMANHO_MAXIMO_DO_LOTE)
+
+
+class ResultadoOperacaoTarefa(BaseModel):
+    indice: int
+    operacao: OperacaoLoteEnum
+    status: int
+    tarefa_id: Optional[int] = None
+    tarefa: Optional[TarefaInDB] = None
+    erro: Optional[str] = None
@@ -5,11 +5,19 @@ from fastapi import HTTPException
 
 from src.api.database.models.professor import Professor
 from src.api.database.session import get_repo
-from src.api.entrypoints.tarefas.schema import TarefaAtualizada, TarefaBase, TarefaInDB, TarefaUpdate
+from src.api.entrypoints.tarefas.schema import (
+    LoteTarefas,
+    ResultadoOperacaoTarefa,
+    TarefaAtualizada,
+    TarefaBase,
+    TarefaInDB,
+    TarefaUpdate,
+)
 from src.api.exceptions.credentials_exception import NaoAutorizadoException
 from src.api.services.tarefa import ServiceTarefa
 from src.api.services.tipo_usuario import ServicoTipoUsuarioGenerico
 from src.api.utils.enums import TipoUsuarioEnum
+from src.api.utils.respostas import RespostaJSONRapida
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -30,6 +38,31 @@ async def criar_tarefa(tarefa: TarefaBase,token: str = Depends(oauth2_scheme), r
     return await ServiceTarefa(repository).criar_tarefa(tarefa)
 
 
+@router.post("/batch", response_model=list[ResultadoOperacaoTarefa])
+async def executar_lote_de_tarefas(
+    lote: LoteTarefas,
+    token: str = Depends(oauth2_scheme),
+    repository=Depends(get_repo()),
+):
+    """
+    Cria, atualiza, conclui e remove várias tarefas em uma transação,
+    retornando o resultado de cada operação na ordem recebida.
+    """
+    professor: Professor = await ServicoTipoUsuarioGenerico(
+        repository
+    ).buscar_usuario_atual(token=token)
+
+    if professor.usuario.tipo_usuario.titulo not in [
+        TipoUsuarioEnum.COORDENADOR,
+        TipoUsuarioEnum.PROFESSOR,
+    ]:
+        raise NaoAutorizadoException()
+
+    return RespostaJSONRapida(
+        await ServiceTarefa(repository).executar_lote(lote.operacoes)
+    )
+
+
 @router.put("/{tarefa_id}", response_model=None)
 async def atualizar_tarefa(
     tarefa_id: int, tarefa: TarefaAtualizada,token: str = Depends(oauth2_scheme), repository=Depends(get_repo())
@@ -142,4 +175,6 @@ async def buscar_tarefas_por_aluno(
     elif pessoa.usuario.tipo_usuario.titulo not in [TipoUsuarioEnum.COORDENADOR, TipoUsuarioEnum.PROFESSOR]:
         raise NaoAutorizadoException()  # Usará a mensagem padrão "Não autorizado."
 
-    return await ServiceTarefa(repository).buscar_tarefas_por_aluno(aluno_id)
+    return RespostaJSONRapida(
+        await ServiceTarefa(repository).buscar_tarefas_por_aluno(aluno_id)
+    )
@@ -20,10 +20,19 @@ class TokenType(Enum):
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str
     expiration_date: datetime
 
 
+class RenovacaoToken(BaseModel):
+    refresh_token: str
+
+
+class RevogacaoToken(BaseModel):
+    refresh_token: Optional[str] = None
+
+
 class TokenData(BaseModel):
     username: Optional[str] = None
     exp: Optional[int] = None  # Expiry timestamp
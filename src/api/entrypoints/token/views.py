@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi import APIRouter, Depends, status
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.database.session import get_repo
-from src.api.entrypoints.token.schema import Token
+from src.api.entrypoints.token.schema import RenovacaoToken, RevogacaoToken, Token
 from src.api.services.auth import ServicoAuth
 
 router = APIRouter()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
 @router.post("/", response_model=Token)
@@ -17,3 +18,20 @@ async def login_para_acessar_token(
     return await ServicoAuth(repository).login_para_acessar_token(
         form_data.username, form_data.password
     )
+
+
+@router.post("/refresh", response_model=Token)
+async def renovar_token(
+    renovacao: RenovacaoToken,
+    repository: AsyncSession = Depends(get_repo()),
+) -> Token:
+    return await ServicoAuth(repository).renovar_token(renovacao.refresh_token)
+
+
+@router.post("/revogar", status_code=status.HTTP_204_NO_CONTENT)
+async def revogar_token(
+    revogacao: RevogacaoToken,
+    token: str = Depends(oauth2_scheme),
+    repository: AsyncSession = Depends(get_repo()),
+) -> None:
+    await ServicoAuth(repository).revogar_tokens(token, revogacao.refresh_token)
@@ -1,10 +1,8 @@
 import logging
 
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
-
 from src.api.config import Config
 from src.api.mailsender.localmail import localmail
+from src.api.monitoring import metrics, tracing
 
 
 class Mailer(object):
@@ -13,13 +11,23 @@ class Mailer(object):
     """
 
     def __init__(self):
-        self.__sg_client = SendGridAPIClient(Config.SENDGRID_CONFIG.API_KEY)
+        self.__sg_client = None
+
+    @property
+    def _sg_client(self):
+        """Cliente do SendGrid, criado apenas no primeiro envio real."""
+        if self.__sg_client is None:
+            from sendgrid import SendGridAPIClient
+
+            self.__sg_client = SendGridAPIClient(Config.SENDGRID_CONFIG.API_KEY)
+        return self.__sg_client
 
     def send_message(self, dest_email: str, subject: str, html_content: str):
         """
         Envia uma mensagem para o usuário.
         """
         if Config.TESTING:
+            metrics.MAILER_MESSAGES.labels(outcome="local").inc()
             return localmail.send(
                 from_email=Config.SENDGRID_CONFIG.EMAIL,
                 dest_email=dest_email,
@@ -27,6 +35,8 @@ class Mailer(object):
                 html_content=html_content,
             )
 
+        from sendgrid.helpers.mail import Mail
+
         message = Mail(
             from_email=Config.SENDGRID_CONFIG.EMAIL,
             to_emails=dest_email,
@@ -35,7 +45,12 @@ class Mailer(object):
         )
 
         try:
-            self.__sg_client.send(message)
+            with tracing.iniciar_span(
+                "POST api.sendgrid.com", tracing.CLIENTE, {"http.method": "POST"}
+            ):
+                self._sg_client.send(message)
         except Exception as exception:
+            metrics.MAILER_MESSAGES.labels(outcome="failed").inc()
             logging.error(f"MailerError: {exception}")
             raise exception
+        metrics.MAILER_MESSAGES.labels(outcome="sent").inc()
@@ -1,16 +1,19 @@
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Callable, Optional
 
 from loguru import logger
-from sqlalchemy import join, select, update
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.database.models.aluno import Aluno
-from src.api.database.models.tarefa import Tarefa
-from src.api.database.models.usuario import Usuario
-from src.api.database.session import session
+from src.api.database.repository import PGCopRepository
+from src.api.database.session import get_sessionmaker
 from src.api.html_loader import load_html
 from src.api.mailsender.workers.abstract import MailerWorker
+from src.api.monitoring.readiness import registrar_execucao_worker
+from src.api.utils.notificacao import proxima_notificacao_apos_aviso
+
+TAMANHO_DO_LOTE = 500
 
 
 class TaskMailerWorker(MailerWorker):
@@ -18,113 +21,80 @@ class TaskMailerWorker(MailerWorker):
     Classe responsável por notificar por email
     os usuários sobre tarefas perto do prazo,
     ou tarefas atrasadas.
-    """
 
-    def __get_tasks_near_to_deadline(self):
-        """
-        Retorna as tarefas pendentes, próximas ao prazo de entrega.
-        """
-        deadline = datetime.utcnow() + timedelta(days=30)  # Expires in 1 month
+    Cada tarefa pendente guarda em `data_proxima_notificacao` quando o próximo
+    aviso é devido, então a varredura busca apenas as tarefas com aviso vencido.
+    """
 
-        query = (
-            select(
-                Aluno.id,
-                Usuario.nome,
-                Usuario.email,
-                Tarefa.id.label("tarefa_id"),
-                Tarefa.data_prazo,
-                Tarefa.descricao,
-                Tarefa.nome.label("titulo"),
-            )
-            .select_from(
-                join(Aluno, Tarefa, Aluno.id == Tarefa.aluno_id).join(
-                    Usuario, Aluno.usuario_id == Usuario.id
-                )
-            )
-            .where(Tarefa.data_prazo <= deadline.date())
-            .where(Tarefa.data_ultima_notificacao.is_(None))
+    def __notificar(self, task: Row, agora: datetime) -> None:
+        if task.data_prazo >= agora.date():
+            logger.info(f"{task.tarefa_id=}'s near deadline. E-mailing {task.email=}")
+            subject = "[PGCOP] Temos um lembrete para você"
+            template = "task_near_to_deadline"
+        else:
+            logger.info(f"{task.tarefa_id=}'s past deadline. E-mailing {task.email=}")
+            subject = "[AVISO PGCOP] Tarefa Atrasada - Fique atento aos prazos"
+            template = "task_past_to_deadline"
+
+        body = load_html(
+            template,
+            name=task.nome,
+            task_title=task.titulo,
+            task_description=task.descricao.replace("\n", " "),
+            task_deadline=task.data_prazo.strftime("%d/%m/%Y"),
         )
-        return session().execute(query)
+        self.send_message(task.email, subject, body)
 
-    def __get_tasks_past_to_deadline(self):
+    async def notificar_tarefas_devidas(
+        self, sessoes: Optional[Callable[[], AsyncSession]] = None
+    ) -> int:
         """
-        Retorna as tarefas pendentes, fora do prazo de entrega.
+        Envia os avisos vencidos, em lotes, e agenda o próximo aviso de cada
+        tarefa notificada. Retorna a quantidade de emails enviados.
+
+        Cada aviso é confirmado logo após o envio, então uma falha adiante não
+        desfaz o registro dos emails já enviados. Tarefas cujo envio falhou
+        ficam para a próxima varredura; a atual termina se um lote inteiro
+        falhar, como quando o SendGrid está fora do ar.
         """
-        query = (
-            select(
-                Aluno.id,
-                Usuario.nome,
-                Usuario.email,
-                Tarefa.id.label("tarefa_id"),
-                Tarefa.data_prazo,
-                Tarefa.descricao,
-                Tarefa.nome.label("titulo"),
-            )
-            .select_from(
-                join(Aluno, Tarefa, Aluno.id == Tarefa.aluno_id).join(
-                    Usuario, Aluno.usuario_id == Usuario.id
+        enviados = 0
+        falhas: set[int] = set()
+        while True:
+            agora = datetime.utcnow()
+            async with (sessoes or get_sessionmaker())() as session:
+                repo = PGCopRepository(session)
+                tarefas = await repo.buscar_tarefas_com_notificacao_devida(
+                    agora, TAMANHO_DO_LOTE, ignorar=falhas
                 )
-            )
-            .where(Tarefa.data_prazo < datetime.utcnow())
-            .where(Tarefa.data_ultima_notificacao <= Tarefa.data_prazo)
-        )
-        return session().execute(query)
+                enviados_no_lote = 0
+                for task in tarefas:
+                    try:
+                        await asyncio.to_thread(self.__notificar, task, agora)
+                    except Exception as e:
+                        logger.error(f"Failed to notify {task.tarefa_id=}: {e}")
+                        falhas.add(task.tarefa_id)
+                        continue
+                    await repo.registrar_notificacao_tarefa(
+                        task.tarefa_id,
+                        agora,
+                        proxima_notificacao_apos_aviso(task.data_prazo, agora),
+                    )
+                    await session.commit()
+                    enviados_no_lote += 1
+                enviados += enviados_no_lote
+            if len(tarefas) < TAMANHO_DO_LOTE or not enviados_no_lote:
+                if falhas:
+                    logger.warning(f"{len(falhas)} task notifications failed")
+                return enviados
 
     async def start(self, stop_function: Optional[Callable] = None):
         while stop_function is None or not stop_function():
-            logger.info("Checking for tasks near to deadline")
-            for task in self.__get_tasks_near_to_deadline():
-                logger.info(
-                    f"{task.tarefa_id=}'s near deadline. E-mailing {task.email=}"
-                )
-
-                subject = "[PGCOP] Temos um lembrete para você"
-
-                body = load_html(
-                    "task_near_to_deadline",
-                    name=task.nome,
-                    task_title=task.titulo,
-                    task_description=task.descricao.replace("\n", " "),
-                    task_deadline=task.data_prazo.strftime("%d/%m/%Y"),
-                )
-
-                self.send_message(task.email, subject, body)
-
-                query = (
-                    update(Tarefa)
-                    .where(Tarefa.id == task.tarefa_id)
-                    .values(data_ultima_notificacao=str(datetime.utcnow().date()))
-                )
-
-                current_session = session()
-                current_session.execute(query)
-                current_session.commit()
-
-            logger.info("Checking for tasks past to deadline")
-            for task in self.__get_tasks_past_to_deadline():
-                logger.info(
-                    f"{task.tarefa_id=}'s past deadline. E-mailing {task.email=}"
-                )
-                subject = "[AVISO PGCOP] Tarefa Atrasada - Fique atento aos prazos"
-
-                body = load_html(
-                    "task_past_to_deadline",
-                    name=task.nome,
-                    task_title=task.titulo,
-                    task_description=task.descricao.replace("\n", " "),
-                    task_deadline=task.data_prazo.strftime("%d/%m/%Y"),
-                )
-
-                self.send_message(task.email, subject, body)
-
-                query = (
-                    update(Tarefa)
-                    .where(Tarefa.id == task.tarefa_id)
-                    .values(data_ultima_notificacao=str(datetime.utcnow().date()))
-                )
-
-                current_session = session()
-                current_session.execute(query)
-                current_session.commit()
-
+            logger.info("Checking for tasks with notifications due")
+            try:
+                enviados = await self.notificar_tarefas_devidas()
+            except Exception as e:
+                logger.error(f"Failed to check task notifications: {e}")
+            else:
+                logger.info(f"{enviados} task notifications sent")
+                registrar_execucao_worker("task_mailer")
             await asyncio.sleep(60 * 60)
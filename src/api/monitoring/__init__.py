@@ -0,0 +1,3 @@
+"""
+Instrumentação da aplicação: métricas, consultas SQL e estado de prontidão.
+"""
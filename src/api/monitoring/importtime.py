@@ -0,0 +1,88 @@
+"""
+Perfil do tempo de import (cold start) da aplicação.
+
+Executa um interpretador novo com `-X importtime` e agrega o resultado por
+módulo, para identificar o que pesa na inicialização dos workers e das
+funções serverless:
+
+    python -m src.api.monitoring.importtime [--top 20] [--modulo src.api.app]
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from typing import NamedTuple
+
+MODULO_APLICACAO = "src.api.app"
+
+
+class TempoImport(NamedTuple):
+    modulo: str
+    proprio_us: int
+    acumulado_us: int
+
+
+def medir_imports(modulo: str = MODULO_APLICACAO) -> list[TempoImport]:
+    """
+    Importa `modulo` em um processo novo e retorna o tempo de cada módulo
+    importado, na ordem em que o import terminou.
+    """
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {modulo}:\n{processo.stderr}")
+
+    tempos = []
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:") :].split("|")
+        tempos.append(TempoImport(nome.strip(), int(proprio), int(acumulado)))
+    return tempos
+
+
+def tempo_total(tempos: list[TempoImport], modulo: str = MODULO_APLICACAO) -> float:
+    """Tempo acumulado, em segundos, do import de `modulo`."""
+    for tempo in reversed(tempos):
+        if tempo.modulo == modulo:
+            return tempo.acumulado_us / 1_000_000
+    raise ValueError(f"{modulo} não encontrado na medição.")
+
+
+def tempo_por_pacote(tempos: list[TempoImport]) -> dict[str, int]:
+    """Soma o tempo próprio dos módulos por pacote de primeiro nível."""
+    pacotes: dict[str, int] = defaultdict(int)
+    for tempo in tempos:
+        pacotes[tempo.modulo.split(".")[0]] += tempo.proprio_us
+    return dict(pacotes)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modulo", default=MODULO_APLICACAO)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    tempos = medir_imports(args.modulo)
+    print(f"Import de {args.modulo}: {tempo_total(tempos, args.modulo):.3f}s\n")
+
+    print(f"{'pacote':<40} {'próprio (ms)':>14}")
+    pacotes = sorted(tempo_por_pacote(tempos).items(), key=lambda p: -p[1])
+    for pacote, proprio in pacotes[: args.top]:
+        print(f"{pacote:<40} {proprio / 1000:>14.1f}")
+
+    print(f"\n{'módulo':<60} {'próprio (ms)':>14} {'acumulado (ms)':>16}")
+    for tempo in sorted(tempos, key=lambda t: -t.proprio_us)[: args.top]:
+        print(
+            f"{tempo.modulo:<60} {tempo.proprio_us / 1000:>14.1f} "
+            f"{tempo.acumulado_us / 1000:>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
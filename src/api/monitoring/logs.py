@@ -0,0 +1,126 @@
+"""
+Configuração dos logs da aplicação.
+
+Os registros vão para uma fila e são escritos no stderr por uma thread do
+loguru (`enqueue=True`): a requisição não espera pela escrita. Com `LOG_JSON`
+cada registro é um objeto JSON por linha, e os argumentos nomeados da chamada
+viram campos em `extra`. As mensagens usam a formatação adiada do loguru,
+
+    logger.info("{aluno_id} | Aluno deletado.", aluno_id=aluno_id)
+
+que só é feita quando o nível está habilitado no sink; valores caros de montar
+usam `logger.opt(lazy=True)`.
+
+Cada requisição recebe um id (o do cabeçalho `X-Request-ID`, quando válido) e
+uma decisão de amostragem, guardados em `ContextVar`s; nos traces amostrados
+cada registro também leva o `trace_id`. Registros abaixo de WARNING de
+requisições fora da amostra são descartados pelo filtro do sink, antes da
+serialização e da fila; avisos e erros sempre são escritos. O loguru formata a
+mensagem antes de aplicar os filtros, então a amostragem economiza a escrita,
+não a montagem do registro.
+"""
+
+import random
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from loguru import logger
+
+from src.api.config import Config
+
+CABECALHO_REQUEST_ID = "X-Request-ID"
+_REQUEST_ID_VALIDO = re.compile(r"[A-Za-z0-9._-]{1,128}")
+_NIVEL_SEMPRE_ESCRITO = logger.level("WARNING").no
+
+FORMATO_TEXTO = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | {extra[request_id]} | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+
+id_da_requisicao: ContextVar[Optional[str]] = ContextVar(
+    "id_da_requisicao", default=None
+)
+# Definido pelo tracing (`src.api.monitoring.tracing`) nos traces amostrados.
+id_do_trace: ContextVar[Optional[str]] = ContextVar("id_do_trace", default=None)
+_requisicao_amostrada: ContextVar[bool] = ContextVar(
+    "requisicao_amostrada", default=True
+)
+
+
+def taxas_de_amostragem(configuracao: str) -> list[tuple[str, float]]:
+    """
+    Lê `"/alunos=0.1,/tarefas=0.5"` como pares (prefixo da rota, fração das
+    requisições com logs INFO), do prefixo mais longo para o mais curto.
+    """
+    taxas = []
+    for item in configuracao.split(","):
+        if item.strip():
+            prefixo, _, taxa = item.partition("=")
+            taxas.append((prefixo.strip(), float(taxa)))
+    return sorted(taxas, key=lambda par: len(par[0]), reverse=True)
+
+
+_taxas = taxas_de_amostragem(Config.LOG_AMOSTRAGEM_ROTAS)
+
+
+def taxa_da_rota(caminho: str) -> float:
+    for prefixo, taxa in _taxas:
+        if caminho.startswith(prefixo):
+            return taxa
+    return Config.LOG_AMOSTRAGEM_INFO
+
+
+def iniciar_contexto(
+    caminho: str, request_id: Optional[str] = None
+) -> tuple[str, tuple]:
+    """
+    Define o id e a amostragem da requisição atual. Retorna o id usado e os
+    tokens a entregar para `encerrar_contexto`.
+    """
+    if not request_id or not _REQUEST_ID_VALIDO.fullmatch(request_id):
+        request_id = uuid.uuid4().hex
+    taxa = taxa_da_rota(caminho)
+    amostrada = taxa >= 1 or random.random() < taxa
+    return request_id, (
+        id_da_requisicao.set(request_id),
+        _requisicao_amostrada.set(amostrada),
+    )
+
+
+def encerrar_contexto(tokens: tuple) -> None:
+    token_id, token_amostrada = tokens
+    id_da_requisicao.reset(token_id)
+    _requisicao_amostrada.reset(token_amostrada)
+
+
+def _adicionar_contexto(record) -> None:
+    record["extra"].setdefault("request_id", id_da_requisicao.get() or "-")
+    trace_id = id_do_trace.get()
+    if trace_id is not None:
+        record["extra"].setdefault("trace_id", trace_id)
+
+
+def _filtrar(record) -> bool:
+    """Recebe o registro já formatado; descarta só a serialização e a escrita."""
+    return record["level"].no >= _NIVEL_SEMPRE_ESCRITO or _requisicao_amostrada.get()
+
+
+def configurar_logs() -> None:
+    """Substitui o sink padrão do loguru pelo sink assíncrono da aplicação."""
+    logger.remove()
+    logger.configure(patcher=_adicionar_contexto)
+    logger.add(
+        sys.stderr,
+        level=Config.LOG_LEVEL,
+        format=FORMATO_TEXTO,
+        serialize=Config.LOG_JSON,
+        filter=_filtrar,
+        enqueue=True,
+        backtrace=False,
+        diagnose=Config.DEBUG,
+    )
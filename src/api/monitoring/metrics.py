@@ -0,0 +1,286 @@
+"""
+Minimal Prometheus-compatible metrics registry.
+
+Metrics are kept in process memory and rendered in the Prometheus text
+exposition format by the `/metrics` route. Every worker process exposes its
+own values; aggregation across workers is left to the scraper.
+"""
+
+import math
+import threading
+from typing import Callable, Iterable, Optional
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+def _formatar_valor(valor: float) -> str:
+    if valor == math.inf:
+        return "+Inf"
+    if valor == int(valor):
+        return str(int(valor))
+    return repr(float(valor))
+
+
+def _formatar_labels(labels: Iterable[tuple[str, str]]) -> str:
+    pares = [
+        '{}="{}"'.format(
+            nome,
+            str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for nome, valor in labels
+    ]
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+class _Metric:
+    tipo: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[tuple, "_Metric"] = {}
+
+    def labels(self, **labels) -> "_Metric":
+        """Returns the child metric for the given label values."""
+        chave = tuple(str(labels[nome]) for nome in self.labelnames)
+        filho = self._children.get(chave)
+        if filho is None:
+            with self._lock:
+                filho = self._children.get(chave)
+                if filho is None:
+                    filho = self._novo_filho()
+                    self._children[chave] = filho
+        return filho
+
+    def _novo_filho(self) -> "_Metric":
+        raise NotImplementedError()
+
+    def _amostras(self) -> list[tuple[str, tuple, float]]:
+        raise NotImplementedError()
+
+    def collect(self) -> list[tuple[str, tuple, float]]:
+        if not self.labelnames:
+            return self._amostras()
+        amostras = []
+        for chave, filho in list(self._children.items()):
+            labels = tuple(zip(self.labelnames, chave))
+            for sufixo, extra, valor in filho._amostras():
+                amostras.append((sufixo, labels + extra, valor))
+        return amostras
+
+
+class Counter(_Metric):
+    tipo = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self._valor = 0.0
+
+    def _novo_filho(self) -> "Counter":
+        return Counter(self.name, self.documentation)
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._valor += amount
+
+    def _amostras(self):
+        return [("_total", (), self._valor)]
+
+
+class Gauge(_Metric):
+    tipo = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self._valor = 0.0
+        self._funcao: Optional[Callable[[], float]] = None
+
+    def _novo_filho(self) -> "Gauge":
+        return Gauge(self.name, self.documentation)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._valor = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._valor += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._valor -= amount
+
+    def set_function(self, funcao: Callable[[], float]) -> None:
+        """Computes the gauge value on every scrape instead of storing it."""
+        self._funcao = funcao
+
+    def _amostras(self):
+        if self._funcao is not None:
+            try:
+                return [("", (), float(self._funcao()))]
+            except Exception:
+                return []
+        return [("", (), self._valor)]
+
+
+class Histogram(_Metric):
+    tipo = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._contagens = [0] * len(self._buckets)
+        self._soma = 0.0
+
+    def _novo_filho(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, buckets=self._buckets[:-1])
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._soma += value
+            for indice, limite in enumerate(self._buckets):
+                if value <= limite:
+                    self._contagens[indice] += 1
+                    break
+
+    def _amostras(self):
+        amostras = []
+        acumulado = 0
+        for limite, contagem in zip(self._buckets, self._contagens):
+            acumulado += contagem
+            amostras.append(("_bucket", (("le", _formatar_valor(limite)),), acumulado))
+        amostras.append(("_count", (), acumulado))
+        amostras.append(("_sum", (), self._soma))
+        return amostras
+
+
+class Registry:
+    """Holds every metric exposed by the process."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Métrica {metric.name} já registrada.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Renders all metrics in the Prometheus text exposition format."""
+        linhas = []
+        for metric in self._metrics.values():
+            linhas.append(f"# HELP {metric.name} {metric.documentation}")
+            linhas.append(f"# TYPE {metric.name} {metric.tipo}")
+            for sufixo, labels, valor in metric.collect():
+                linhas.append(
+                    f"{metric.name}{sufixo}{_formatar_labels(labels)} "
+                    f"{_formatar_valor(valor)}"
+                )
+        return "\n".join(linhas) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: tuple = (),
+    buckets: tuple = DEFAULT_BUCKETS,
+) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# HTTP
+HTTP_REQUESTS = counter(
+    "http_requests",
+    "Total de requisições HTTP atendidas.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP por template de rota.",
+    ("method", "route"),
+)
+HTTP_REQUESTS_IN_PROGRESS = gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em andamento neste worker.",
+)
+
+# Banco de dados
+DB_QUERIES_PER_REQUEST = histogram(
+    "db_queries_per_request",
+    "Quantidade de comandos SQL emitidos por requisição.",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_POOL_SIZE = gauge("db_pool_size", "Tamanho configurado do pool de conexões.")
+DB_POOL_CHECKED_OUT = gauge(
+    "db_pool_checked_out", "Conexões do pool atualmente em uso."
+)
+DB_POOL_OVERFLOW = gauge(
+    "db_pool_overflow", "Conexões abertas além do tamanho do pool (overflow)."
+)
+DB_POOL_WAIT = histogram(
+    "db_pool_wait_seconds",
+    "Tempo para obter uma conexão do pool, incluindo a abertura de novas.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+# Cache
+CACHE_REQUESTS = counter(
+    "cache_requests", "Consultas ao cache de respostas.", ("result",)
+)
+
+# Bcrypt
+BCRYPT_QUEUE_DEPTH = gauge(
+    "bcrypt_pool_queue_depth",
+    "Operações de bcrypt aguardando uma thread livre no pool.",
+)
+BCRYPT_DURATION = histogram(
+    "bcrypt_operation_duration_seconds",
+    "Duração das operações de hash e verificação de senha.",
+    ("operation",),
+)
+
+# Mailer
+MAILER_MESSAGES = counter(
+    "mailer_messages", "Emails processados pelo mailer por resultado.", ("outcome",)
+)
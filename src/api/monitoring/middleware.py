@@ -0,0 +1,153 @@
+import time
+
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.config import Config
+from src.api.monitoring import metrics, tracing
+from src.api.monitoring.logs import (
+    CABECALHO_REQUEST_ID,
+    encerrar_contexto,
+    iniciar_contexto,
+)
+from src.api.monitoring.sql import (
+    EstatisticasConsultas,
+    encerrar_contagem,
+    iniciar_contagem,
+)
+
+ROTA_DESCONHECIDA = "<unmatched>"
+
+
+def template_da_rota(scope: Scope) -> str:
+    """
+    Retorna o template da rota atendida (ex.: `/tarefas/{tarefa_id}`), evitando
+    uma série de métricas por valor de parâmetro.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or ROTA_DESCONHECIDA
+
+
+def server_timing(estatisticas: EstatisticasConsultas, duracao_total: float) -> str:
+    """Monta o cabeçalho `Server-Timing` com o tempo de banco e o tempo total."""
+    return (
+        f"db;dur={estatisticas.tempo_total * 1000:.2f};"
+        f'desc="{estatisticas.quantidade} queries", '
+        f"total;dur={duracao_total * 1000:.2f}"
+    )
+
+
+def _reportar_n_mais_um(
+    metodo: str, rota: str, estatisticas: EstatisticasConsultas
+) -> None:
+    limite = Config.DB_CONFIG.DB_N_PLUS_ONE_THRESHOLD
+    for formato, vezes in estatisticas.formatos_repetidos(limite):
+        logger.warning(
+            f"Possível N+1 em {metodo} {rota}: comando repetido {vezes} vezes "
+            f"(limite {limite}): {formato[:300]}"
+        )
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mede latência, requisições em andamento e consultas
+    SQL por requisição, informando o tempo de banco no `Server-Timing`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        inicio = time.perf_counter()
+        estatisticas, token = iniciar_contagem()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    server_timing(estatisticas, time.perf_counter() - inicio),
+                )
+            await send(message)
+
+        metrics.HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duracao = time.perf_counter() - inicio
+            metrics.HTTP_REQUESTS_IN_PROGRESS.dec()
+            encerrar_contagem(token)
+
+            rota = template_da_rota(scope)
+            metodo = scope["method"]
+            metrics.HTTP_REQUEST_DURATION.labels(method=metodo, route=rota).observe(
+                duracao
+            )
+            metrics.HTTP_REQUESTS.labels(
+                method=metodo, route=rota, status=status_code
+            ).inc()
+            metrics.DB_QUERIES_PER_REQUEST.labels(route=rota).observe(
+                estatisticas.quantidade
+            )
+            if estatisticas.formatos:
+                _reportar_n_mais_um(metodo, rota, estatisticas)
+
+
+class ContextoDaRequisicaoMiddleware:
+    """
+    Middleware ASGI que associa um id e a decisão de amostragem dos logs a
+    cada requisição, devolvendo o id no cabeçalho `X-Request-ID`, e abre o
+    span SERVER da requisição quando o tracing está ativo.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        recebido = traceparent = None
+        for nome, valor in scope["headers"]:
+            if nome == b"x-request-id":
+                recebido = valor.decode("latin-1")
+            elif nome == b"traceparent":
+                traceparent = valor.decode("latin-1")
+        request_id, tokens = iniciar_contexto(scope["path"], recebido)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[CABECALHO_REQUEST_ID] = request_id
+            await send(message)
+
+        metodo = scope["method"]
+        try:
+            with tracing.iniciar_trace(
+                f"{metodo} {scope['path']}",
+                traceparent,
+                {"http.method": metodo, "http.request_id": request_id},
+            ) as span:
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                finally:
+                    if span is not None:
+                        rota = template_da_rota(scope)
+                        span.nome = f"{metodo} {rota}"
+                        span.atributos["http.route"] = rota
+                        span.atributos["http.status_code"] = status_code
+                        if status_code >= 500 and span.erro is None:
+                            span.erro = f"HTTP {status_code}"
+        finally:
+            encerrar_contexto(tokens)
@@ -0,0 +1,126 @@
+"""
+Profiler por amostragem, para diagnóstico de um worker em produção.
+
+Durante uma coleta, uma thread lê a pilha de cada thread do processo
+(`sys._current_frames`) a cada `intervalo` segundos e conta as pilhas iguais.
+O resultado sai no formato "collapsed" (uma pilha por linha, com os quadros
+separados por `;` da raiz para a folha, seguida do número de amostras), lido
+pelo `flamegraph.pl`, speedscope e similares. Fora de uma coleta não há custo
+algum: nada é registrado no interpretador.
+
+A coleta é disparada pela rota `/profiler` (só coordenadores, com
+`PROFILER_ATIVO`) ou pelo sinal `PROFILER_SINAL`, que grava o resultado em
+`PROFILER_DIRETORIO`.
+"""
+
+import asyncio
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from loguru import logger
+
+from src.api.config import Config
+
+# Uma coleta por processo: coletas simultâneas mediriam umas às outras.
+_coleta_em_andamento = threading.Lock()
+
+
+class ProfilerEmAndamentoError(Exception):
+    """Já existe uma coleta em andamento neste processo."""
+
+
+def _pilha(frame) -> list[str]:
+    quadros = []
+    while frame is not None:
+        codigo = frame.f_code
+        quadros.append(f"{frame.f_globals.get('__name__', '?')}:{codigo.co_name}")
+        frame = frame.f_back
+    quadros.reverse()
+    return quadros
+
+
+def _registrar_amostra(contagens: Counter, ignorada: int) -> None:
+    nomes = {thread.ident: thread.name for thread in threading.enumerate()}
+    for ident, frame in sys._current_frames().items():
+        if ident != ignorada:
+            pilha = [nomes.get(ident, str(ident))] + _pilha(frame)
+            contagens[";".join(pilha)] += 1
+
+
+def amostrar(segundos: float, intervalo: float = 0.005) -> Counter:
+    """
+    Conta as pilhas das threads do processo, exceto a que chama, por
+    `segundos` segundos. Cada pilha começa pelo nome da thread.
+    """
+    if not _coleta_em_andamento.acquire(blocking=False):
+        raise ProfilerEmAndamentoError()
+    try:
+        propria = threading.get_ident()
+        contagens: Counter = Counter()
+        fim = time.monotonic() + segundos
+        while time.monotonic() < fim:
+            _registrar_amostra(contagens, propria)
+            time.sleep(intervalo)
+        return contagens
+    finally:
+        _coleta_em_andamento.release()
+
+
+def formatar_collapsed(contagens: Counter) -> str:
+    return "".join(
+        f"{pilha} {amostras}\n" for pilha, amostras in contagens.most_common()
+    )
+
+
+async def coletar(segundos: float, intervalo: float = 0.005) -> str:
+    """Amostra em uma thread, sem bloquear o event loop que está sendo medido."""
+    contagens = await asyncio.get_running_loop().run_in_executor(
+        None, amostrar, segundos, intervalo
+    )
+    return formatar_collapsed(contagens)
+
+
+def _gravar_coleta(segundos: float) -> Optional[str]:
+    try:
+        contagens = amostrar(segundos)
+    except ProfilerEmAndamentoError:
+        logger.warning("Sinal do profiler ignorado: já há uma coleta em andamento.")
+        return None
+    diretorio = Config.PROFILER_DIRETORIO or tempfile.gettempdir()
+    caminho = os.path.join(
+        diretorio, f"profiler-{os.getpid()}-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+    )
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write(formatar_collapsed(contagens))
+    logger.info(f"Pilhas de {segundos}s gravadas em {caminho}.")
+    return caminho
+
+
+def _ao_receber_sinal(numero, frame) -> None:
+    threading.Thread(
+        target=_gravar_coleta,
+        args=(Config.PROFILER_SEGUNDOS_SINAL,),
+        name="profiler",
+        daemon=True,
+    ).start()
+
+
+def instalar_sinal() -> None:
+    """
+    Registra `PROFILER_SINAL` (ex.: `SIGUSR2`), quando configurado: cada sinal
+    recebido coleta `PROFILER_SEGUNDOS_SINAL` segundos de pilhas deste worker.
+    Precisa ser chamada na thread principal.
+    """
+    if not Config.PROFILER_SINAL:
+        return
+    numero = getattr(signal, Config.PROFILER_SINAL, None)
+    if numero is None:
+        logger.warning(f"PROFILER_SINAL desconhecido: {Config.PROFILER_SINAL}.")
+        return
+    signal.signal(numero, _ao_receber_sinal)
@@ -0,0 +1,149 @@
+"""
+Verificação de prontidão (readiness) da instância.
+
+Diferente do `/health-check`, que apenas indica que o processo responde, a
+prontidão confirma que o banco atende dentro do tempo limite, que o schema
+está na última migração do Alembic e que o pool de conexões não está
+esgotado. O resultado fica em cache por alguns segundos para que as sondas
+do balanceador não gerem carga no banco.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.api.config import Config
+
+ALEMBIC_SCRIPT_LOCATION = Path(__file__).parent.parent / "database" / "alembic"
+
+_ultimas_execucoes_workers: dict[str, datetime] = {}
+
+
+def registrar_execucao_worker(nome: str) -> None:
+    """Registra o instante da última execução completa de um worker."""
+    _ultimas_execucoes_workers[nome] = datetime.utcnow()
+
+
+def _revisoes_head() -> set[str]:
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory(str(ALEMBIC_SCRIPT_LOCATION)).get_heads())
+
+
+def saturacao_do_pool(engine: AsyncEngine) -> Optional[float]:
+    """
+    Retorna a fração das conexões disponíveis (pool + overflow) em uso, ou
+    `None` quando a engine não usa um pool com tamanho fixo.
+    """
+    pool = engine.pool
+    if not hasattr(pool, "checkedout") or not hasattr(pool, "_max_overflow"):
+        return None
+    capacidade = pool.size() + max(pool._max_overflow, 0)
+    if capacidade <= 0:
+        return None
+    return pool.checkedout() / capacidade
+
+
+class VerificadorProntidao:
+    """Executa as verificações de prontidão e mantém o último resultado."""
+
+    def __init__(self, obter_engine: Callable[[], AsyncEngine]):
+        self._obter_engine = obter_engine
+        self._heads: Optional[set[str]] = None
+        self._resultado: Optional[dict] = None
+        self._verificado_em: float = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop_do_lock: Optional[asyncio.AbstractEventLoop] = None
+
+    async def verificar(self) -> dict:
+        if self._resultado_valido():
+            return self._resultado
+        async with self._lock_do_loop():
+            if not self._resultado_valido():
+                self._resultado = await self._executar_verificacoes()
+                self._verificado_em = time.monotonic()
+        return self._resultado
+
+    def _lock_do_loop(self) -> asyncio.Lock:
+        # No Python 3.9 o lock fica preso ao event loop em que foi criado; o
+        # verificador é global e pode ser usado por mais de um loop.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or loop is not self._loop_do_lock:
+            self._lock = asyncio.Lock()
+            self._loop_do_lock = loop
+        return self._lock
+
+    def _resultado_valido(self) -> bool:
+        return (
+            self._resultado is not None
+            and time.monotonic() - self._verificado_em < Config.READINESS_CACHE_SECONDS
+        )
+
+    async def _executar_verificacoes(self) -> dict:
+        banco, migracoes = await self._verificar_banco()
+        pool = self._verificar_pool()
+        pronto = banco["ok"] and migracoes["ok"] and pool["ok"]
+        return {
+            "status": "ready" if pronto else "unavailable",
+            "checked_at": datetime.utcnow().isoformat(),
+            "checks": {
+                "database": banco,
+                "migrations": migracoes,
+                "pool": pool,
+                "workers": {
+                    nome: ultima_execucao.isoformat()
+                    for nome, ultima_execucao in _ultimas_execucoes_workers.items()
+                },
+            },
+        }
+
+    async def _verificar_banco(self) -> tuple[dict, dict]:
+        inicio = time.perf_counter()
+        try:
+            revisoes_banco = await asyncio.wait_for(
+                self._consultar_banco(), timeout=Config.READINESS_DB_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            erro = {"ok": False, "error": "timeout"}
+            return erro, {"ok": False, "error": "database unavailable"}
+        except Exception as e:
+            erro = {"ok": False, "error": type(e).__name__}
+            return erro, {"ok": False, "error": "database unavailable"}
+
+        latencia_ms = round((time.perf_counter() - inicio) * 1000, 2)
+        banco = {"ok": True, "latency_ms": latencia_ms}
+        return banco, self._comparar_migracoes(revisoes_banco)
+
+    async def _consultar_banco(self) -> set[str]:
+        async with self._obter_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            try:
+                resultado = await conn.execute(
+                    text("SELECT version_num FROM alembic_version")
+                )
+            except Exception:
+                return set()
+            return {linha[0] for linha in resultado}
+
+    def _comparar_migracoes(self, revisoes_banco: set[str]) -> dict:
+        if self._heads is None:
+            self._heads = _revisoes_head()
+        return {
+            "ok": revisoes_banco == self._heads,
+            "database": sorted(revisoes_banco),
+            "head": sorted(self._heads),
+        }
+
+    def _verificar_pool(self) -> dict:
+        saturacao = saturacao_do_pool(self._obter_engine())
+        if saturacao is None:
+            return {"ok": True, "saturation": None}
+        return {
+            "ok": saturacao < Config.READINESS_MAX_POOL_SATURATION,
+            "saturation": round(saturacao, 3),
+        }
@@ -0,0 +1,153 @@
+"""
+Instrumentação dos comandos SQL emitidos durante cada requisição.
+
+Os eventos da engine atribuem cada comando à requisição atual por meio de
+uma `ContextVar`, acumulando quantidade e tempo total de banco; com o tracing
+ativo, cada comando também vira um span. Quando `DB_N_PLUS_ONE_THRESHOLD` é
+maior que zero, também são contados os formatos de comando repetidos,
+permitindo detectar padrões N+1.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.api.config import Config
+from src.api.monitoring import tracing
+
+_ESPACOS = re.compile(r"\s+")
+_PARAMETRO = r"\s*(?:\?|%s|\$\d+|:\w+)\s*"
+_LISTA_DE_PARAMETROS = re.compile(rf"\((?:{_PARAMETRO},)+{_PARAMETRO}\)")
+_NUMEROS = re.compile(r"\b\d+\b")
+
+
+class EstatisticasConsultas:
+    """Acumula os comandos SQL executados em uma requisição."""
+
+    __slots__ = ("quantidade", "tempo_total", "formatos")
+
+    def __init__(self):
+        self.quantidade: int = 0
+        self.tempo_total: float = 0.0
+        self.formatos: Optional[Counter] = (
+            Counter() if Config.DB_CONFIG.DB_N_PLUS_ONE_THRESHOLD > 0 else None
+        )
+
+    def formatos_repetidos(self, limite: int) -> list[tuple[str, int]]:
+        """Retorna os formatos de comando executados mais de `limite` vezes."""
+        if not self.formatos:
+            return []
+        return [
+            (formato, vezes)
+            for formato, vezes in self.formatos.most_common()
+            if vezes > limite
+        ]
+
+
+_estatisticas_atuais: ContextVar[Optional[EstatisticasConsultas]] = ContextVar(
+    "estatisticas_consultas", default=None
+)
+
+_capturas_ativas: list[list[str]] = []
+_capturas_lock = threading.Lock()
+
+
+def formato_do_comando(statement: str) -> str:
+    """
+    Normaliza um comando SQL, removendo literais e listas de parâmetros
+    expandidas, para que consultas iguais com valores diferentes coincidam.
+    """
+    formato = _ESPACOS.sub(" ", statement).strip()
+    formato = _LISTA_DE_PARAMETROS.sub("(?)", formato)
+    return _NUMEROS.sub("N", formato)
+
+
+def iniciar_contagem() -> tuple[EstatisticasConsultas, object]:
+    """Inicia a contagem de consultas para o contexto atual."""
+    estatisticas = EstatisticasConsultas()
+    return estatisticas, _estatisticas_atuais.set(estatisticas)
+
+
+def encerrar_contagem(token) -> None:
+    _estatisticas_atuais.reset(token)
+
+
+def estatisticas_atuais() -> Optional[EstatisticasConsultas]:
+    return _estatisticas_atuais.get()
+
+
+@contextmanager
+def capturar_consultas() -> Iterator[list[str]]:
+    """
+    Captura todos os comandos SQL executados no processo enquanto o contexto
+    estiver ativo, independente da requisição ou thread que os emitiu.
+    """
+    comandos: list[str] = []
+    with _capturas_lock:
+        _capturas_ativas.append(comandos)
+    try:
+        yield comandos
+    finally:
+        with _capturas_lock:
+            _capturas_ativas.remove(comandos)
+
+
+def _antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("inicio_consultas", []).append(time.perf_counter())
+
+
+def _registrar(conn, statement: str, erro: Optional[str] = None) -> None:
+    inicios = conn.info.get("inicio_consultas")
+    duracao = time.perf_counter() - inicios.pop() if inicios else 0.0
+
+    if tracing.ativo():
+        tracing.registrar_span(
+            (statement.split(None, 1) or ["SQL"])[0].upper(),
+            tracing.CLIENTE,
+            duracao,
+            {"db.system": conn.dialect.name, "db.statement": statement[:2000]},
+            erro,
+        )
+
+    estatisticas = _estatisticas_atuais.get()
+    if estatisticas is not None:
+        estatisticas.quantidade += 1
+        estatisticas.tempo_total += duracao
+        if estatisticas.formatos is not None:
+            estatisticas.formatos[formato_do_comando(statement)] += 1
+
+    if _capturas_ativas:
+        with _capturas_lock:
+            for comandos in _capturas_ativas:
+                comandos.append(statement)
+
+
+def _depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+    _registrar(conn, statement)
+
+
+def _ao_falhar(contexto_excecao) -> None:
+    if contexto_excecao.connection is not None and contexto_excecao.statement:
+        _registrar(
+            contexto_excecao.connection,
+            contexto_excecao.statement,
+            type(contexto_excecao.original_exception).__name__,
+        )
+
+
+def instrumentar_engine(engine: Engine) -> None:
+    """Registra os eventos de instrumentação na engine síncrona informada."""
+    for nome, funcao in (
+        ("before_cursor_execute", _antes_de_executar),
+        ("after_cursor_execute", _depois_de_executar),
+        ("handle_error", _ao_falhar),
+    ):
+        if not event.contains(engine, nome, funcao):
+            event.listen(engine, nome, funcao)
@@ -0,0 +1,365 @@
+"""
+Tracing das requisições, exportado no formato do OpenTelemetry (OTLP/JSON).
+
+Cada requisição abre um span SERVER, e os métodos dos serviços, os comandos
+SQL, o bcrypt e as chamadas HTTP externas (Lattes, SendGrid) abrem spans
+filhos. O contexto chega no cabeçalho W3C `traceparent` e é repassado, junto
+com o `X-Request-ID`, nas chamadas externas; o `trace_id` acompanha os logs.
+
+Os spans concluídos ficam em um buffer limitado e uma thread os exporta em
+lotes para `TRACING_ARQUIVO` (um lote OTLP/JSON por linha) e/ou para o
+coletor OTLP/HTTP em `TRACING_COLETOR` (ex.: `http://localhost:4318/v1/traces`).
+Com o tracing desativado (padrão), `iniciar_span` só consulta uma variável.
+"""
+
+import functools
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from loguru import logger
+
+from src.api.config import Config
+from src.api.monitoring.logs import CABECALHO_REQUEST_ID, id_da_requisicao, id_do_trace
+
+INTERNO, SERVIDOR, CLIENTE = 1, 2, 3
+_STATUS_ERRO = 2
+_TRACEPARENT = re.compile(r"00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+_ID_NULO = re.compile(r"0+")
+
+
+class Span:
+    """Operação medida dentro de um trace."""
+
+    __slots__ = (
+        "nome",
+        "tipo",
+        "trace_id",
+        "span_id",
+        "pai_id",
+        "inicio_ns",
+        "fim_ns",
+        "atributos",
+        "erro",
+    )
+
+    def __init__(
+        self,
+        nome: str,
+        tipo: int,
+        trace_id: str,
+        pai_id: Optional[str],
+        atributos: Optional[dict] = None,
+    ):
+        self.nome = nome
+        self.tipo = tipo
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.pai_id = pai_id
+        self.inicio_ns = time.time_ns()
+        self.fim_ns = 0
+        self.atributos = atributos or {}
+        self.erro: Optional[str] = None
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def como_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.nome,
+            "kind": self.tipo,
+            "startTimeUnixNano": str(self.inicio_ns),
+            "endTimeUnixNano": str(self.fim_ns),
+            "attributes": [
+                {"key": chave, "value": _valor_otlp(valor)}
+                for chave, valor in self.atributos.items()
+            ],
+        }
+        if self.pai_id:
+            span["parentSpanId"] = self.pai_id
+        if self.erro is not None:
+            span["status"] = {"code": _STATUS_ERRO, "message": self.erro}
+        return span
+
+
+def _valor_otlp(valor) -> dict:
+    if isinstance(valor, bool):
+        return {"boolValue": valor}
+    if isinstance(valor, int):
+        return {"intValue": str(valor)}
+    if isinstance(valor, float):
+        return {"doubleValue": valor}
+    return {"stringValue": str(valor)}
+
+
+# Marca um trace recebido ou iniciado aqui que ficou fora da amostra: os spans
+# filhos também não são registrados.
+_NAO_AMOSTRADO = object()
+
+_span_atual: ContextVar[Optional[object]] = ContextVar("span_atual", default=None)
+
+
+class ExportadorOTLP:
+    """Buffer dos spans concluídos, exportado em lotes por uma thread."""
+
+    def __init__(
+        self,
+        arquivo: str = "",
+        coletor: str = "",
+        nome_servico: str = "pgcop-api",
+        intervalo: float = 5,
+        tamanho_do_lote: int = 512,
+    ):
+        self.arquivo = arquivo
+        self.coletor = coletor
+        self.nome_servico = nome_servico
+        self.intervalo = intervalo
+        self.tamanho_do_lote = tamanho_do_lote
+        self.descartados = 0
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._evento = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def adicionar(self, span: Span) -> None:
+        with self._lock:
+            if len(self._spans) >= 10 * self.tamanho_do_lote:
+                self.descartados += 1
+                return
+            self._spans.append(span)
+            cheio = len(self._spans) >= self.tamanho_do_lote
+        if cheio:
+            self._evento.set()
+
+    def iniciar(self) -> None:
+        self._thread = threading.Thread(
+            target=self._executar, name="tracing", daemon=True
+        )
+        self._thread.start()
+
+    def _executar(self) -> None:
+        while True:
+            self._evento.wait(self.intervalo)
+            self._evento.clear()
+            self.exportar()
+
+    def lote_otlp(self, spans: list[Span]) -> dict:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.nome_servico},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.como_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def exportar(self) -> int:
+        """Exporta os spans acumulados; retorna quantos foram exportados."""
+        with self._lock:
+            spans, self._spans = self._spans, []
+        if not spans:
+            return 0
+        corpo = json.dumps(self.lote_otlp(spans), separators=(",", ":"))
+        if self.arquivo:
+            try:
+                with open(self.arquivo, "a", encoding="utf-8") as arquivo:
+                    arquivo.write(corpo + "\n")
+            except OSError as e:
+                logger.warning(f"Falha ao gravar spans em {self.arquivo}: {e}")
+        if self.coletor:
+            requisicao = urllib.request.Request(
+                self.coletor,
+                data=corpo.encode(),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            try:
+                urllib.request.urlopen(requisicao, timeout=5).close()
+            except OSError as e:
+                logger.warning(f"Falha ao enviar spans para {self.coletor}: {e}")
+        return len(spans)
+
+
+_exportador: Optional[ExportadorOTLP] = None
+
+
+def ativo() -> bool:
+    return _exportador is not None
+
+
+def configurar_tracing(exportador: Optional[ExportadorOTLP] = None) -> None:
+    """
+    Ativa o tracing quando `TRACING_ATIVO`, ou com o exportador informado
+    (que não inicia a thread de exportação).
+    """
+    global _exportador
+    if exportador is not None:
+        _exportador = exportador
+        return
+    if not Config.TRACING_ATIVO or _exportador is not None:
+        return
+    _exportador = ExportadorOTLP(
+        arquivo=Config.TRACING_ARQUIVO,
+        coletor=Config.TRACING_COLETOR,
+        nome_servico=Config.TRACING_NOME_SERVICO,
+        intervalo=Config.TRACING_INTERVALO_SEGUNDOS,
+        tamanho_do_lote=Config.TRACING_TAMANHO_DO_LOTE,
+    )
+    _exportador.iniciar()
+
+
+def encerrar_tracing() -> None:
+    """Exporta os spans pendentes e desativa o tracing."""
+    global _exportador
+    if _exportador is not None:
+        _exportador.exportar()
+        _exportador = None
+
+
+def ler_traceparent(valor: Optional[str]) -> Optional[tuple[str, str, bool]]:
+    """`(trace_id, span_id, amostrado)` de um cabeçalho `traceparent` válido."""
+    if not valor:
+        return None
+    match = _TRACEPARENT.fullmatch(valor.strip())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if _ID_NULO.fullmatch(trace_id) or _ID_NULO.fullmatch(span_id):
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 1)
+
+
+@contextmanager
+def iniciar_trace(
+    nome: str, traceparent: Optional[str] = None, atributos: Optional[dict] = None
+) -> Iterator[Optional[Span]]:
+    """
+    Abre o span SERVER de uma requisição, continuando o trace do
+    `traceparent` recebido ou iniciando um novo, conforme a amostragem.
+    """
+    if _exportador is None:
+        yield None
+        return
+    remoto = ler_traceparent(traceparent)
+    if remoto is not None:
+        trace_id, pai_id, amostrado = remoto
+    else:
+        trace_id, pai_id = f"{random.getrandbits(128):032x}", None
+        amostrado = random.random() < Config.TRACING_AMOSTRAGEM
+    if not amostrado:
+        token = _span_atual.set(_NAO_AMOSTRADO)
+        try:
+            yield None
+        finally:
+            _span_atual.reset(token)
+        return
+
+    span = Span(nome, SERVIDOR, trace_id, pai_id, atributos)
+    token = _span_atual.set(span)
+    token_trace = id_do_trace.set(trace_id)
+    try:
+        yield span
+    except BaseException as e:
+        span.erro = type(e).__name__
+        raise
+    finally:
+        id_do_trace.reset(token_trace)
+        _span_atual.reset(token)
+        _concluir(span)
+
+
+@contextmanager
+def iniciar_span(
+    nome: str, tipo: int = INTERNO, atributos: Optional[dict] = None
+) -> Iterator[Optional[Span]]:
+    """
+    Abre um span filho do span atual. Fora de um trace amostrado (tracing
+    desativado, trabalhos em segundo plano) não registra nada.
+    """
+    pai = _span_atual.get() if _exportador is not None else None
+    if not isinstance(pai, Span):
+        yield None
+        return
+    span = Span(nome, tipo, pai.trace_id, pai.span_id, atributos)
+    token = _span_atual.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.erro = type(e).__name__
+        raise
+    finally:
+        _span_atual.reset(token)
+        _concluir(span)
+
+
+def registrar_span(
+    nome: str,
+    tipo: int,
+    duracao: float,
+    atributos: Optional[dict] = None,
+    erro: Optional[str] = None,
+) -> None:
+    """Registra um span já concluído, terminado agora e com a duração informada."""
+    pai = _span_atual.get() if _exportador is not None else None
+    if not isinstance(pai, Span):
+        return
+    span = Span(nome, tipo, pai.trace_id, pai.span_id, atributos)
+    span.fim_ns = time.time_ns()
+    span.inicio_ns = span.fim_ns - int(duracao * 1e9)
+    span.erro = erro
+    _exportador.adicionar(span)
+
+
+def _concluir(span: Span) -> None:
+    span.fim_ns = time.time_ns()
+    exportador = _exportador
+    if exportador is not None:
+        exportador.adicionar(span)
+
+
+def rastrear(nome: str):
+    """Decorator que executa a corrotina decorada em um span `nome`."""
+
+    def decorator(funcao):
+        @functools.wraps(funcao)
+        async def wrapper(*args, **kwargs):
+            if _exportador is None:
+                return await funcao(*args, **kwargs)
+            with iniciar_span(nome):
+                return await funcao(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def cabecalhos_de_propagacao() -> dict[str, str]:
+    """Cabeçalhos para repassar o trace e o id da requisição a outro serviço."""
+    cabecalhos = {}
+    request_id = id_da_requisicao.get()
+    if request_id:
+        cabecalhos[CABECALHO_REQUEST_ID] = request_id
+    span = _span_atual.get()
+    if isinstance(span, Span):
+        cabecalhos["traceparent"] = span.traceparent()
+    return cabecalhos
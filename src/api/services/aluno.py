@@ -4,22 +4,21 @@ from typing import List
 from fastapi import Depends
 from fastapi_cache.decorator import cache
 from loguru import logger
-from passlib.context import CryptContext
 
 from src.api.config import Config
 from src.api.database.models.aluno import Aluno
-from src.api.database.models.tarefa import Tarefa
+from src.api.database.models.progresso_aluno import ProgressoAluno
 from src.api.database.models.usuario import Usuario
 from src.api.database.repository import PGCopRepository
 from src.api.entrypoints.alunos.schema import AlunoAtualizado, AlunoInDB, AlunoNovo
 from src.api.entrypoints.professores.schema import ProfessorInDB
+from src.api.exceptions.http_service_exception import AlunoNaoEncontradoException
 from src.api.services.auth import ServicoAuth, oauth2_scheme
 from src.api.services.servico_base import ServicoBase
 from src.api.services.solicitacao import ServicoSolicitacao
 from src.api.services.tarefa import ServiceTarefa
 from src.api.services.usuario import ServicoUsuario
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.api.utils.senha import gerar_hash_senha
 
 
 class ServicoAluno(ServicoBase):
@@ -30,7 +29,7 @@ class ServicoAluno(ServicoBase):
         email = await ServicoAuth(self._repo).verificar_token(token)
         logger.info("Token verificado com sucesso.")
         db_aluno: Aluno = await self.buscar_por_email(email)
-        logger.info(f"{db_aluno.id=} | Aluno encontrado com sucesso.")
+        logger.info("{aluno_id} | Aluno encontrado com sucesso.", aluno_id=db_aluno.id)
         return self.tipo_usuario_in_db(db_aluno)
 
     async def criar(self, novo_aluno: AlunoNovo) -> AlunoInDB:
@@ -38,7 +37,10 @@ class ServicoAluno(ServicoBase):
         await self._validador.validar_novo_aluno(novo_aluno)
 
         db_usuario_aluno: Usuario = await ServicoUsuario(self._repo).criar(novo_aluno)
-        logger.info(f"{db_usuario_aluno.id=} | Usuário criado com sucesso.")
+        logger.info(
+            "{usuario_id} | Usuário criado com sucesso.",
+            usuario_id=db_usuario_aluno.id,
+        )
 
         db_aluno = Aluno(
             cpf=novo_aluno.cpf,
@@ -53,10 +55,13 @@ class ServicoAluno(ServicoBase):
             usuario_id=db_usuario_aluno.id,
         )
         await self._repo.criar(db_aluno)
+        await self._repo.criar(ProgressoAluno(aluno_id=db_aluno.id))
         await ServiceTarefa(self._repo).criar_tarefas_para_novo_aluno(db_aluno)
 
         logger.info(
-            f"{db_aluno.id=} {db_aluno.orientador_id=} | Aluno criado com sucesso."
+            "{aluno_id} {orientador_id} | Aluno criado com sucesso.",
+            aluno_id=db_aluno.id,
+            orientador_id=db_aluno.orientador_id,
         )
         await ServicoSolicitacao(self._repo).criar(db_aluno, novo_aluno.orientador_id)
         return self.tipo_usuario_in_db(db_aluno)
@@ -85,11 +90,11 @@ class ServicoAluno(ServicoBase):
         )
 
     async def buscar_aluno_por_id(self, aluno_id: int) -> Aluno:
-        logger.info(f"Buscando aluno por id {aluno_id=}")
+        logger.info("Buscando aluno por id {aluno_id}", aluno_id=aluno_id)
         db_aluno: Aluno = await self._repo.buscar_por_id(aluno_id, Aluno)
-        logger.info(f"{db_aluno.id=} | Aluno encontrado com sucesso.")
+        logger.info("{aluno_id} | Aluno encontrado com sucesso.", aluno_id=db_aluno.id)
         self._validador.validar_aluno_existe(db_aluno)
-        logger.info(f"{db_aluno.id=} | Aluno validado com sucesso.")
+        logger.info("{aluno_id} | Aluno validado com sucesso.", aluno_id=db_aluno.id)
         return db_aluno
 
     async def atualizar(
@@ -117,31 +122,30 @@ class ServicoAluno(ServicoBase):
         )
         db_aluno.usuario.nome = aluno_atualizado.nome or db_aluno.usuario.nome
         db_aluno.usuario.email = aluno_atualizado.email or db_aluno.usuario.email
-        db_aluno.usuario.senha_hash = (
-            pwd_context.hash(aluno_atualizado.senha)
-            if aluno_atualizado.senha
-            else db_aluno.usuario.senha_hash
-        )
+        if aluno_atualizado.senha:
+            db_aluno.usuario.senha_hash = await gerar_hash_senha(aluno_atualizado.senha)
+            db_aluno.usuario.senha_alterada_em = datetime.utcnow()
         return self.tipo_usuario_in_db(db_aluno)
 
     async def deletar(self, aluno_id: int) -> None:
-        logger.info(f"Deletando aluno {aluno_id=}")
-        aluno: Aluno = await self.buscar_aluno_por_id(aluno_id)
-        logger.info(f"Tarefas do {aluno.id=}: {aluno.tarefas=}")
-        tarefas: list[Tarefa] = aluno.tarefas or []
-        logger.info(f"{aluno.id=} | Deleteando tarefas do aluno")
-        for tarefa in tarefas:
-            tarefa.deleted_at = datetime.utcnow()
-        aluno.deleted_at = datetime.utcnow()
-        aluno.usuario.deleted_at = datetime.utcnow()
-        logger.info(f"{aluno.id=} | Aluno deletado com sucesso.")
+        logger.info("Deletando aluno {aluno_id}", aluno_id=aluno_id)
+        usuario_id = await self._repo.buscar_usuario_id(Aluno, aluno_id)
+        if usuario_id is None:
+            raise AlunoNaoEncontradoException()
+        logger.info(
+            "{aluno_id} | Deletando aluno, usuário e tarefas do aluno",
+            aluno_id=aluno_id,
+        )
+        await self._repo.remover_aluno_em_cascata(aluno_id, usuario_id)
+        logger.info("{aluno_id} | Aluno deletado com sucesso.", aluno_id=aluno_id)
 
     @cache(expire=60 * Config.MINUTOS_DE_CACHE_REQUISICOES)
-    async def buscar_alunos_por_orientador(self, orientador_id: int) -> List[AlunoInDB]:
-        alunos: List[Aluno] = await self._repo.buscar_todos_orientandos_de_um_professor(
+    async def buscar_alunos_por_orientador(self, orientador_id: int) -> List[dict]:
+        """Orientandos no formato de `AlunoInDB`, a partir do modelo de leitura."""
+        alunos = await self._repo.buscar_leitura_orientandos_de_um_professor(
             orientador_id
         )
-        return [self.tipo_usuario_in_db(aluno) for aluno in alunos]
+        return [aluno.como_dict() for aluno in alunos]
 
     async def buscar_por_email(self, email: str) -> Aluno:
         db_aluno: Aluno = await self._repo.buscar_aluno_por_email(email)
@@ -165,19 +169,23 @@ class ServicoAluno(ServicoBase):
         return self.tipo_usuario_in_db(await self.buscar_por_email(email))
 
     async def remover_orientador(self, aluno_id: int) -> AlunoInDB:
-        logger.info(f"Removendo orientador do {aluno_id=}")
+        logger.info("Removendo orientador do aluno {aluno_id}", aluno_id=aluno_id)
         db_aluno: Aluno = await self.buscar_aluno_por_id(aluno_id)
         logger.info(
-            f"{db_aluno.id=} | Orientador antes da remoção: {db_aluno.orientador_id=}"
+            "{aluno_id} | Orientador antes da remoção: {orientador_id}",
+            aluno_id=db_aluno.id,
+            orientador_id=db_aluno.orientador_id,
         )
         db_aluno.orientador_id = Config.SEM_ORIENTADOR_ID
         logger.info(
-            f"{db_aluno.id=} | Orientador após a remoção: {db_aluno.orientador_id=}"
+            "{aluno_id} | Orientador após a remoção: {orientador_id}",
+            aluno_id=db_aluno.id,
+            orientador_id=db_aluno.orientador_id,
         )
         await self._repo.salvar(db_aluno)
         logger.info(
-            f"{db_aluno.id=} {db_aluno.orientador_id=} "
-            f"{db_aluno.orientador.usuario.nome=} "
-            "| Alteração sincronizada com o banco."
+            "{aluno_id} {orientador_id} | Alteração sincronizada com o banco.",
+            aluno_id=db_aluno.id,
+            orientador_id=db_aluno.orientador_id,
         )
         return self.tipo_usuario_in_db(db_aluno)
@@ -1,35 +1,34 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import uuid4
 
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from src.api.config import Config
 from src.api.database.models.usuario import Usuario
 from src.api.database.repository import PGCopRepository
-from src.api.entrypoints.token.schema import Token
+from src.api.database.revogacao import lista_de_revogacao
+from src.api.entrypoints.token.schema import Token, TokenType
 from src.api.exceptions.credentials_exception import CredenciaisInvalidasException
 from src.api.services.servico_base import ServicoBase
 from src.api.services.usuario import ServicoUsuario
+from src.api.utils.senha import gerar_hash_senha, verificar_hash_senha
+from src.api.utils.tokens import TokenInvalidoError, codificar_token, decodificar_token
 
 # Instanciando o OAuth2PasswordBearer
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-# Configuração do hash de senha
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class ServicoAuth(ServicoBase):
     _repo: PGCopRepository
 
-    def verificar_senha(self, senha_plana: str, senha_hashed: str) -> bool:
+    async def verificar_senha(self, senha_plana: str, senha_hashed: str) -> bool:
         """Verifica se uma senha plana corresponde à sua versão hasheada."""
-        return pwd_context.verify(senha_plana, senha_hashed)
+        return await verificar_hash_senha(senha_plana, senha_hashed)
 
-    def gerar_senha_hash(self, senha: str) -> str:
+    async def gerar_senha_hash(self, senha: str) -> str:
         """Gera um hash para uma senha."""
-        return pwd_context.hash(senha)
+        return await gerar_hash_senha(senha)
 
     def criar_access_token(
         self,
@@ -47,43 +46,123 @@ class ServicoAuth(ServicoBase):
             expire = datetime.utcnow() + timedelta(
                 minutes=Config.AUTH.ACCESS_TOKEN_EXPIRE_MINUTES
             )
-        to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(
-            to_encode, Config.AUTH.SECRET_KEY, algorithm=Config.AUTH.ALGORITHM
+        to_encode.update(
+            {"exp": expire, "jti": uuid4().hex, "token_type": TokenType.ACCESS.value}
+        )
+        return codificar_token(to_encode)
+
+    def criar_refresh_token(self, email: str, tipo_usuario: str) -> str:
+        """Cria o refresh token, de uso único, que renova o access token."""
+        agora = datetime.utcnow()
+        expire = agora + timedelta(days=Config.AUTH.REFRESH_TOKEN_EXPIRE_DAYS)
+        return codificar_token(
+            {
+                "sub": email,
+                "type": tipo_usuario,
+                "iat": agora,
+                "exp": expire,
+                "jti": uuid4().hex,
+                "token_type": TokenType.REFRESH.value,
+            }
         )
-        return encoded_jwt
 
     async def verificar_token(self, token: str) -> str:
         """Verifica um token JWT e extrai o identificador do usuário."""
         try:
-            payload = jwt.decode(
-                token, Config.AUTH.SECRET_KEY, algorithms=[Config.AUTH.ALGORITHM]
-            )
-            email: str = payload.get("sub")
-            if email is None:
-                raise CredenciaisInvalidasException()
-        except JWTError:
+            payload = decodificar_token(token)
+        except TokenInvalidoError:
+            raise CredenciaisInvalidasException()
+        email: str = payload.get("sub")
+        if (
+            email is None
+            or payload.get("token_type") == TokenType.REFRESH.value
+            or payload.get("jti") in lista_de_revogacao
+        ):
             raise CredenciaisInvalidasException()
         return email
 
     async def autenticar_usuario(self, email: str, password: str) -> Usuario:
         usuario: Usuario = await ServicoUsuario(self._repo).buscar_por_email(email)
-        if not self.verificar_senha(password, usuario.senha_hash):
+        if not await self.verificar_senha(password, usuario.senha_hash):
             raise CredenciaisInvalidasException()
         return usuario
 
-    async def login_para_acessar_token(self, email: str, senha: str):
-        usuario: Usuario = await self.autenticar_usuario(email, senha)
+    def _emitir_tokens(self, email: str, tipo_usuario: str) -> Token:
         access_token_expires = timedelta(
             minutes=Config.AUTH.ACCESS_TOKEN_EXPIRE_MINUTES
         )
         access_token = self.criar_access_token(
-            data={"sub": usuario.email, "type": usuario.tipo_usuario.titulo},
+            data={"sub": email, "type": tipo_usuario},
             expires_delta=access_token_expires,
         )
 
         return Token(
             access_token=access_token,
+            refresh_token=self.criar_refresh_token(email, tipo_usuario),
             token_type="bearer",
             expiration_date=datetime.utcnow() + access_token_expires,
         )
+
+    async def login_para_acessar_token(self, email: str, senha: str):
+        usuario: Usuario = await self.autenticar_usuario(email, senha)
+        return self._emitir_tokens(usuario.email, usuario.tipo_usuario.titulo)
+
+    async def _revogar(self, payload: dict) -> bool:
+        jti, exp = payload.get("jti"), payload.get("exp")
+        if jti is None or exp is None:
+            return False
+        expira_em = datetime.utcfromtimestamp(exp)
+        if not await self._repo.revogar_token(jti, expira_em):
+            return False
+        lista_de_revogacao.adicionar(jti, expira_em)
+        return True
+
+    @staticmethod
+    def _emitido_antes_da_troca_de_senha(payload: dict, usuario: Usuario) -> bool:
+        if usuario.senha_alterada_em is None:
+            return False
+        if payload.get("iat") is None:
+            return True
+        # `iat` tem resolução de segundos.
+        emitido_em = datetime.utcfromtimestamp(payload["iat"])
+        return emitido_em < usuario.senha_alterada_em.replace(microsecond=0)
+
+    async def renovar_token(self, refresh_token: str) -> Token:
+        """
+        Troca um refresh token por um novo par de tokens, sem verificar a senha.
+        O usuário precisa continuar ativo e não ter trocado a senha depois da
+        emissão do token. O refresh token usado é revogado: reutilizá-lo é
+        recusado.
+        """
+        try:
+            payload = decodificar_token(refresh_token, usar_cache=False)
+        except TokenInvalidoError:
+            raise CredenciaisInvalidasException()
+        if (
+            payload.get("token_type") != TokenType.REFRESH.value
+            or payload.get("sub") is None
+        ):
+            raise CredenciaisInvalidasException()
+        usuario = await self._repo.buscar_usuario_por_email(payload["sub"])
+        if (
+            usuario is None
+            or self._emitido_antes_da_troca_de_senha(payload, usuario)
+            or not await self._revogar(payload)
+        ):
+            raise CredenciaisInvalidasException()
+        return self._emitir_tokens(usuario.email, usuario.tipo_usuario.titulo)
+
+    async def revogar_tokens(
+        self, access_token: str, refresh_token: Optional[str] = None
+    ) -> None:
+        """Revoga o access token atual e, se informado, o refresh token (logout)."""
+        email = await self.verificar_token(access_token)
+        tokens = [access_token] + ([refresh_token] if refresh_token else [])
+        for token in tokens:
+            try:
+                payload = decodificar_token(token, usar_cache=False)
+            except TokenInvalidoError:
+                raise CredenciaisInvalidasException()
+            if payload.get("sub") != email:
+                raise CredenciaisInvalidasException()
+            await self._revogar(payload)
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi_cache.decorator import cache
+from loguru import logger
+
+from src.api.config import Config
+from src.api.database.repository import PGCopRepository
+from src.api.entrypoints.dashboard.schema import (
+    ContagensDashboard,
+    Dashboard,
+    DashboardCurso,
+    DashboardProfessor,
+)
+from src.api.services.servico_base import ServicoBase
+from src.api.utils.cache import chave_sem_instancia, invalidar_ao_alterar
+from src.api.utils.enums import CursoAlunoEnum
+
+NAMESPACE_DASHBOARD = "dashboard"
+
+invalidar_ao_alterar(
+    NAMESPACE_DASHBOARD, "alunos", "tarefas", "solicitacoes", "professores", "usuarios"
+)
+
+
+class ServicoDashboard(ServicoBase):
+    _repo: PGCopRepository
+
+    @cache(
+        expire=Config.SEGUNDOS_DE_CACHE_DASHBOARD,
+        namespace=NAMESPACE_DASHBOARD,
+        key_builder=chave_sem_instancia,
+    )
+    async def gerar(self) -> Dashboard:
+        """
+        Contagens de alunos, tarefas atrasadas ou próximas do prazo e
+        solicitações pendentes por professor e por curso, agregadas no banco.
+        """
+        agora = datetime.utcnow()
+        hoje = agora.date()
+        limite_prazo_proximo = hoje + timedelta(days=Config.DIAS_PARA_PRAZO_PROXIMO)
+
+        professores: dict[int, DashboardProfessor] = {
+            professor_id: DashboardProfessor(professor_id=professor_id, nome=nome)
+            for professor_id, nome in await self._repo.buscar_nomes_de_professores()
+        }
+        cursos: dict[CursoAlunoEnum, DashboardCurso] = {}
+        totais = ContagensDashboard()
+
+        def somar(professor_id: Optional[int], curso, **contagens: int) -> None:
+            destinos = [totais, cursos.setdefault(curso, DashboardCurso(curso=curso))]
+            if professor_id is not None:
+                destinos.append(
+                    professores.setdefault(
+                        professor_id, DashboardProfessor(professor_id=professor_id)
+                    )
+                )
+            for destino in destinos:
+                for campo, valor in contagens.items():
+                    setattr(destino, campo, getattr(destino, campo) + int(valor or 0))
+
+        for (
+            orientador_id,
+            curso,
+            alunos,
+        ) in await self._repo.contar_alunos_por_orientador_e_curso():
+            somar(orientador_id, curso, alunos=alunos)
+
+        for (
+            orientador_id,
+            curso,
+            atrasadas,
+            proximas,
+        ) in await self._repo.contar_tarefas_pendentes_por_orientador_e_curso(
+            hoje, limite_prazo_proximo
+        ):
+            somar(
+                orientador_id,
+                curso,
+                tarefas_atrasadas=atrasadas,
+                tarefas_proximas_do_prazo=proximas,
+            )
+
+        for (
+            professor_id,
+            curso,
+            pendentes,
+        ) in await self._repo.contar_solicitacoes_pendentes_por_professor_e_curso():
+            somar(professor_id, curso, solicitacoes_pendentes=pendentes)
+
+        logger.info(
+            "Dashboard gerado: {professores} professores, {alunos} alunos.",
+            professores=len(professores),
+            alunos=totais.alunos,
+        )
+        return Dashboard(
+            gerado_em=agora,
+            prazo_proximo_ate=limite_prazo_proximo,
+            totais=totais,
+            professores=sorted(professores.values(), key=lambda p: p.professor_id),
+            cursos=sorted(cursos.values(), key=lambda c: c.curso.value),
+        )
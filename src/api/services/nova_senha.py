@@ -1,47 +1,93 @@
-import random
+import hashlib
+import hmac
+import secrets
+import string
+from datetime import datetime, timedelta
+from typing import Callable, Optional
 
 from loguru import logger
-from passlib.context import CryptContext
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.config import Config
 from src.api.database.models.usuario import Usuario
 from src.api.database.repository import PGCopRepository
+from src.api.database.session import get_sessionmaker
 from src.api.entrypoints.new_password.errors import AuthenticationException
 from src.api.entrypoints.new_password.schema import NovaSenhaCodigoAutenticacao
 from src.api.html_loader import load_html
 from src.api.mailsender.mailer import Mailer
 from src.api.services.servico_base import ServicoBase
 from src.api.services.usuario import ServicoUsuario
+from src.api.utils.senha import gerar_hash_senha
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 mailer = Mailer()
 
 
-def generate_token(length=10) -> str:
-    charset = "".join([chr(i) for i in range(ord("A"), ord("Z") + 1)])
-    charset += "1234567890"
+def generate_token(length=8) -> str:
+    charset = string.ascii_uppercase + string.digits
 
-    return "".join(random.choice(charset) for i in range(length))
+    return "".join(secrets.choice(charset) for _ in range(length))
+
+
+def hash_do_token(token: str) -> str:
+    """HMAC do código com a chave da aplicação: o banco não guarda o código."""
+    return hmac.new(
+        Config.AUTH.SECRET_KEY.encode(), token.strip().upper().encode(), hashlib.sha256
+    ).hexdigest()
 
 
 class ServicoNovaSenha(ServicoBase):
     _repo: PGCopRepository
 
-    async def autenticar_usuario_com_token(self, email: str, token: str) -> None:
-        db_usuario: Usuario = await ServicoUsuario(self._repo).buscar_por_email(email)
+    def __init__(
+        self, repository, sessoes: Optional[Callable[[], AsyncSession]] = None
+    ):
+        super().__init__(repository)
+        self._sessoes = sessoes
+
+    async def _consumir_tentativa(self, email: str) -> Optional[Row]:
+        """
+        Conta a tentativa em uma sessão própria, confirmada na hora: ela vale
+        mesmo que a sessão da requisição seja desfeita por uma falha posterior.
+        """
+        sessoes = self._sessoes or get_sessionmaker()
+        async with sessoes() as session:
+            registro = await PGCopRepository(session).consumir_tentativa_nova_senha(
+                email, Config.AUTH.NOVA_SENHA_MAX_TENTATIVAS
+            )
+            await session.commit()
+        return registro
+
+    async def _validar_token(self, email: str, token: str) -> int:
+        """Confere o código de redefinição e retorna o id do usuário."""
+        token_hash = hash_do_token(token)
+        registro = await self._consumir_tentativa(email)
+        if (
+            registro is None
+            or registro.expira_em <= datetime.utcnow()
+            or not hmac.compare_digest(registro.token_hash, token_hash)
+        ):
+            raise AuthenticationException()
+        return registro.usuario_id
 
-        self._validador.validar_usuario_autenticado_por_usuario(db_usuario)
-        self._validador.validar_usuari_autenticado_por_token(db_usuario, token)
+    async def autenticar_usuario_com_token(self, email: str, token: str) -> None:
+        await self._validar_token(email, token)
 
     async def create_token(self, email: str) -> NovaSenhaCodigoAutenticacao:
-        logger.info(f"{email=} | Solicitado token de nova senha")
+        logger.info("{email} | Solicitado token de nova senha", email=email)
         db_usuario: Usuario = await ServicoUsuario(self._repo).buscar_por_email(email)
-        logger.info(f"{db_usuario.id=} {email=} | Usuário encontrado")
+        logger.info("{usuario_id} | Usuário encontrado", usuario_id=db_usuario.id)
 
         self._validador.validar_email_nao_encontrado(db_usuario)
 
-        token = generate_token(6)
+        token = generate_token()
 
-        db_usuario.token_nova_senha = token
+        await self._repo.salvar_token_nova_senha(
+            db_usuario.id,
+            hash_do_token(token),
+            datetime.utcnow() + timedelta(minutes=Config.AUTH.NOVA_SENHA_TOKEN_MINUTOS),
+        )
 
         mailer.send_message(
             dest_email=email,
@@ -50,18 +96,18 @@ class ServicoNovaSenha(ServicoBase):
                 "new_password_token", name=db_usuario.nome, token=token
             ),
         )
-        logger.info(f"{db_usuario.id=} {email=} | Token enviado por email")
+        logger.info("{usuario_id} | Token enviado por email", usuario_id=db_usuario.id)
         return NovaSenhaCodigoAutenticacao(email=email, token=token)
 
     async def atualizar_para_nova_senha(
         self, email: str, new_password: str, token: str
     ) -> None:
-        db_usuario: Usuario = await ServicoUsuario(self._repo).buscar_por_email(email)
-
-        self._validador.validar_email_nao_encontrado(db_usuario)
+        usuario_id = await self._validar_token(email, token)
 
-        if db_usuario.token_nova_senha != token:
-            raise AuthenticationException()
-
-        db_usuario.senha_hash = pwd_context.hash(new_password)
-        db_usuario.token_nova_senha = None
+        await self._repo.atualizar_por_id(
+            usuario_id,
+            Usuario,
+            senha_hash=await gerar_hash_senha(new_password),
+            senha_alterada_em=datetime.utcnow(),
+        )
+        await self._repo.remover_token_nova_senha(usuario_id)
@@ -3,12 +3,11 @@ from typing import Optional
 
 from fastapi import Depends
 from loguru import logger
-from passlib.context import CryptContext
 
 from src.api.database.models.professor import Professor
-from src.api.database.models.solicitacoes import Solicitacao
 from src.api.database.models.usuario import Usuario
 from src.api.database.repository import PGCopRepository
+from src.api.entrypoints.professores.errors import ProfessorNaoEncontradoException
 from src.api.entrypoints.professores.schema import (
     ProfessorAtualizado,
     ProfessorInDB,
@@ -18,8 +17,7 @@ from src.api.entrypoints.professores.schema import (
 from src.api.services.auth import ServicoAuth, oauth2_scheme
 from src.api.services.servico_base import ServicoBase
 from src.api.services.usuario import ServicoUsuario
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.api.utils.senha import gerar_hash_senha
 
 
 class ServiceProfessor(ServicoBase):
@@ -34,10 +32,13 @@ class ServiceProfessor(ServicoBase):
         db_usuario_professor: Usuario = await ServicoUsuario(self._repo).criar(
             novo_professor
         )
-        logger.info(f"Criando professor {novo_professor.tipo_usuario}")
+        logger.info("Criando professor {tipo}", tipo=novo_professor.tipo_usuario)
         db_professor = Professor(usuario=db_usuario_professor)
         await self._repo.criar(db_professor)
-        logger.info(f"{db_professor.id=} | Professor criado com sucesso.")
+        logger.info(
+            "{professor_id} | Professor criado com sucesso.",
+            professor_id=db_professor.id,
+        )
         return self.tipo_usuario_in_db(db_professor)
 
     def tipo_usuario_in_db(self, professor: Professor) -> ProfessorInDB:
@@ -63,7 +64,8 @@ class ServiceProfessor(ServicoBase):
         logger.info("Buscando todos os professores.")
         db_professores: list[Professor] = await self._repo.buscar_todos(Professor)
         logger.info(
-            f"Encontrados {len(db_professores)} professores. Retornando lista..."
+            "Encontrados {quantidade} professores. Retornando lista...",
+            quantidade=len(db_professores),
         )
         return [
             ProfessorResponse(id=professor.id, nome=professor.usuario.nome)
@@ -71,15 +73,20 @@ class ServiceProfessor(ServicoBase):
         ]
 
     async def deletar(self, professor_id: int) -> None:
-        professor: Professor = await self._repo.buscar_por_id(professor_id, Professor)
-        self._validador.validar_professor_existe(professor)
-        solicitacoes: list[Solicitacao] = professor.solicitacoes or []
-        logger.info(f"{professor_id=} {professor.usuario.id=} | Deletando professor;")
-        for solicitacao in solicitacoes:
-            solicitacao.deleted_at = datetime.utcnow()
-        professor.deleted_at = datetime.utcnow()
-        professor.usuario.deleted_at = datetime.utcnow()
-        logger.info(f"{professor_id=} {professor.usuario.id=} | Professor deletado.")
+        usuario_id = await self._repo.buscar_usuario_id(Professor, professor_id)
+        if usuario_id is None:
+            raise ProfessorNaoEncontradoException()
+        logger.info(
+            "{professor_id} {usuario_id} | Deletando professor;",
+            professor_id=professor_id,
+            usuario_id=usuario_id,
+        )
+        await self._repo.remover_professor_em_cascata(professor_id, usuario_id)
+        logger.info(
+            "{professor_id} {usuario_id} | Professor deletado.",
+            professor_id=professor_id,
+            usuario_id=usuario_id,
+        )
 
     async def atualizar(
         self, professor_id: int, updates_professor: ProfessorAtualizado
@@ -88,7 +95,8 @@ class ServiceProfessor(ServicoBase):
             professor_id, Professor
         )
         logger.info(
-            f"{professor_id=} | Iniciando verificações para atualizar professor."
+            "{professor_id} | Iniciando verificações para atualizar professor.",
+            professor_id=professor_id,
         )
         await self._validador.validar_atualizacao_de_professor(
             professor_id, updates_professor, db_professor
@@ -105,15 +113,18 @@ class ServiceProfessor(ServicoBase):
             if updates_professor.tipo_usuario
             else db_professor.usuario.tipo_usuario_id
         )
-        db_professor.usuario.senha_hash = (
-            pwd_context.hash(updates_professor.senha)
-            if updates_professor.senha
-            else db_professor.usuario.senha_hash
-        )
+        if updates_professor.senha:
+            db_professor.usuario.senha_hash = await gerar_hash_senha(
+                updates_professor.senha
+            )
+            db_professor.usuario.senha_alterada_em = datetime.utcnow()
 
         self._repo._session.flush()
         self._repo._session.refresh(db_professor)
-        logger.info(f"{professor_id=} | Professor atualizado com sucesso.")
+        logger.info(
+            "{professor_id} | Professor atualizado com sucesso.",
+            professor_id=professor_id,
+        )
         return self.tipo_usuario_in_db(db_professor)
 
     async def buscar_por_email(self, email: str) -> Professor:
@@ -1,19 +1,27 @@
+import inspect
 from abc import ABC  # , abstractmethod
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
 
+from src.api.config import Config
+from src.api.monitoring.tracing import rastrear
 from src.api.services.validador import ServicoValidador
 
 # Instanciando o OAuth2PasswordBearer
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-# Configuração do hash de senha
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class ServicoBase(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not Config.TRACING_ATIVO:
+            return
+        # Cada método público assíncrono dos serviços vira um span.
+        for nome, metodo in list(vars(cls).items()):
+            if not nome.startswith("_") and inspect.iscoroutinefunction(metodo):
+                setattr(cls, nome, rastrear(f"{cls.__name__}.{nome}")(metodo))
+
     def __init__(self, repository):
         self._repo = repository
         self._validador: ServicoValidador = ServicoValidador(self._repo)
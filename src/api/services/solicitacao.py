@@ -20,26 +20,26 @@ class ServicoSolicitacao(ServicoBase):
             professor_id=professor_id,
         )
         await self._repo.criar(db_solicitacao)
-        logger.info(f"{db_solicitacao.id=} | Solicitação para criada com sucesso.")
+        logger.info(
+            "{solicitacao_id} | Solicitação criada com sucesso.",
+            solicitacao_id=db_solicitacao.id,
+        )
         return self.de_solicitacao_para_solicitacao_in_db(db_solicitacao)
 
     @cache(expire=60 * Config.MINUTOS_DE_CACHE_REQUISICOES)
     async def listar(
         self, professor_id: int, status: StatusSolicitacaoEnum
-    ) -> list[SolicitacaoInDB]:
-        solicitacoes: list[
-            Solicitacao
-        ] = await self._repo.buscar_lista_de_solicitacoes_de_professor(
+    ) -> list[dict]:
+        """Solicitações no formato de `SolicitacaoInDB`, via modelo de leitura."""
+        solicitacoes = await self._repo.buscar_leitura_solicitacoes_de_professor(
             professor_id=professor_id, status=status
         )
         logger.info(
-            f"Solicitacoes para {professor_id=} listadas \
-                 com sucesso. Total: {len(solicitacoes)}."
+            "Solicitacoes para {professor_id} listadas com sucesso. Total: {total}.",
+            professor_id=professor_id,
+            total=len(solicitacoes),
         )
-        return [
-            self.de_solicitacao_para_solicitacao_in_db(solicitacao)
-            for solicitacao in solicitacoes
-        ]
+        return [solicitacao.como_dict() for solicitacao in solicitacoes]
 
     def de_solicitacao_para_solicitacao_in_db(
         self,
@@ -63,8 +63,9 @@ class ServicoSolicitacao(ServicoBase):
         db_solicitacao.status = status
         self._repo.salvar(db_solicitacao)
         logger.info(
-            f"Solicitação {solicitacao_id=} atualizada com sucesso para \
-                  {db_solicitacao.status}."
+            "Solicitação {solicitacao_id} atualizada com sucesso para {status}.",
+            solicitacao_id=solicitacao_id,
+            status=db_solicitacao.status,
         )
 
         if status == StatusSolicitacaoEnum.ACEITA:
@@ -79,7 +80,7 @@ class ServicoSolicitacao(ServicoBase):
     ) -> None:
         db_aluno: Aluno = await self._repo.buscar_por_id(aluno_id, Aluno)
         db_aluno.orientador_id = orientador_id
-        logger.info(f"Atribuição de orientador para {db_aluno.id=}.")
+        logger.info("Atribuição de orientador para {aluno_id}.", aluno_id=db_aluno.id)
 
     async def buscar_solicitacao_por_id(self, solicitacao_id: int) -> Solicitacao:
         db_solicitacao: Solicitacao = await self._repo.buscar_por_id(
@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
 from fastapi_cache.decorator import cache
 from loguru import logger
 
@@ -7,64 +9,265 @@ from src.api.database.models.aluno import Aluno
 from src.api.database.models.tarefa import Tarefa
 from src.api.database.repository import PGCopRepository
 from src.api.entrypoints.tarefas.errors import ExcecaoTarefaNaoEncontrada
-from src.api.entrypoints.tarefas.schema import TarefaAtualizada, TarefaBase, TarefaInDB
+from src.api.entrypoints.tarefas.schema import (
+    OperacaoTarefa,
+    TarefaAtualizada,
+    TarefaBase,
+    TarefaInDB,
+)
 from src.api.entrypoints.tarefas_base.schema import TarefaBaseInDB
 from src.api.services.servico_base import ServicoBase
 from src.api.services.tarefa_base import ServiceTarefaBase
+from src.api.utils.enums import OperacaoLoteEnum
+from src.api.utils.notificacao import calcular_proxima_notificacao
+
+
+def valores_de_nova_tarefa(tarefa: TarefaBase, agora: datetime) -> dict:
+    """Colunas de uma tarefa criada a partir de `TarefaBase`."""
+    return dict(
+        nome=tarefa.nome,
+        aluno_id=tarefa.aluno_id,
+        descricao=tarefa.descricao,
+        data_prazo=tarefa.data_prazo,
+        data_ultima_notificacao=agora,
+        data_conclusao=None,
+        data_proxima_notificacao=calcular_proxima_notificacao(
+            tarefa.data_prazo, False, agora
+        ),
+    )
+
+
+def proxima_notificacao_ao_atualizar(
+    data_prazo: date, concluida: bool, valores: dict, agora: datetime
+) -> dict:
+    """
+    Reagenda o aviso quando a atualização muda o prazo ou a conclusão da
+    tarefa; retorna os valores a acrescentar ao UPDATE.
+    """
+    novo_prazo = valores.get("data_prazo", data_prazo)
+    nova_conclusao = valores.get("concluida", concluida)
+    if (novo_prazo, nova_conclusao) == (data_prazo, concluida):
+        return {}
+    return {
+        "data_proxima_notificacao": calcular_proxima_notificacao(
+            novo_prazo, nova_conclusao, agora
+        )
+    }
+
+
+def _resultado_do_lote(indice: int, operacao: OperacaoTarefa) -> dict:
+    return {
+        "indice": indice,
+        "operacao": operacao.operacao,
+        "status": 200,
+        "tarefa_id": operacao.tarefa_id,
+        "tarefa": None,
+        "erro": None,
+    }
+
+
+def _falhar(resultado: dict, status: int, erro: str) -> None:
+    resultado["status"] = status
+    resultado["erro"] = erro
 
 
 class ServiceTarefa(ServicoBase):
     _repo: PGCopRepository
 
     async def criar_tarefa(self, tarefa: TarefaBase) -> TarefaInDB:
-        logger.info(f"{tarefa.aluno_id=} | Validando se aluno existe.")
+        logger.info("{aluno_id} | Validando se aluno existe.", aluno_id=tarefa.aluno_id)
         await self._validador.buscar_e_validar_aluno_existe(tarefa.aluno_id)
-        db_tarefa = Tarefa(
-            nome=tarefa.nome,
-            aluno_id=tarefa.aluno_id,
-            descricao=tarefa.descricao,
-            data_prazo=tarefa.data_prazo,
-            data_ultima_notificacao=datetime.utcnow(),
-            data_conclusao=None,
-        )
+        db_tarefa = Tarefa(**valores_de_nova_tarefa(tarefa, datetime.utcnow()))
 
         await self._repo.criar(db_tarefa)
+        await self._repo.atualizar_progresso_aluno(db_tarefa.aluno_id)
         return self.de_tarefa_para_tarefa_in_db(db_tarefa)
 
     async def atualizar_tarefa(
         self, tarefa_id: int, tarefa_atualizada: TarefaAtualizada
     ):
-        logger.info(
-            f"{tarefa_id=} {tarefa_atualizada.aluno_id=} | Iniciando atualização \
-            de tarefa  Validando informações. {tarefa_atualizada.model_dump()=}"
+        logger.opt(lazy=True).info(
+            "{tarefa_id} {aluno_id} | Iniciando atualização de tarefa. "
+            "Validando informações. {valores}",
+            tarefa_id=lambda: tarefa_id,
+            aluno_id=lambda: tarefa_atualizada.aluno_id,
+            valores=tarefa_atualizada.model_dump,
         )
-        db_tarefa: Tarefa = await self.buscar_tarefa(tarefa_id)
         to_update = tarefa_atualizada.model_dump()
         for key, value in list(to_update.items())[::-1]:
             if value is None:
                 to_update.pop(key)
-        await self._repo.atualizar_por_id(tarefa_id, Tarefa, **to_update)
+
+        anterior = None
+        if to_update.keys() & {"aluno_id", "data_prazo", "concluida"}:
+            # O próximo aviso e o progresso dos alunos dependem do estado
+            # anterior; basta uma leitura das colunas, sem o grafo do aluno.
+            anterior = (await self._repo.buscar_estado_de_tarefas([tarefa_id])).get(
+                tarefa_id
+            )
+            if anterior is None:
+                raise ExcecaoTarefaNaoEncontrada()
+            to_update.update(
+                proxima_notificacao_ao_atualizar(
+                    anterior.data_prazo,
+                    anterior.concluida,
+                    to_update,
+                    datetime.utcnow(),
+                )
+            )
+
+        db_tarefa = await self._repo.atualizar_por_id(tarefa_id, Tarefa, **to_update)
+        if db_tarefa is None:
+            raise ExcecaoTarefaNaoEncontrada()
+        if anterior is not None:
+            for aluno_id in {anterior.aluno_id, db_tarefa.aluno_id}:
+                await self._repo.atualizar_progresso_aluno(aluno_id)
         return self.de_tarefa_para_tarefa_in_db(db_tarefa)
 
     async def deletar_tarefa(self, id: int) -> None:
         tarefa: Tarefa = await self.buscar_tarefa(id)
         tarefa.deleted_at = datetime.utcnow()
-        logger.info(f"{tarefa.id=} | Tarefa deletada.")
+        tarefa.data_proxima_notificacao = None
+        await self._repo.atualizar_progresso_aluno(tarefa.aluno_id)
+        logger.info("{tarefa_id} | Tarefa deletada.", tarefa_id=tarefa.id)
+
+    async def executar_lote(self, operacoes: list[OperacaoTarefa]) -> list[dict]:
+        """
+        Executa as operações na transação da requisição com poucos comandos:
+        uma consulta para validar as tarefas e outra para os alunos, um INSERT
+        de várias linhas, um UPDATE por conjunto de valores iguais (ex.: o
+        mesmo novo prazo para uma turma) e um UPDATE para as remoções.
+        Operações inválidas recebem o erro no próprio resultado, sem impedir
+        as demais.
+        """
+        agora = datetime.utcnow()
+        resultados = [_resultado_do_lote(i, op) for i, op in enumerate(operacoes)]
+
+        tarefas = await self._repo.buscar_estado_de_tarefas(
+            [op.tarefa_id for op in operacoes if op.tarefa_id is not None]
+        )
+        alunos = await self._repo.buscar_ids_existentes(
+            Aluno,
+            {op.tarefa.aluno_id for op in operacoes if op.tarefa}
+            | {
+                op.atualizacao.aluno_id
+                for op in operacoes
+                if op.atualizacao and op.atualizacao.aluno_id is not None
+            },
+        )
+
+        novas: list[dict] = []
+        resultados_novas: list[dict] = []
+        atualizacoes: dict[tuple, list[int]] = defaultdict(list)
+        removidas: list[int] = []
+        alunos_afetados: set[int] = set()
+        tarefas_no_lote: set[int] = set()
+
+        for resultado, op in zip(resultados, operacoes):
+            if op.operacao == OperacaoLoteEnum.CRIAR:
+                if op.tarefa.aluno_id not in alunos:
+                    _falhar(resultado, 404, "Aluno não encontrado")
+                    continue
+                novas.append(valores_de_nova_tarefa(op.tarefa, agora))
+                resultados_novas.append(resultado)
+                alunos_afetados.add(op.tarefa.aluno_id)
+                continue
+
+            if op.tarefa_id in tarefas_no_lote:
+                _falhar(resultado, 409, "Tarefa repetida no lote")
+                continue
+            tarefas_no_lote.add(op.tarefa_id)
+            tarefa = tarefas.get(op.tarefa_id)
+            if tarefa is None:
+                _falhar(resultado, 404, "Tarefa não encontrada")
+                continue
+
+            if op.operacao == OperacaoLoteEnum.DELETAR:
+                removidas.append(tarefa.id)
+                resultado["status"] = 204
+                alunos_afetados.add(tarefa.aluno_id)
+                continue
+
+            dados = (
+                op.atualizacao
+                if op.operacao == OperacaoLoteEnum.ATUALIZAR
+                else op.conclusao
+            )
+            valores = {k: v for k, v in dados.model_dump().items() if v is not None}
+            aluno_id = valores.get("aluno_id", tarefa.aluno_id)
+            if aluno_id != tarefa.aluno_id and aluno_id not in alunos:
+                _falhar(resultado, 404, "Aluno não encontrado")
+                continue
+            valores.update(
+                proxima_notificacao_ao_atualizar(
+                    tarefa.data_prazo, tarefa.concluida, valores, agora
+                )
+            )
+            if valores:
+                atualizacoes[tuple(sorted(valores.items()))].append(tarefa.id)
+            alunos_afetados |= {tarefa.aluno_id, aluno_id}
+
+        if novas:
+            ids = await self._repo.criar_em_lote(Tarefa, novas)
+            for resultado, tarefa_id in zip(resultados_novas, ids):
+                resultado["status"] = 201
+                resultado["tarefa_id"] = tarefa_id
+        for valores, ids in atualizacoes.items():
+            await self._repo.atualizar_em_lote(Tarefa, ids, **dict(valores))
+        if removidas:
+            await self._repo.remover_logicamente(
+                Tarefa, Tarefa.id.in_(removidas), removido_em=agora
+            )
+        for aluno_id in alunos_afetados:
+            await self._repo.atualizar_progresso_aluno(aluno_id)
+
+        ids_retornados = [
+            r["tarefa_id"] for r in resultados if r["status"] in (200, 201)
+        ]
+        leituras = {
+            tarefa.id: tarefa.como_dict()
+            for tarefa in await self._repo.buscar_leitura_tarefas_por_ids(
+                ids_retornados
+            )
+        }
+        for resultado in resultados:
+            if resultado["status"] in (200, 201):
+                resultado["tarefa"] = leituras.get(resultado["tarefa_id"])
+        logger.opt(lazy=True).info(
+            "Lote de tarefas executado: {criadas} criadas, {atualizadas} "
+            "atualizadas, {removidas} removidas.",
+            criadas=lambda: len(novas),
+            atualizadas=lambda: sum(len(ids) for ids in atualizacoes.values()),
+            removidas=lambda: len(removidas),
+        )
+        return resultados
 
     async def buscar_tarefa(self, id: int) -> Tarefa:
         db_tarefa = await self._repo.buscar_por_id(id, Tarefa)
         if not db_tarefa:
             raise ExcecaoTarefaNaoEncontrada()
-        logger.info(f"{db_tarefa.id=} | Tarefa encontrada.")
+        logger.info("{tarefa_id} | Tarefa encontrada.", tarefa_id=db_tarefa.id)
         return db_tarefa
 
     @cache(expire=60 * Config.MINUTOS_DE_CACHE_REQUISICOES)
-    async def buscar_tarefas_por_aluno(self, aluno_id: int) -> list[TarefaInDB]:
-        db_tarefas: list[Tarefa] = await self._repo.buscar_tarefas_por_aluno_id(
-            aluno_id
+    async def buscar_tarefas_por_aluno(self, aluno_id: int) -> list[dict]:
+        """
+        Tarefas do aluno já no formato de `TarefaInDB`, montadas a partir das
+        colunas consultadas, para serem retornadas com `RespostaJSONRapida`.
+        """
+        tarefas = await self._repo.buscar_leitura_tarefas_por_aluno(aluno_id)
+        logger.info(
+            "{aluno_id} | Busca de tarefas pra aluno realizada.", aluno_id=aluno_id
         )
-        logger.info(f"{aluno_id=} | Busca de tarefas pra aluno realizada.")
-        return [self.de_tarefa_para_tarefa_in_db(tarefa) for tarefa in db_tarefas]
+        return [tarefa.como_dict() for tarefa in tarefas]
+
+    async def buscar_progresso_aluno(self, aluno_id: int) -> dict:
+        progresso = await self._repo.buscar_progresso_aluno(aluno_id)
+        if progresso is None:
+            await self._validador.buscar_e_validar_aluno_existe(aluno_id)
+            await self._repo.atualizar_progresso_aluno(aluno_id)
+            progresso = await self._repo.buscar_progresso_aluno(aluno_id)
+        return progresso.como_dict()
 
     def de_tarefa_para_tarefa_in_db(self, tarefa: Tarefa) -> TarefaInDB:
         return TarefaInDB(
@@ -79,21 +282,27 @@ class ServiceTarefa(ServicoBase):
         )
 
     async def criar_tarefas_para_novo_aluno(self, aluno: Aluno) -> None:
-        logger.info(f"{aluno.id=} | Criando tarefas para novo aluno.")
+        logger.info("{aluno_id} | Criando tarefas para novo aluno.", aluno_id=aluno.id)
         tarefas_base: list[TarefaBaseInDB] = await ServiceTarefaBase(
             self._repo
         ).buscar_tarefas_base_por_curso(aluno.curso.value)
 
         for tarefa_base in tarefas_base:
+            data_prazo = aluno.data_ingresso + timedelta(
+                days=tarefa_base.prazo_em_meses * 30
+            )
             tarefa = Tarefa(
                 nome=tarefa_base.nome,
                 aluno_id=aluno.id,
                 descricao=tarefa_base.descricao,
-                data_prazo=aluno.data_ingresso
-                + timedelta(days=tarefa_base.prazo_em_meses * 30),
+                data_prazo=data_prazo,
                 data_conclusao=None,
+                data_proxima_notificacao=calcular_proxima_notificacao(
+                    data_prazo, False
+                ),
             )
             await self._repo.criar(tarefa)
 
-        logger.info(f"{aluno.id=} | Tarefas criadas para novo aluno.")
+        await self._repo.atualizar_progresso_aluno(aluno.id)
+        logger.info("{aluno_id} | Tarefas criadas para novo aluno.", aluno_id=aluno.id)
         return None
@@ -33,41 +33,54 @@ class ServiceTarefaBase(ServicoBase):
     async def atualizar_tarefa_base(
         self, tarefa_id: int, tarefa_base_atualizada: TarefaBaseAtualizada
     ):
-        logger.info(
-            f"{tarefa_id=} | Iniciando processo de atualização de tarefa base. \
-            Validando informações. {tarefa_base_atualizada.model_dump()=}"
+        logger.opt(lazy=True).info(
+            "{tarefa_id} | Iniciando processo de atualização de tarefa base. "
+            "Validando informações. {valores}",
+            tarefa_id=lambda: tarefa_id,
+            valores=tarefa_base_atualizada.model_dump,
         )
-        db_tarefa_base: TarefaBase = await self.buscar_tarefa_base(tarefa_id)
         to_update = tarefa_base_atualizada.model_dump()
         for key, value in list(to_update.items())[::-1]:
             if value is None:
                 to_update.pop(key)
-        await self._repo.atualizar_por_id(tarefa_id, TarefaBase, **to_update)
+        db_tarefa_base = await self._repo.atualizar_por_id(
+            tarefa_id, TarefaBase, **to_update
+        )
+        if db_tarefa_base is None:
+            raise ExcecaoTarefaNaoEncontrada()
         return self.de_tarefa_base_para_tarefa_base_in_db(db_tarefa_base)
 
     async def deletar_tarefa_base(self, tarefa_base_id: int) -> None:
         logger.info(
-            f"{tarefa_base_id=} | Iniciando processo de deleção de tarefa base."
+            "{tarefa_base_id} | Iniciando processo de deleção de tarefa base.",
+            tarefa_base_id=tarefa_base_id,
         )
         db_tarefa_base = await self.buscar_tarefa_base(tarefa_base_id)
         db_tarefa_base.deleted_at = datetime.utcnow()
-        logger.info(f"{tarefa_base_id=} | Tarefa base deletada.")
+        logger.info(
+            "{tarefa_base_id} | Tarefa base deletada.", tarefa_base_id=tarefa_base_id
+        )
 
     async def buscar_tarefa_base(self, tarefa_base_id: int) -> TarefaBase:
-        logger.info(f"{tarefa_base_id=} | Pesquisando por tarefa base.")
+        logger.info(
+            "{tarefa_base_id} | Pesquisando por tarefa base.",
+            tarefa_base_id=tarefa_base_id,
+        )
         db_tarefa_base: Optional[TarefaBase] = await self._repo.buscar_por_id(
             tarefa_base_id, TarefaBase
         )
         if not db_tarefa_base:
             raise ExcecaoTarefaNaoEncontrada()
-        logger.info(f"{tarefa_base_id=} | Tarefa base encontrada.")
+        logger.info(
+            "{tarefa_base_id} | Tarefa base encontrada.", tarefa_base_id=tarefa_base_id
+        )
         return db_tarefa_base
 
     @cache(expire=60 * Config.MINUTOS_DE_CACHE_REQUISICOES)
     async def buscar_tarefas_base_por_curso(self, curso: str) -> list[TarefaBaseInDB]:
-        logger.info(f"{curso=} | Pesquisando por tarefas base por curso.")
+        logger.info("{curso} | Pesquisando por tarefas base por curso.", curso=curso)
         db_tarefas_base: list[TarefaBase] = await self._repo.filtrar(
-            TarefaBase, curso=curso, deleted_at=None
+            TarefaBase, curso=curso
         )
         return [
             self.de_tarefa_base_para_tarefa_base_in_db(tarefa)
@@ -2,7 +2,6 @@ from typing import Optional, Union
 
 from fastapi.security import OAuth2PasswordBearer
 from loguru import logger
-from passlib.context import CryptContext
 
 from src.api.database.models.aluno import Aluno
 from src.api.database.models.professor import Professor
@@ -20,9 +19,6 @@ from src.api.utils.enums import TipoUsuarioEnum
 # Instanciando o OAuth2PasswordBearer
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-# Configuração do hash de senha
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class ServicoTipoUsuarioGenerico(ServicoBase):
     _repo: PGCopRepository
@@ -38,7 +34,8 @@ class ServicoTipoUsuarioGenerico(ServicoBase):
             usuario.tipo_usuario.titulo
         ]
         logger.info(
-            f"Buscando dados do usuário com base no tipo {usuario.tipo_usuario.titulo}."
+            "Buscando dados do usuário com base no tipo {tipo}.",
+            tipo=usuario.tipo_usuario.titulo,
         )
         return await tipo_usuario_service(self._repo).buscar_por_email(usuario.email)
 
@@ -80,8 +77,8 @@ class ServicoTipoUsuarioGenerico(ServicoBase):
             token=token, tipo_usuario=tipo_usuario
         )
         logger.info(
-            "Atualizando usuário com base no tipo "
-            f"{usuario_atual.usuario.tipo_usuario.titulo}."
+            "Atualizando usuário com base no tipo {tipo}.",
+            tipo=usuario_atual.usuario.tipo_usuario.titulo,
         )
         return await self.user_service_map[usuario_atual.usuario.tipo_usuario.titulo](
             self._repo
@@ -1,17 +1,14 @@
 from fastapi.security import OAuth2PasswordBearer
 from loguru import logger
-from passlib.context import CryptContext
 
 from src.api.database.models.usuario import Usuario
 from src.api.database.repository import PGCopRepository
 from src.api.schemas.usuario import UsuarioInDB, UsuarioNovo
 from src.api.services.servico_base import ServicoBase
+from src.api.utils.senha import gerar_hash_senha
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-# Configuração do hash de senha
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class ServicoUsuario(ServicoBase):
     _repo: PGCopRepository
@@ -28,17 +25,20 @@ class ServicoUsuario(ServicoBase):
 
     async def criar(self, novo_usuario: UsuarioNovo) -> Usuario:
         logger.info(
-            f"Início do processo de criação de usuario tipo {novo_usuario.tipo_usuario}"
+            "Início do processo de criação de usuario tipo {tipo}",
+            tipo=novo_usuario.tipo_usuario,
         )
         await self._validador.validar_email_registrado(novo_usuario)
         db_usuario = Usuario(
             nome=novo_usuario.nome,
             email=novo_usuario.email,
-            senha_hash=pwd_context.hash(novo_usuario.senha),
+            senha_hash=await gerar_hash_senha(novo_usuario.senha),
             tipo_usuario=await self._repo.buscar_tipo_usuario_por_titulo(
                 novo_usuario.tipo_usuario
             ),
         )
         await self._repo.criar(db_usuario)
-        logger.info(f"{db_usuario.id=} | Usuario criado com sucesso.")
+        logger.info(
+            "{usuario_id} | Usuario criado com sucesso.", usuario_id=db_usuario.id
+        )
         return db_usuario
@@ -67,19 +67,29 @@ class ServicoValidador:
         db_professor: Professor,
     ):
         self.validar_professor_existe(db_professor)
-        logger.info(f"{professor_id=} | Professor encontrado no banco de dados.")
+        logger.info(
+            "{professor_id} | Professor encontrado no banco de dados.",
+            professor_id=professor_id,
+        )
         self.validar_campos_de_atualizacao_nao_sao_nulos(updates_professor)
-        logger.info(f"{professor_id=} | Existem campos não nulos para atualizar.")
+        logger.info(
+            "{professor_id} | Existem campos não nulos para atualizar.",
+            professor_id=professor_id,
+        )
         self.validar_tipo_usuario(
             updates_professor.tipo_usuario,
             TipoUsuarioEnum.PROFESSOR,
             TipoUsuarioEnum.COORDENADOR,
         )
-        logger.info(f"{professor_id=} | Tipo usuário válido.")
+        logger.info(
+            "{professor_id} | Tipo usuário válido.", professor_id=professor_id
+        )
         await self.validar_email_nao_esta_em_uso(
             db_professor.usuario.email, db_professor.usuario.id
         )
-        logger.info(f"{professor_id=} | Email não está em uso.")
+        logger.info(
+            "{professor_id} | Email não está em uso.", professor_id=professor_id
+        )
 
     async def validar_email_registrado(
         self,
@@ -164,7 +174,3 @@ class ServicoValidador:
     def validar_usuario_autenticado_por_usuario(self, db_usuario: Optional[Usuario]):
         if not db_usuario:
             raise AuthenticationException()
-
-    def validar_usuari_autenticado_por_token(self, db_usuario: Usuario, token: str):
-        if db_usuario.token_nova_senha != token:
-            raise AuthenticationException()
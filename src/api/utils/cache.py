@@ -0,0 +1,59 @@
+import hashlib
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from loguru import logger
+
+from src.api.monitoring import metrics
+
+_namespaces_por_tabela: Dict[str, set] = defaultdict(set)
+
+
+class InMemoryBackendInstrumentado(InMemoryBackend):
+    """
+    Backend em memória do fastapi-cache que contabiliza acertos e falhas.
+    """
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        ttl, valor = await super().get_with_ttl(key)
+        metrics.CACHE_REQUESTS.labels(result="miss" if valor is None else "hit").inc()
+        return ttl, valor
+
+
+def chave_sem_instancia(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request=None,
+    response=None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Key builder para métodos de serviço: igual ao padrão do fastapi-cache, mas
+    ignora `self`, já que os serviços são instanciados a cada requisição.
+    """
+    cache_key = hashlib.md5(  # noqa: S324
+        f"{func.__module__}:{func.__qualname__}:{args[1:]}:{kwargs}".encode()
+    ).hexdigest()
+    return f"{namespace}:{cache_key}"
+
+
+def invalidar_ao_alterar(namespace: str, *tabelas: str) -> None:
+    """Declara que o cache de `namespace` depende das `tabelas` informadas."""
+    for tabela in tabelas:
+        _namespaces_por_tabela[tabela].add(namespace)
+
+
+async def invalidar_caches(tabelas: Iterable[str]) -> None:
+    """Limpa os namespaces de cache que dependem das tabelas alteradas."""
+    namespaces = set()
+    for tabela in tabelas:
+        namespaces |= _namespaces_por_tabela.get(tabela, set())
+    for namespace in namespaces:
+        try:
+            await FastAPICache.clear(namespace=namespace)
+        except Exception as e:
+            logger.warning(f"Falha ao invalidar o cache {namespace=}: {e}")
@@ -18,3 +18,10 @@ class StatusSolicitacaoEnum(StrEnum):
 class CursoAlunoEnum(StrEnum):
     MESTRADO = "M"
     DOUTORADO = "D"
+
+
+class OperacaoLoteEnum(StrEnum):
+    CRIAR = "criar"
+    ATUALIZAR = "atualizar"
+    CONCLUIR = "concluir"
+    DELETAR = "deletar"
@@ -0,0 +1,40 @@
+"""
+Agenda dos avisos de prazo das tarefas.
+
+Fica fora de `src.api.services.tarefa` para poder ser usada pelos workers e
+pelos scripts de benchmark sem importar as rotas.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from src.api.config import Config
+
+
+def calcular_proxima_notificacao(
+    data_prazo: date, concluida: bool, agora: Optional[datetime] = None
+) -> Optional[datetime]:
+    """
+    Instante do primeiro aviso de uma tarefa: a entrada na janela de prazo
+    próximo (`DIAS_PARA_PRAZO_PROXIMO` dias antes do prazo), ou agora se a
+    tarefa já está dentro dela. Tarefas concluídas não têm aviso.
+    """
+    if concluida:
+        return None
+    agora = agora or datetime.utcnow()
+    inicio_janela = datetime.combine(
+        data_prazo - timedelta(days=Config.DIAS_PARA_PRAZO_PROXIMO), time.min
+    )
+    return max(inicio_janela, agora)
+
+
+def proxima_notificacao_apos_aviso(
+    data_prazo: date, enviado_em: datetime
+) -> Optional[datetime]:
+    """
+    Após o aviso de prazo próximo, o próximo é o de atraso, no dia seguinte
+    ao prazo. Após o aviso de atraso não há outro.
+    """
+    if data_prazo >= enviado_em.date():
+        return datetime.combine(data_prazo + timedelta(days=1), time.min)
+    return None
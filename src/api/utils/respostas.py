@@ -0,0 +1,54 @@
+"""
+Resposta JSON rápida para as rotas de listagem.
+
+As rotas que já montam as linhas a partir das colunas consultadas retornam
+esta resposta diretamente: o FastAPI não revalida o conteúdo contra o
+`response_model` (que continua documentando o schema no OpenAPI) e a
+serialização usa o orjson quando instalado, ou o `json` da biblioteca padrão.
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+
+def _padrao(valor: Any) -> Any:
+    if isinstance(valor, (datetime, date, time)):
+        return valor.isoformat()
+    if isinstance(valor, Enum):
+        return valor.value
+    if is_dataclass(valor):
+        return asdict(valor)
+    if isinstance(valor, BaseModel):
+        return valor.model_dump(mode="json")
+    raise TypeError(f"Tipo {type(valor).__name__} não é serializável em JSON.")
+
+
+def serializar_json(conteudo: Any) -> bytes:
+    """Serializa `conteudo` no mesmo formato do `JSONResponse` do FastAPI."""
+    if orjson is not None:
+        return orjson.dumps(conteudo, default=_padrao)
+    return json.dumps(
+        conteudo,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_padrao,
+    ).encode("utf-8")
+
+
+class RespostaJSONRapida(JSONResponse):
+    """`JSONResponse` serializado com `serializar_json`."""
+
+    def render(self, content: Any) -> bytes:
+        return serializar_json(content)
@@ -0,0 +1,64 @@
+"""
+Hash e verificação de senhas com bcrypt em um pool de threads dedicado.
+
+O bcrypt é propositalmente lento e, executado diretamente nas rotas
+assíncronas, bloqueia o event loop durante cada login. As operações são
+enviadas a um pool limitado, e a fila de espera é exposta em `/metrics`.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable
+
+from src.api.config import Config
+from src.api.monitoring import metrics, tracing
+
+
+@lru_cache(maxsize=None)
+def pwd_context():
+    """Contexto do passlib, criado (e importado) apenas no primeiro uso."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=Config.BCRYPT_POOL_WORKERS, thread_name_prefix="bcrypt"
+)
+
+
+def _executar_medindo(operacao: str, funcao: Callable, *args):
+    metrics.BCRYPT_QUEUE_DEPTH.dec()
+    inicio = time.perf_counter()
+    try:
+        return funcao(*args)
+    finally:
+        metrics.BCRYPT_DURATION.labels(operation=operacao).observe(
+            time.perf_counter() - inicio
+        )
+
+
+async def _executar_no_pool(operacao: str, funcao: Callable, *args):
+    metrics.BCRYPT_QUEUE_DEPTH.inc()
+    with tracing.iniciar_span(f"bcrypt.{operacao}"):
+        futuro = _executor.submit(_executar_medindo, operacao, funcao, *args)
+        try:
+            return await asyncio.wrap_future(futuro)
+        finally:
+            if futuro.cancel():
+                # Cancelada antes de sair da fila: a thread nunca decrementou.
+                metrics.BCRYPT_QUEUE_DEPTH.dec()
+
+
+async def gerar_hash_senha(senha: str) -> str:
+    """Gera o hash bcrypt de uma senha sem bloquear o event loop."""
+    return await _executar_no_pool("hash", pwd_context().hash, senha)
+
+
+async def verificar_hash_senha(senha_plana: str, senha_hashed: str) -> bool:
+    """Verifica uma senha contra seu hash sem bloquear o event loop."""
+    return await _executar_no_pool(
+        "verify", pwd_context().verify, senha_plana, senha_hashed
+    )
@@ -0,0 +1,138 @@
+"""
+Assinatura e verificação de JWTs, com cache dos tokens já validados.
+
+Cada requisição autenticada verificaria o mesmo token de novo (HMAC, parse do
+JSON e checagem das claims). Tokens válidos ficam em um cache LRU limitado,
+indexado pelo hash do token, até o seu `exp`; tokens inválidos nunca entram
+no cache.
+
+A biblioteca usada é escolhida por `AUTH.JWT_BACKEND`: `jose` (python-jose,
+padrão), `pyjwt` (mais rápida) ou `auto`, que usa o PyJWT quando instalado.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from src.api.config import Config
+
+
+class TokenInvalidoError(Exception):
+    """Token com assinatura, formato ou claims inválidos."""
+
+
+class _BackendJose:
+    def __init__(self):
+        from jose import JWTError, jwt
+
+        self._jwt, self._erro = jwt, JWTError
+
+    def codificar(self, payload: dict, chave: str, algoritmo: str) -> str:
+        return self._jwt.encode(payload, chave, algorithm=algoritmo)
+
+    def decodificar(self, token: str, chave: str, algoritmo: str) -> dict:
+        try:
+            return self._jwt.decode(token, chave, algorithms=[algoritmo])
+        except self._erro as e:
+            raise TokenInvalidoError(str(e)) from e
+
+
+class _BackendPyJWT:
+    def __init__(self):
+        import jwt
+
+        self._jwt = jwt
+
+    def codificar(self, payload: dict, chave: str, algoritmo: str) -> str:
+        return self._jwt.encode(payload, chave, algorithm=algoritmo)
+
+    def decodificar(self, token: str, chave: str, algoritmo: str) -> dict:
+        try:
+            return self._jwt.decode(token, chave, algorithms=[algoritmo])
+        except self._jwt.PyJWTError as e:
+            raise TokenInvalidoError(str(e)) from e
+
+
+@lru_cache(maxsize=None)
+def backend(nome: Optional[str] = None):
+    """Implementação de JOSE configurada, importada apenas no primeiro uso."""
+    nome = nome or Config.AUTH.JWT_BACKEND
+    if nome == "auto":
+        try:
+            return _BackendPyJWT()
+        except ImportError:
+            return _BackendJose()
+    if nome == "pyjwt":
+        return _BackendPyJWT()
+    if nome == "jose":
+        return _BackendJose()
+    raise ValueError(f"JWT_BACKEND desconhecido: {nome!r}")
+
+
+class CacheDeTokens:
+    """
+    Cache LRU dos payloads de tokens válidos, com no máximo `tamanho` entradas.
+    Uma entrada deixa de valer no `exp` do token.
+    """
+
+    def __init__(self, tamanho: int):
+        self.tamanho = tamanho
+        self._entradas: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+
+    @staticmethod
+    def _chave(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def buscar(self, token: str) -> Optional[dict]:
+        chave = self._chave(token)
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            return None
+        payload, expira_em = entrada
+        if expira_em <= time.time():
+            del self._entradas[chave]
+            return None
+        self._entradas.move_to_end(chave)
+        return payload
+
+    def guardar(self, token: str, payload: dict) -> None:
+        if self.tamanho <= 0:
+            return
+        exp = payload.get("exp")
+        expira_em = float(exp) if exp is not None else float("inf")
+        chave = self._chave(token)
+        self._entradas[chave] = (payload, expira_em)
+        self._entradas.move_to_end(chave)
+        while len(self._entradas) > self.tamanho:
+            self._entradas.popitem(last=False)
+
+    def limpar(self) -> None:
+        self._entradas.clear()
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+
+cache_de_tokens = CacheDeTokens(Config.AUTH.JWT_CACHE_SIZE)
+
+
+def codificar_token(payload: dict) -> str:
+    return backend().codificar(payload, Config.AUTH.SECRET_KEY, Config.AUTH.ALGORITHM)
+
+
+def decodificar_token(token: str, usar_cache: bool = True) -> dict:
+    """
+    Payload de um token válido; levanta `TokenInvalidoError` caso contrário.
+    O payload retornado é compartilhado com o cache e não deve ser alterado.
+    """
+    if usar_cache:
+        payload = cache_de_tokens.buscar(token)
+        if payload is not None:
+            return payload
+    auth = Config.AUTH
+    payload = backend().decodificar(token, auth.SECRET_KEY, auth.ALGORITHM)
+    if usar_cache:
+        cache_de_tokens.guardar(token, payload)
+    return payload
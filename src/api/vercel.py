@@ -1,3 +1,9 @@
-from src.api.app import get_app
+import os
+
+# Cada instância da Vercel atende uma requisição por vez e pode ser congelada
+# entre invocações: usa o acesso ao banco otimizado para serverless.
+os.environ.setdefault("DB_SERVERLESS", "True")
+
+from src.api.app import get_app  # noqa: E402
 
 app = get_app()
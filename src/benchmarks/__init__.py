@@ -0,0 +1 @@
+"""Benchmarks de desempenho da API, executados com `python -m src.benchmarks.<nome>`."""
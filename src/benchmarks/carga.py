@@ -0,0 +1,273 @@
+"""
+Teste de carga das rotas principais, com latências p50/p95/p99 e vazão por rota.
+
+Autentica os professores criados por `src.benchmarks.dados` e dispara as
+requisições de cada rota com `--concorrencia` clientes assíncronos. Sem `--url`
+a aplicação roda no próprio processo (transporte ASGI); com `--url` o alvo é um
+servidor já em execução, que deve usar o mesmo banco configurado aqui.
+
+Os resultados podem ser gravados como baseline e comparados em execuções
+seguintes: uma rota regride quando o p95 sobe ou a vazão cai mais que a
+`--tolerancia`, e nesse caso o comando termina com código 1.
+
+    python -m src.benchmarks.dados
+    python -m src.benchmarks.carga [--url http://localhost:8000]
+        [--concorrencia 20] [--requisicoes 500] [--salvar-baseline carga.json]
+    python -m src.benchmarks.carga --baseline carga.json [--tolerancia 0.2]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Optional
+
+import httpx
+from sqlalchemy import select
+
+from src.api.database.models.aluno import Aluno
+from src.api.database.models.professor import Professor
+from src.api.database.models.usuario import Usuario
+from src.api.database.session import get_engine, get_sessionmaker
+from src.api.utils.enums import StatusSolicitacaoEnum
+from src.benchmarks.dados import PREFIXO_EMAIL, SENHA
+
+Requisicao = Callable[[httpx.AsyncClient, dict, random.Random], Awaitable]
+
+ROTAS: dict[str, Requisicao] = {
+    "token": lambda cliente, sessao, aleatorio: cliente.post(
+        "/token/", data={"username": sessao["email"], "password": SENHA}
+    ),
+    "usuarios/me": lambda cliente, sessao, aleatorio: cliente.get(
+        "/usuarios/me", headers=sessao["headers"]
+    ),
+    "professores/orientandos": lambda cliente, sessao, aleatorio: cliente.get(
+        "/professores/orientandos/", headers=sessao["headers"]
+    ),
+    "tarefas/aluno": lambda cliente, sessao, aleatorio: cliente.get(
+        f"/tarefas/aluno/{aleatorio.choice(sessao['alunos'])}",
+        headers=sessao["headers"],
+    ),
+    "solicitacoes": lambda cliente, sessao, aleatorio: cliente.get(
+        f"/solicitacoes/{aleatorio.choice(list(StatusSolicitacaoEnum))}"
+        f"/{sessao['professor_id']}",
+        headers=sessao["headers"],
+    ),
+}
+
+
+def percentil(amostras_ordenadas: list[float], p: float) -> float:
+    """Percentil pelo método do posto mais próximo."""
+    if not amostras_ordenadas:
+        return 0.0
+    posto = math.ceil(p / 100 * len(amostras_ordenadas))
+    return amostras_ordenadas[max(posto, 1) - 1]
+
+
+def resumir(latencias: list[float], erros: int, duracao: float) -> dict:
+    ordenadas = sorted(latencias)
+    return {
+        "requisicoes": len(latencias) + erros,
+        "erros": erros,
+        "rps": round(len(latencias) / duracao, 2) if duracao else 0.0,
+        "p50_ms": round(percentil(ordenadas, 50) * 1000, 2),
+        "p95_ms": round(percentil(ordenadas, 95) * 1000, 2),
+        "p99_ms": round(percentil(ordenadas, 99) * 1000, 2),
+    }
+
+
+def comparar(resultados: dict, baseline: dict, tolerancia: float) -> list[str]:
+    """Lista as rotas cujo p95 ou vazão pioraram além da tolerância."""
+    regressoes = []
+    for rota, atual in resultados.items():
+        anterior = baseline.get(rota)
+        if anterior is None:
+            continue
+        if atual["p95_ms"] > anterior["p95_ms"] * (1 + tolerancia):
+            regressoes.append(
+                f"{rota}: p95 {anterior['p95_ms']} ms -> {atual['p95_ms']} ms"
+            )
+        if atual["rps"] < anterior["rps"] * (1 - tolerancia):
+            regressoes.append(f"{rota}: rps {anterior['rps']} -> {atual['rps']}")
+        if atual["erros"] > anterior["erros"]:
+            regressoes.append(f"{rota}: erros {anterior['erros']} -> {atual['erros']}")
+    return regressoes
+
+
+async def _buscar_professores(quantidade: int) -> list[dict]:
+    """Professores populados para a carga, com os ids de seus orientandos."""
+    async with get_sessionmaker()() as session:
+        professores = (
+            await session.execute(
+                select(Professor.id, Usuario.email)
+                .join(Usuario, Professor.usuario_id == Usuario.id)
+                .where(Usuario.email.startswith(PREFIXO_EMAIL))
+                .order_by(Professor.id)
+                .limit(quantidade)
+            )
+        ).all()
+        alunos = defaultdict(list)
+        for aluno_id, orientador_id in await session.execute(
+            select(Aluno.id, Aluno.orientador_id).where(
+                Aluno.orientador_id.in_([professor.id for professor in professores])
+            )
+        ):
+            alunos[orientador_id].append(aluno_id)
+
+    return [
+        {"professor_id": id, "email": email, "alunos": alunos[id]}
+        for id, email in professores
+        if alunos[id]
+    ]
+
+
+async def _autenticar(cliente: httpx.AsyncClient, sessoes: list[dict]) -> None:
+    async def autenticar(sessao: dict) -> None:
+        resposta = await ROTAS["token"](cliente, sessao, None)
+        resposta.raise_for_status()
+        sessao["headers"] = {
+            "Authorization": f"Bearer {resposta.json()['access_token']}"
+        }
+
+    await asyncio.gather(*(autenticar(sessao) for sessao in sessoes))
+
+
+async def _executar_rota(
+    cliente: httpx.AsyncClient,
+    requisicao: Requisicao,
+    sessoes: list[dict],
+    concorrencia: int,
+    requisicoes: int,
+    semente: int,
+) -> dict:
+    latencias: list[float] = []
+    erros = 0
+    restantes = requisicoes
+
+    async def cliente_virtual(indice: int) -> None:
+        nonlocal erros, restantes
+        aleatorio = random.Random(semente + indice)
+        sessao = sessoes[indice % len(sessoes)]
+        while restantes > 0:
+            restantes -= 1
+            inicio = time.perf_counter()
+            try:
+                resposta = await requisicao(cliente, sessao, aleatorio)
+            except httpx.HTTPError:
+                erros += 1
+                continue
+            if resposta.is_error:
+                erros += 1
+            else:
+                latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente_virtual(i) for i in range(concorrencia)))
+    return resumir(latencias, erros, time.perf_counter() - inicio)
+
+
+async def executar(
+    url: Optional[str] = None,
+    concorrencia: int = 20,
+    requisicoes: int = 500,
+    aquecimento: int = 20,
+    rotas: Optional[list[str]] = None,
+    semente: int = 42,
+) -> dict[str, dict]:
+    """Executa a carga em cada rota, em sequência, e retorna o resumo por rota."""
+    try:
+        sessoes = await _buscar_professores(concorrencia)
+        if not sessoes:
+            raise SystemExit(
+                "Nenhum professor de carga encontrado; execute "
+                "`python -m src.benchmarks.dados` antes."
+            )
+
+        if url is None:
+            from src.api.app import get_app
+
+            # Um erro 500 conta como erro da rota em vez de interromper a carga.
+            transporte = httpx.ASGITransport(app=get_app(), raise_app_exceptions=False)
+            cliente = httpx.AsyncClient(
+                transport=transporte, base_url="http://carga", timeout=60
+            )
+        else:
+            cliente = httpx.AsyncClient(base_url=url, timeout=60)
+
+        resultados = {}
+        async with cliente:
+            await _autenticar(cliente, sessoes)
+            for nome in rotas or ROTAS:
+                requisicao = ROTAS[nome]
+                await _executar_rota(
+                    cliente, requisicao, sessoes, concorrencia, aquecimento, semente
+                )
+                resultados[nome] = await _executar_rota(
+                    cliente, requisicao, sessoes, concorrencia, requisicoes, semente
+                )
+        return resultados
+    finally:
+        # A conexão do pool (no aiosqlite, uma thread) prenderia o processo.
+        await get_engine().dispose()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--concorrencia", type=int, default=20)
+    parser.add_argument("--requisicoes", type=int, default=500)
+    parser.add_argument("--aquecimento", type=int, default=20)
+    parser.add_argument("--rotas", nargs="+", choices=list(ROTAS), default=None)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--salvar-baseline", default=None)
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    resultados = asyncio.run(
+        executar(
+            args.url,
+            args.concorrencia,
+            args.requisicoes,
+            args.aquecimento,
+            args.rotas,
+            args.semente,
+        )
+    )
+
+    print(
+        f"{args.requisicoes} requisições por rota, "
+        f"{args.concorrencia} clientes simultâneos:"
+    )
+    print(
+        f"  {'rota':<24} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'erros':>6}"
+    )
+    for rota, r in resultados.items():
+        print(
+            f"  {rota:<24} {r['rps']:>8.1f} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f}"
+            f" {r['p99_ms']:>8.2f} {r['erros']:>6}"
+        )
+
+    if args.salvar_baseline:
+        with open(args.salvar_baseline, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+        print(f"Baseline gravada em {args.salvar_baseline}.")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo), args.tolerancia)
+        if regressoes:
+            print(f"Regressões acima de {args.tolerancia:.0%}:")
+            for regressao in regressoes:
+                print(f"  {regressao}")
+            sys.exit(1)
+        print(f"Sem regressões acima de {args.tolerancia:.0%} em relação à baseline.")
+
+
+if __name__ == "__main__":
+    main()
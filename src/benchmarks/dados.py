@@ -0,0 +1,436 @@
+"""
+Gera e popula o banco configurado com um volume sintético de dados realista.
+
+Os dados são determinísticos pela semente e pela data de referência: CPFs com
+dígitos verificadores válidos, telefones no formato nacional, matrículas
+numéricas, alunos de mestrado e doutorado com ingressos espalhados por vários
+anos, tarefas com prazos derivados das tarefas base do curso e solicitações em
+todos os status. As linhas são geradas sob demanda e inseridas em lotes de
+INSERTs multi-linha, então milhões de linhas não ficam todas em memória.
+
+Todos os usuários criados têm o email com o prefixo `PREFIXO_EMAIL` e a senha
+`SENHA`, para que o teste de carga encontre e autentique os professores.
+
+    python -m src.benchmarks.dados [--professores 200] [--alunos 5000]
+        [--tarefas 100000] [--tarefas-base 8] [--semente 42]
+        [--referencia 2024-07-01]
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import case, false, func, insert, select, true
+
+from src.api.database.models.aluno import Aluno
+from src.api.database.models.professor import Professor
+from src.api.database.models.progresso_aluno import ProgressoAluno
+from src.api.database.models.solicitacoes import Solicitacao
+from src.api.database.models.tarefa import Tarefa
+from src.api.database.models.tarefas_base import TarefaBase
+from src.api.database.models.usuario import Usuario
+from src.api.database.session import get_engine, get_sessionmaker
+from src.api.utils.enums import CursoAlunoEnum, StatusSolicitacaoEnum
+from src.api.utils.notificacao import calcular_proxima_notificacao
+from src.api.utils.senha import gerar_hash_senha
+
+PREFIXO_EMAIL = "carga."
+SENHA = "carga-pgcop"
+TIPO_PROFESSOR, TIPO_ALUNO = 2, 3
+TAMANHO_DO_LOTE = 1000
+
+NOMES = (
+    "Ana",
+    "Bruno",
+    "Carla",
+    "Daniel",
+    "Elisa",
+    "Fábio",
+    "Gabriela",
+    "Heitor",
+    "Iara",
+    "João",
+    "Larissa",
+    "Marcos",
+    "Natália",
+    "Otávio",
+    "Paula",
+    "Rafael",
+)
+SOBRENOMES = (
+    "Almeida",
+    "Barbosa",
+    "Cardoso",
+    "Dias",
+    "Esteves",
+    "Ferreira",
+    "Gomes",
+    "Lima",
+    "Moura",
+    "Nogueira",
+    "Oliveira",
+    "Pereira",
+    "Queiroz",
+    "Santos",
+)
+DDDS = (11, 21, 27, 31, 41, 48, 51, 61, 62, 71, 73, 75, 79, 81, 85, 91, 92, 98)
+PROPORCAO_DOUTORADO = 0.4
+DURACAO_EM_MESES = {CursoAlunoEnum.MESTRADO: 24, CursoAlunoEnum.DOUTORADO: 48}
+ETAPAS = (
+    "Disciplinas obrigatórias",
+    "Proficiência em inglês",
+    "Estágio docência",
+    "Plano de pesquisa",
+    "Artigo em periódico",
+    "Qualificação",
+    "Relatório anual",
+    "Defesa",
+)
+# Além da solicitação aceita pelo orientador, uma parte dos alunos tem
+# solicitações pendentes ou recusadas com outros professores.
+PROPORCAO_SOLICITACOES_EXTRAS = 0.3
+
+
+def gerar_cpf(numero: int) -> str:
+    """
+    CPF válido e formatado, distinto para cada `numero` até 999.999.989. Os
+    nove primeiros dígitos pulam as sequências repetidas (000.000.000,
+    111.111.111...), que a validação rejeita.
+    """
+    numero %= 10**9 - 10
+    numero += numero // 111_111_110 + 1
+    digitos = [int(d) for d in f"{numero:09d}"]
+    for tamanho in (9, 10):
+        soma = sum(d * (tamanho + 1 - i) for i, d in enumerate(digitos))
+        digitos.append(soma * 10 % 11 % 10)
+    cpf = "".join(map(str, digitos))
+    return f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+
+
+def _letras(numero: int) -> str:
+    """`numero` em base 26 com letras (0 -> "a", 25 -> "z", 26 -> "ba")."""
+    letras = ""
+    while True:
+        numero, resto = divmod(numero, 26)
+        letras = chr(ord("a") + resto) + letras
+        if not numero:
+            return letras
+
+
+def gerar_nome(numero: int) -> str:
+    """
+    Nome distinto para cada `numero`, sem dígitos: o schema de usuário só
+    aceita letras e espaços. Os números além das combinações de nome e
+    sobrenome viram um último sobrenome escrito com letras.
+    """
+    numero, nome = divmod(numero, len(NOMES))
+    numero, sobrenome = divmod(numero, len(SOBRENOMES))
+    partes = [NOMES[nome], SOBRENOMES[sobrenome]]
+    if numero:
+        partes.append(_letras(numero).capitalize())
+    return " ".join(partes)
+
+
+def gerar_telefone(aleatorio: random.Random) -> str:
+    """Celular brasileiro no formato nacional, como o schema de aluno grava."""
+    numero = aleatorio.randrange(10**8)
+    return f"({aleatorio.choice(DDDS)}) 9{numero // 10**4:04d}-{numero % 10**4:04d}"
+
+
+def gerar_matricula(ingresso: date, curso: CursoAlunoEnum, indice: int) -> str:
+    """Matrícula numérica: ano e semestre de ingresso, curso e sequencial."""
+    semestre = 1 if ingresso.month <= 6 else 2
+    codigo_curso = 1 if curso == CursoAlunoEnum.MESTRADO else 2
+    return f"{ingresso.year}{semestre}{codigo_curso}{indice % 10**6:06d}"
+
+
+def gerar_tarefas_base(quantidade: int) -> list[dict]:
+    """Tarefas base de cada curso, com prazos distribuídos pela duração dele."""
+    tarefas_base = []
+    for curso, duracao in DURACAO_EM_MESES.items():
+        for i in range(quantidade):
+            etapa = ETAPAS[i % len(ETAPAS)]
+            tarefas_base.append(
+                {
+                    "nome": etapa if i < len(ETAPAS) else f"{etapa} {i}",
+                    "descricao": f"{etapa} ({curso.name.lower()})",
+                    "prazo_em_meses": max(1, duracao * (i + 1) // quantidade),
+                    "curso": curso,
+                }
+            )
+    return tarefas_base
+
+
+def _em_lotes(valores: Iterable[dict]) -> Iterator[list[dict]]:
+    iterador = iter(valores)
+    while lote := list(itertools.islice(iterador, TAMANHO_DO_LOTE)):
+        yield lote
+
+
+async def _inserir(session, model, valores: Iterable[dict]) -> list[int]:
+    """Insere em lotes de INSERTs multi-linha e retorna os ids na ordem."""
+    ids = []
+    for lote in _em_lotes(valores):
+        resultado = await session.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True), lote
+        )
+        ids.extend(resultado.scalars().all())
+    return ids
+
+
+async def _inserir_sem_ids(session, model, valores: Iterable[dict]) -> int:
+    """Como `_inserir`, sem RETURNING, para tabelas cujos ids não são usados."""
+    quantidade = 0
+    for lote in _em_lotes(valores):
+        await session.execute(insert(model), lote)
+        quantidade += len(lote)
+    return quantidade
+
+
+async def _preencher_progresso(session, primeiro_aluno_id: int) -> None:
+    """Resumo de progresso dos alunos inseridos, como na migração que o criou."""
+    agora = func.current_timestamp()
+    await session.execute(
+        insert(ProgressoAluno).from_select(
+            [
+                "aluno_id",
+                "total_tarefas",
+                "tarefas_concluidas",
+                "proximo_prazo",
+                "created_at",
+                "updated_at",
+            ],
+            select(
+                Aluno.id,
+                func.count(Tarefa.id),
+                func.coalesce(
+                    func.sum(case((Tarefa.concluida == true(), 1), else_=0)),
+                    0,
+                ),
+                func.min(case((Tarefa.concluida == false(), Tarefa.data_prazo))),
+                agora,
+                agora,
+            )
+            .outerjoin(Tarefa, Tarefa.aluno_id == Aluno.id)
+            .where(Aluno.id >= primeiro_aluno_id)
+            .group_by(Aluno.id),
+        )
+    )
+
+
+async def popular(
+    professores: int = 200,
+    alunos: int = 5000,
+    tarefas: int = 100000,
+    tarefas_base: int = 8,
+    semente: int = 42,
+    referencia: Optional[date] = None,
+) -> dict[str, int]:
+    """
+    Insere o volume pedido e retorna a quantidade de linhas por tabela.
+
+    `referencia` é o "hoje" dos dados gerados (padrão: a data atual): tarefas
+    com prazo anterior a ela tendem a estar concluídas.
+    """
+    aleatorio = random.Random(semente)
+    agora = datetime.utcnow()
+    referencia = referencia or agora.date()
+    senha_hash = await gerar_hash_senha(SENHA)
+
+    def usuarios(tipo: str, quantidade: int, tipo_usuario_id: int) -> Iterator[dict]:
+        for i in range(quantidade):
+            yield {
+                "nome": gerar_nome(i),
+                "email": f"{PREFIXO_EMAIL}{tipo}.{semente}.{i}@ufba.br",
+                "senha_hash": senha_hash,
+                "tipo_usuario_id": tipo_usuario_id,
+                "created_at": agora,
+                "updated_at": agora,
+            }
+
+    # Ingressos em março ou agosto dos últimos oito anos antes da referência.
+    ingressos = [
+        date(ano, mes, 1)
+        for ano in range(referencia.year - 8, referencia.year + 1)
+        for mes in (3, 8)
+        if date(ano, mes, 1) <= referencia
+    ]
+    dados_alunos = []
+    for i in range(alunos):
+        curso = (
+            CursoAlunoEnum.DOUTORADO
+            if aleatorio.random() < PROPORCAO_DOUTORADO
+            else CursoAlunoEnum.MESTRADO
+        )
+        ingresso = aleatorio.choice(ingressos)
+        duracao = timedelta(days=DURACAO_EM_MESES[curso] * 30)
+        qualificacao = ingresso + duracao / 2
+        defesa = ingresso + duracao
+        dados_alunos.append(
+            {
+                "cpf": gerar_cpf(semente * 1_000_003 + i),
+                "telefone": gerar_telefone(aleatorio),
+                "matricula": gerar_matricula(ingresso, curso, i),
+                "curso": curso,
+                "data_ingresso": ingresso,
+                "data_qualificacao": (
+                    qualificacao if qualificacao <= referencia else None
+                ),
+                "data_defesa": defesa if defesa <= referencia else None,
+            }
+        )
+
+    try:
+        async with get_sessionmaker()() as session:
+            bases = gerar_tarefas_base(tarefas_base)
+            await _inserir_sem_ids(
+                session,
+                TarefaBase,
+                ({**base, "created_at": agora, "updated_at": agora} for base in bases),
+            )
+            bases_por_curso = {
+                curso: [base for base in bases if base["curso"] == curso]
+                for curso in CursoAlunoEnum
+            }
+
+            usuarios_professores = await _inserir(
+                session, Usuario, usuarios("professor", professores, TIPO_PROFESSOR)
+            )
+            professores_ids = await _inserir(
+                session,
+                Professor,
+                (
+                    {"usuario_id": usuario_id, "created_at": agora, "updated_at": agora}
+                    for usuario_id in usuarios_professores
+                ),
+            )
+
+            usuarios_alunos = await _inserir(
+                session, Usuario, usuarios("aluno", alunos, TIPO_ALUNO)
+            )
+            orientadores = [professores_ids[i % professores] for i in range(alunos)]
+            alunos_ids = await _inserir(
+                session,
+                Aluno,
+                (
+                    {
+                        **dados,
+                        "orientador_id": orientador_id,
+                        "usuario_id": usuario_id,
+                        "created_at": agora,
+                        "updated_at": agora,
+                    }
+                    for dados, orientador_id, usuario_id in zip(
+                        dados_alunos, orientadores, usuarios_alunos
+                    )
+                ),
+            )
+
+            def tarefa(i: int) -> dict:
+                indice_aluno = i % alunos
+                dados = dados_alunos[indice_aluno]
+                bases_do_curso = bases_por_curso[dados["curso"]]
+                base = bases_do_curso[(i // alunos) % len(bases_do_curso)]
+                prazo = dados["data_ingresso"] + timedelta(
+                    days=base["prazo_em_meses"] * 30 + aleatorio.randint(-45, 45)
+                )
+                concluida = aleatorio.random() < (0.85 if prazo < referencia else 0.1)
+                conclusao = (
+                    min(prazo - timedelta(days=aleatorio.randrange(60)), referencia)
+                    if concluida
+                    else None
+                )
+                return {
+                    "nome": base["nome"],
+                    "descricao": base["descricao"],
+                    "data_prazo": prazo,
+                    "concluida": concluida,
+                    "data_conclusao": conclusao,
+                    "data_ultima_notificacao": agora,
+                    "data_proxima_notificacao": calcular_proxima_notificacao(
+                        prazo, concluida, agora
+                    ),
+                    "aluno_id": alunos_ids[indice_aluno],
+                    "created_at": agora,
+                    "updated_at": agora,
+                }
+
+            await _inserir_sem_ids(session, Tarefa, (tarefa(i) for i in range(tarefas)))
+
+            def solicitacoes() -> Iterator[dict]:
+                for i, aluno_id in enumerate(alunos_ids):
+                    yield {
+                        "aluno_id": aluno_id,
+                        "professor_id": orientadores[i],
+                        "status": StatusSolicitacaoEnum.ACEITA,
+                        "created_at": agora,
+                        "updated_at": agora,
+                    }
+                    extra = aleatorio.random() < PROPORCAO_SOLICITACOES_EXTRAS
+                    if professores < 2 or not extra:
+                        continue
+                    outro = (i + aleatorio.randrange(1, professores)) % professores
+                    yield {
+                        "aluno_id": aluno_id,
+                        "professor_id": professores_ids[outro],
+                        "status": aleatorio.choice(
+                            [
+                                StatusSolicitacaoEnum.PENDENTE,
+                                StatusSolicitacaoEnum.RECUSADA,
+                            ]
+                        ),
+                        "created_at": agora,
+                        "updated_at": agora,
+                    }
+
+            total_solicitacoes = await _inserir_sem_ids(
+                session, Solicitacao, solicitacoes()
+            )
+
+            if alunos_ids:
+                await _preencher_progresso(session, alunos_ids[0])
+            await session.commit()
+    finally:
+        # A conexão do pool (no aiosqlite, uma thread) prenderia o processo.
+        await get_engine().dispose()
+
+    return {
+        "tarefas_base": len(bases),
+        "professores": professores,
+        "alunos": alunos,
+        "tarefas": tarefas,
+        "solicitacoes": total_solicitacoes,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--professores", type=int, default=200)
+    parser.add_argument("--alunos", type=int, default=5000)
+    parser.add_argument("--tarefas", type=int, default=100000)
+    parser.add_argument("--tarefas-base", type=int, default=8)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--referencia", type=date.fromisoformat, default=None)
+    args = parser.parse_args(argv)
+
+    inicio = datetime.now()
+    inseridas = asyncio.run(
+        popular(
+            args.professores,
+            args.alunos,
+            args.tarefas,
+            args.tarefas_base,
+            args.semente,
+            args.referencia,
+        )
+    )
+    for tabela, quantidade in inseridas.items():
+        print(f"  {tabela:<14} {quantidade:>9}")
+    print(f"Concluído em {(datetime.now() - inicio).total_seconds():.1f} s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Compara o caminho padrão de resposta das listagens com o caminho rápido.
+
+- padrão: modelo pydantic por linha, revalidação contra o `response_model`,
+  `jsonable_encoder` e `JSONResponse`;
+- rápido: dicionário por linha (colunas consultadas) e `RespostaJSONRapida`.
+
+    python -m src.benchmarks.serializacao [--linhas 1000] [--repeticoes 20]
+"""
+
+import argparse
+import json
+import timeit
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+try:
+    from fastapi.utils import create_model_field
+except ImportError:  # FastAPI < 0.112
+    from fastapi.utils import create_response_field as create_model_field
+
+from src.api.entrypoints.tarefas.schema import TarefaInDB
+from src.api.utils.respostas import RespostaJSONRapida, orjson
+
+COLUNAS_TAREFA = (
+    "nome",
+    "descricao",
+    "data_prazo",
+    "aluno_id",
+    "concluida",
+    "data_conclusao",
+    "id",
+)
+
+
+def gerar_linhas(quantidade: int) -> list[tuple]:
+    inicio = date(2024, 3, 1)
+    return [
+        (
+            f"Tarefa {i}",
+            f"Descrição da tarefa {i}",
+            inicio + timedelta(days=i % 720),
+            1 + i % 50,
+            i % 3 == 0,
+            inicio + timedelta(days=i % 360) if i % 3 == 0 else None,
+            i + 1,
+        )
+        for i in range(quantidade)
+    ]
+
+
+def caminho_padrao(linhas: list[tuple], campo_resposta) -> bytes:
+    tarefas = []
+    for linha in linhas:
+        tarefa = SimpleNamespace(**dict(zip(COLUNAS_TAREFA, linha)))
+        tarefa.data_ultima_notificacao = datetime(2024, 3, 1)
+        tarefas.append(
+            TarefaInDB(
+                id=tarefa.id,
+                aluno_id=tarefa.aluno_id,
+                nome=tarefa.nome,
+                data_ultima_notificacao=tarefa.data_ultima_notificacao,
+                data_conclusao=tarefa.data_conclusao,
+                concluida=tarefa.concluida,
+                descricao=tarefa.descricao,
+                data_prazo=tarefa.data_prazo,
+            )
+        )
+    return JSONResponse(_serializar(campo_resposta, tarefas)).body
+
+
+def _serializar(campo_resposta, conteudo):
+    # Com is_coroutine=True a serialização não aguarda nada: executa a corrotina
+    # diretamente, sem o custo de criar um event loop a cada repetição.
+    corrotina = serialize_response(
+        field=campo_resposta, response_content=conteudo, is_coroutine=True
+    )
+    try:
+        corrotina.send(None)
+    except StopIteration as fim:
+        return fim.value
+    raise RuntimeError("serialize_response suspendeu inesperadamente.")
+
+
+def caminho_rapido(linhas: list[tuple]) -> bytes:
+    tarefas = [dict(zip(COLUNAS_TAREFA, linha)) for linha in linhas]
+    return RespostaJSONRapida(tarefas).body
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--linhas", type=int, default=1000)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    linhas = gerar_linhas(args.linhas)
+    campo_resposta = create_model_field(name="Response", type_=list[TarefaInDB])
+
+    padrao, rapido = caminho_padrao(linhas, campo_resposta), caminho_rapido(linhas)
+    assert json.loads(padrao) == json.loads(rapido), "Os caminhos divergem."
+
+    resultados = {
+        "padrão": min(
+            timeit.repeat(
+                lambda: caminho_padrao(linhas, campo_resposta),
+                number=1,
+                repeat=args.repeticoes,
+            )
+        ),
+        "rápido": min(
+            timeit.repeat(
+                lambda: caminho_rapido(linhas), number=1, repeat=args.repeticoes
+            )
+        ),
+    }
+    encoder = "orjson" if orjson is not None else "json"
+    print(f"{args.linhas} tarefas, melhor de {args.repeticoes} execuções ({encoder}):")
+    for nome, segundos in resultados.items():
+        print(f"  {nome:<8} {segundos * 1000:8.2f} ms")
+    print(f"  ganho    {resultados['padrão'] / resultados['rápido']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Microbenchmarks das funções da camada de serviço chamadas a cada requisição.
+
+Mede, em microssegundos por chamada (melhor de `--repeticoes`), a criação e a
+verificação de tokens, os validadores dos schemas de usuário e aluno, os
+modelos parciais gerados por `partial_model`, o `load_html` e os conversores
+`*_in_db`. A consulta do Lattes ao CNPq feita pela validação do aluno é
+respondida localmente, para medir só o código da aplicação. Com `--salvar` o
+resultado é gravado em `<--diretorio>/<commit>.json`; `--comparar <commit>`
+compara a execução atual com um resultado gravado e termina com código 1
+quando algum caso fica mais lento que a `--tolerancia`.
+
+    python -m src.benchmarks.servicos [--casos token.criar ...] [--salvar]
+        [--jwt-backend jose|pyjwt]
+    python -m src.benchmarks.servicos --comparar a1b2c3d [--tolerancia 0.2]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+from datetime import date, datetime
+from typing import Callable
+from unittest import mock
+
+import httpx
+
+from src.api.config import Config
+from src.api.database.models.aluno import Aluno
+from src.api.database.models.professor import Professor
+from src.api.database.models.solicitacoes import Solicitacao
+from src.api.database.models.tarefa import Tarefa
+from src.api.database.models.tipo_usuario import TipoUsuario
+from src.api.database.models.usuario import Usuario
+from src.api.entrypoints.alunos.schema import AlunoAtualizado, AlunoNovo
+from src.api.html_loader import load_html
+from src.api.schemas.usuario import UsuarioAtualizado, UsuarioNovo
+from src.api.services.aluno import ServicoAluno
+from src.api.services.auth import ServicoAuth
+from src.api.services.professor import ServiceProfessor
+from src.api.services.solicitacao import ServicoSolicitacao
+from src.api.services.tarefa import ServiceTarefa
+from src.api.utils.enums import CursoAlunoEnum, StatusSolicitacaoEnum, TipoUsuarioEnum
+from src.api.utils.tokens import decodificar_token
+
+DIRETORIO_PADRAO = ".benchmarks/servicos"
+
+ALUNO = {
+    "nome": "Jean Loui Bernard",
+    "email": "alunojeanjesus@ufba.br",
+    "tipo_usuario": TipoUsuarioEnum.ALUNO,
+    "senha": "1Password!",
+    "cpf": "340.308.910-04",
+    "telefone": "(71) 99166-3737",
+    "matricula": "123456789",
+    "curso": CursoAlunoEnum.MESTRADO,
+    "data_ingresso": "2023-03-01",
+    "orientador_id": 1,
+}
+
+
+def _executar(corrotina):
+    # As corrotinas medidas não aguardam nada: executá-las diretamente evita
+    # medir o custo de um event loop a cada chamada.
+    try:
+        corrotina.send(None)
+    except StopIteration as fim:
+        return fim.value
+    raise RuntimeError("A corrotina suspendeu inesperadamente.")
+
+
+def _entidades() -> dict:
+    """Entidades ORM transitórias, como as carregadas pelas consultas."""
+
+    def usuario(nome: str, email: str, tipo: TipoUsuarioEnum) -> Usuario:
+        return Usuario(nome=nome, email=email, tipo_usuario=TipoUsuario(titulo=tipo))
+
+    professor = Professor(
+        id=1,
+        usuario=usuario(
+            "Fred Durao", "fred_professor@ufba.br", TipoUsuarioEnum.PROFESSOR
+        ),
+    )
+    aluno = Aluno(
+        id=1,
+        usuario_id=2,
+        usuario=usuario(ALUNO["nome"], ALUNO["email"], TipoUsuarioEnum.ALUNO),
+        cpf="34030891004",
+        telefone=ALUNO["telefone"],
+        matricula=ALUNO["matricula"],
+        lattes="http://lattes.cnpq.br/1234567890123456",
+        curso=CursoAlunoEnum.MESTRADO,
+        data_ingresso=date(2023, 3, 1),
+        orientador_id=1,
+        orientador=professor,
+    )
+    tarefa = Tarefa(
+        id=1,
+        aluno_id=1,
+        nome="Qualificação",
+        descricao="Defesa do projeto",
+        data_prazo=date(2024, 3, 1),
+        data_ultima_notificacao=datetime(2024, 1, 1),
+        concluida=False,
+    )
+    solicitacao = Solicitacao(
+        id=1,
+        aluno_id=1,
+        aluno=aluno,
+        professor_id=1,
+        professor=professor,
+        status=StatusSolicitacaoEnum.PENDENTE,
+    )
+    return {
+        "professor": professor,
+        "aluno": aluno,
+        "tarefa": tarefa,
+        "solicitacao": solicitacao,
+    }
+
+
+def montar_casos() -> dict[str, Callable[[], object]]:
+    auth = ServicoAuth(None)
+    token = auth.criar_access_token({"sub": ALUNO["email"]}, TipoUsuarioEnum.ALUNO)
+    entidades = _entidades()
+    usuario = {k: ALUNO[k] for k in ("nome", "email", "tipo_usuario", "senha")}
+
+    return {
+        "token.criar": lambda: auth.criar_access_token(
+            {"sub": ALUNO["email"]}, TipoUsuarioEnum.ALUNO
+        ),
+        "token.verificar": lambda: _executar(auth.verificar_token(token)),
+        "token.verificar_sem_cache": lambda: decodificar_token(token, usar_cache=False),
+        "schema.usuario_novo": lambda: UsuarioNovo(**usuario),
+        "schema.aluno_novo": lambda: AlunoNovo(**ALUNO),
+        "schema.usuario_atualizado": lambda: UsuarioAtualizado(nome=ALUNO["nome"]),
+        "schema.aluno_atualizado": lambda: AlunoAtualizado(
+            telefone=ALUNO["telefone"], cpf=ALUNO["cpf"]
+        ),
+        "html.new_password_token": lambda: load_html(
+            "new_password_token", name=ALUNO["nome"], token="A1B2C3"
+        ),
+        "html.task_near_to_deadline": lambda: load_html(
+            "task_near_to_deadline",
+            name=ALUNO["nome"],
+            task_title="Qualificação",
+            task_description="Defesa do projeto",
+            task_deadline="01/03/2024",
+        ),
+        "in_db.professor": lambda: ServiceProfessor(None).tipo_usuario_in_db(
+            entidades["professor"]
+        ),
+        "in_db.aluno": lambda: ServicoAluno(None).tipo_usuario_in_db(
+            entidades["aluno"]
+        ),
+        "in_db.tarefa": lambda: ServiceTarefa(None).de_tarefa_para_tarefa_in_db(
+            entidades["tarefa"]
+        ),
+        "in_db.solicitacao": lambda: ServicoSolicitacao(
+            None
+        ).de_solicitacao_para_solicitacao_in_db(entidades["solicitacao"]),
+    }
+
+
+def _lattes_encontrado(url: str, **kwargs) -> httpx.Response:
+    """Resposta do CNPq para um currículo existente (sem redirecionamento)."""
+    return httpx.Response(200, request=httpx.Request("HEAD", url))
+
+
+def medir(
+    casos: dict[str, Callable[[], object]], repeticoes: int = 5
+) -> dict[str, float]:
+    """Microssegundos por chamada de cada caso, no melhor de `repeticoes`."""
+    resultados = {}
+    with mock.patch("httpx.head", _lattes_encontrado):
+        for nome, funcao in casos.items():
+            timer = timeit.Timer(funcao)
+            numero, _ = timer.autorange()
+            melhor = min(timer.repeat(repeat=repeticoes, number=numero))
+            resultados[nome] = round(melhor / numero * 1e6, 3)
+    return resultados
+
+
+def comparar(
+    resultados: dict[str, float], referencia: dict[str, float], tolerancia: float
+) -> list[str]:
+    """Lista os casos que ficaram mais lentos que a referência além da tolerância."""
+    return [
+        f"{nome}: {referencia[nome]} µs -> {atual} µs"
+        for nome, atual in resultados.items()
+        if nome in referencia and atual > referencia[nome] * (1 + tolerancia)
+    ]
+
+
+def commit_atual() -> str:
+    """Commit do código medido, com o sufixo `-dirty` se houver alterações."""
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecido"
+
+
+def _caminho(diretorio: str, commit: str) -> str:
+    return os.path.join(diretorio, f"{commit}.json")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--casos", nargs="+", default=None)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--salvar", action="store_true")
+    parser.add_argument("--comparar", default=None, metavar="COMMIT")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    parser.add_argument("--diretorio", default=DIRETORIO_PADRAO)
+    parser.add_argument("--jwt-backend", choices=["jose", "pyjwt"], default=None)
+    args = parser.parse_args(argv)
+
+    if not isinstance(Config.AUTH.SECRET_KEY, str):
+        Config.AUTH.SECRET_KEY = "benchmark"
+    if not isinstance(Config.AUTH.ALGORITHM, str):
+        Config.AUTH.ALGORITHM = "HS256"
+    if args.jwt_backend:
+        Config.AUTH.JWT_BACKEND = args.jwt_backend
+
+    casos = montar_casos()
+    if args.casos:
+        desconhecidos = set(args.casos) - set(casos)
+        if desconhecidos:
+            parser.error(f"casos desconhecidos: {', '.join(sorted(desconhecidos))}")
+        casos = {nome: casos[nome] for nome in args.casos}
+
+    commit = commit_atual()
+    resultados = medir(casos, args.repeticoes)
+
+    print(f"Commit {commit}, melhor de {args.repeticoes} execuções:")
+    for nome, micros in resultados.items():
+        print(f"  {nome:<28} {micros:>10.2f} µs")
+
+    if args.salvar:
+        os.makedirs(args.diretorio, exist_ok=True)
+        caminho = _caminho(args.diretorio, commit)
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+        print(f"Resultado gravado em {caminho}.")
+
+    if args.comparar:
+        caminho = _caminho(args.diretorio, args.comparar)
+        with open(caminho, encoding="utf-8") as arquivo:
+            referencia = json.load(arquivo)
+        regressoes = comparar(resultados, referencia, args.tolerancia)
+        if regressoes:
+            print(f"Mais lentos que {args.comparar} acima de {args.tolerancia:.0%}:")
+            for regressao in regressoes:
+                print(f"  {regressao}")
+            sys.exit(1)
+        print(
+            f"Sem regressões acima de {args.tolerancia:.0%} em relação a "
+            f"{args.comparar}."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,7 @@ def pytest_collection_modifyitems(items):
         "test_default_task_routes",
         "test_student_task_routes",
         "test_mailer",
+        "test_dashboard",
     ]
 
     module_mapping = {item: item.module.__name__ for item in items}
@@ -39,6 +40,18 @@ def pytest_collection_modifyitems(items):
     items[:] = sorted_items
 
 
+@pytest.fixture(scope="session")
+def banco_de_teste():
+    """
+    Schema SQLite do worker; use com `core.mocked_database.sessao_de_teste`.
+    Só os testes unitários usam este banco: os e2e compartilham o estado entre
+    módulos e rodam contra o banco configurado.
+    """
+    from core.mocked_database import criar_banco
+
+    criar_banco()
+
+
 @pytest.fixture
 def valid_student_data():
     return {
@@ -1,27 +1,131 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+"""
+Banco SQLite dos testes, acessado pelo mesmo caminho assíncrono da aplicação.
 
-from src.api.database.models.entity_model_base import EntityModelBase
+O schema é criado uma vez por processo em um arquivo próprio (cada worker do
+pytest-xdist tem o seu), com os registros de referência que as migrações
+inserem. Cada teste usa uma engine aiosqlite sobre esse arquivo e roda dentro
+de uma transação desfeita ao final: os commits feitos pela aplicação viram
+savepoints e nada persiste entre testes.
+
+    async with sessao_de_teste() as session:
+        app.dependency_overrides[get_session] = mocked_database(session)
+"""
+
+import os
+import tempfile
+from contextlib import asynccontextmanager
 
-SQLALCHEMY_DATABASE_URL = "sqlite://"
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+from src.api.database import remocao_logica  # noqa: F401
+from src.api.database.alteracoes import tabelas_alteradas
+from src.api.database.models.entity_model_base import EntityModelBase
+from src.api.database.models.tarefas_base import TarefaBase
+from src.api.database.models.tipo_usuario import TipoUsuario
+from src.api.utils.cache import invalidar_caches
+from src.api.utils.enums import CursoAlunoEnum, TipoUsuarioEnum
+
+ARQUIVO_DO_BANCO = os.path.join(
+    tempfile.gettempdir(),
+    f"pgcop-testes-{os.environ.get('PYTEST_XDIST_WORKER', 'principal')}.db",
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{ARQUIVO_DO_BANCO}"
+
+TIPOS_USUARIO = [
+    {"id": 1, "titulo": TipoUsuarioEnum.COORDENADOR, "descricao": "Coordenador"},
+    {"id": 2, "titulo": TipoUsuarioEnum.PROFESSOR, "descricao": "Professor"},
+    {"id": 3, "titulo": TipoUsuarioEnum.ALUNO, "descricao": "Aluno"},
+]
+TAREFAS_BASE = [
+    {
+        "nome": "Qualificacao de Mestrado",
+        "descricao": "Qualificação de mestrado, em até 12 meses.",
+        "prazo_em_meses": 12,
+        "curso": CursoAlunoEnum.MESTRADO,
+    },
+    {
+        "nome": "Defesa de Mestrado",
+        "descricao": "Defesa de mestrado, em até 24 meses.",
+        "prazo_em_meses": 24,
+        "curso": CursoAlunoEnum.MESTRADO,
+    },
+    {
+        "nome": "Qualificacao Doutorado",
+        "descricao": "Qualificação de doutorado, em até 24 meses.",
+        "prazo_em_meses": 24,
+        "curso": CursoAlunoEnum.DOUTORADO,
+    },
+    {
+        "nome": "Defesa Doutorado",
+        "descricao": "Defesa de doutorado, em até 48 meses.",
+        "prazo_em_meses": 48,
+        "curso": CursoAlunoEnum.DOUTORADO,
+    },
+]
 
-EntityModelBase.metadata.create_all(bind=engine)
 
+def criar_banco() -> None:
+    """Recria o schema no arquivo do worker e insere os dados de referência."""
+    engine = create_engine(f"sqlite:///{ARQUIVO_DO_BANCO}", poolclass=NullPool)
+    EntityModelBase.metadata.drop_all(bind=engine)
+    EntityModelBase.metadata.create_all(bind=engine)
+    with engine.begin() as conexao:
+        conexao.execute(insert(TipoUsuario), TIPOS_USUARIO)
+        conexao.execute(insert(TarefaBase), TAREFAS_BASE)
+    engine.dispose()
 
-def override_get_db():
+
+def _habilitar_savepoints(engine) -> None:
+    # O driver sqlite3 abre e confirma transações por conta própria, o que
+    # quebra SAVEPOINTs; o controle passa para o SQLAlchemy (receita da
+    # documentação do dialeto SQLite).
+    @event.listens_for(engine, "connect")
+    def _ao_conectar(conexao_dbapi, _):
+        conexao_dbapi.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _ao_iniciar(conexao):
+        conexao.exec_driver_sql("BEGIN")
+
+
+@asynccontextmanager
+async def sessao_de_teste():
+    """
+    Sessão assíncrona dentro de uma transação desfeita ao sair do contexto.
+    A engine é criada no event loop do teste, então o contexto pode ser usado
+    tanto com `asyncio.run` quanto com o pytest-asyncio.
+    """
+    engine = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+    _habilitar_savepoints(engine.sync_engine)
     try:
-        db = TestingSessionLocal()
-        yield db
+        async with engine.connect() as conexao:
+            transacao = await conexao.begin()
+            session = AsyncSession(
+                bind=conexao,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            try:
+                yield session
+            finally:
+                await session.close()
+                await transacao.rollback()
     finally:
-        db.close()
+        await engine.dispose()
+
+
+def mocked_database(session: AsyncSession):
+    """Substituto de `get_session` que entrega a sessão do teste às rotas."""
 
+    async def override_get_session():
+        try:
+            yield session
+            await session.commit()
+            await invalidar_caches(tabelas_alteradas(session.sync_session))
+        except Exception:
+            await session.rollback()
+            raise
 
-mocked_database = override_get_db
+    return override_get_session
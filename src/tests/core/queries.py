@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+
+from src.api.monitoring.sql import capturar_consultas
+
+
+@contextmanager
+def assert_max_queries(max_queries: int):
+    """
+    Fails the test when the wrapped block issues more than `max_queries`
+    SQL statements.
+    """
+    with capturar_consultas() as statements:
+        yield statements
+
+    assert (
+        len(statements) <= max_queries
+    ), f"Expected at most {max_queries} queries, got {len(statements)}:\n" + "\n".join(
+        f"{i}. {statement}" for i, statement in enumerate(statements, 1)
+    )
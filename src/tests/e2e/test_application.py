@@ -3,3 +3,31 @@ from core.application import client
 
 def test_health_checker():
     assert client.get("/health-check").status_code == 200
+
+
+def test_metrics():
+    client.get("/health-check")
+    resp = client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_requests_total{method="GET",route="/health-check",status="200"}'
+        in resp.text
+    )
+    assert "http_requests_in_progress" in resp.text
+    assert "db_queries_per_request_bucket" in resp.text
+
+
+def test_server_timing():
+    resp = client.get("/health-check")
+
+    assert 'db;dur=0.00;desc="0 queries"' in resp.headers["server-timing"]
+
+
+def test_readiness():
+    resp = client.get("/ready")
+
+    assert resp.status_code in (200, 503)
+    assert resp.json()["status"] in ("ready", "unavailable")
+    assert set(resp.json()["checks"]) == {"database", "migrations", "pool", "workers"}
@@ -0,0 +1,65 @@
+import pytest
+from core.application import client
+from core.base_professor import password
+
+from src.api.utils.enums import TipoUsuarioEnum
+
+coordinator_email = "coordenadordashboard@ufba.br"
+
+
+def _login(email: str) -> dict:
+    response = client.post(
+        "token/",
+        data={"username": email, "password": password, "grant_type": "password"},
+        headers={"content-type": "application/x-www-form-urlencoded"},
+    )
+    assert 200 <= response.status_code <= 299
+    token = response.json()
+    return {"Authorization": f"Bearer {token['access_token']}"}
+
+
+def _create_professor(email: str, tipo_usuario: TipoUsuarioEnum) -> None:
+    form = {
+        "nome": "Dashboard Tester",
+        "email": email,
+        "tipo_usuario": tipo_usuario,
+        "senha": password,
+    }
+    assert 200 <= client.post("/professores/", json=form).status_code <= 299
+
+
+@pytest.mark.dependency()
+def test_get_dashboard():
+    """
+    Test route for getting the aggregated dashboard as a coordinator.
+    """
+    _create_professor(coordinator_email, TipoUsuarioEnum.COORDENADOR)
+    headers = _login(coordinator_email)
+
+    response = client.get("/dashboard/", headers=headers)
+    assert 200 <= response.status_code <= 299
+
+    result = response.json()
+    assert set(result["totais"]) == {
+        "alunos",
+        "tarefas_atrasadas",
+        "tarefas_proximas_do_prazo",
+        "solicitacoes_pendentes",
+    }
+    assert result["totais"]["alunos"] == sum(c["alunos"] for c in result["cursos"])
+
+    # Creating a professor invalidates the cached dashboard.
+    _create_professor("professordashboard@ufba.br", TipoUsuarioEnum.PROFESSOR)
+    updated = client.get("/dashboard/", headers=headers).json()
+    assert len(updated["professores"]) == len(result["professores"]) + 1
+
+
+@pytest.mark.dependency(depends=["test_get_dashboard"])
+def test_get_dashboard_requires_coordinator():
+    """
+    Test that professors can not see the dashboard.
+    """
+    headers = _login("professordashboard@ufba.br")
+
+    assert client.get("/dashboard/", headers=headers).status_code >= 400
+    assert client.get("/dashboard/").status_code >= 400
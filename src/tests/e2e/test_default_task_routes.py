@@ -118,6 +118,10 @@ def test_update_default_task():
     response = client.put(url, json=form)
     assert 200 <= response.status_code <= 299
 
+    # The response already has the updated information.
+    for key, value in new_data.items():
+        assert response.json().get(key, "") == value
+
     # Get the user's information and check the changes.
     response = client.get(url)
     assert 200 <= response.status_code <= 299
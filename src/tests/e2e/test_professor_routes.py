@@ -10,6 +10,7 @@ from core.base_professor import (
     tipo_usuario,
     user_id,
 )
+from core.queries import assert_max_queries
 from loguru import logger
 
 valid_form = {
@@ -108,7 +109,8 @@ def test_get_professor_by_email():
     """
     expected = {"nome": name, "email": email, "tipo_usuario": tipo_usuario}
 
-    response = client.get(f"/professores/email/{email}")
+    with assert_max_queries(2):
+        response = client.get(f"/professores/email/{email}")
     assert 200 <= response.status_code <= 299
 
     result = response.json()
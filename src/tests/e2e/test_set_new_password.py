@@ -24,7 +24,7 @@ def test_create_token(mocker):
     Test route for creating a token to allow setting a new password.
     """
     token = "123456"
-    mocker.patch("src.api.services.new_password.generate_token", return_value=token)
+    mocker.patch("src.api.services.nova_senha.generate_token", return_value=token)
 
     # A new user must be created for testing.
     assert 200 <= client.post("professores/", json=valid_form).status_code <= 299
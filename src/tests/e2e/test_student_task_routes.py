@@ -135,6 +135,10 @@ def test_update_task(valid_task_data):
     logger.info(response.json())
     assert 200 <= response.status_code <= 299
 
+    # The response already has the updated information.
+    for key, value in new_data.items():
+        assert response.json().get(key, "") == value
+
     # Get the user's information and check the changes.
     response = client.get(url)
     logger.info(response.json())
@@ -146,6 +150,52 @@ def test_update_task(valid_task_data):
         assert result.get(key, "") == value
 
 
+@pytest.mark.dependency(depends=["test_create_task"])
+def test_batch_tasks(valid_task_data):
+    """
+    Test route for executing several task operations in one request.
+    """
+    global aluno_id
+
+    url = "/tarefas/batch"
+
+    new_task = valid_task_data.copy()
+    new_task.update({"nome": "Task created in batch", "aluno_id": aluno_id})
+    new_task["concluida"] = False
+
+    operations = [
+        {"operacao": "criar", "tarefa": new_task},
+        {
+            "operacao": "atualizar",
+            "tarefa_id": task_id,
+            "atualizacao": {"data_prazo": "2030-01-01"},
+        },
+        {"operacao": "concluir", "tarefa_id": 10**4, "conclusao": {"concluida": True}},
+    ]
+
+    response = client.post(url, json={"operacoes": operations})
+    logger.info(response.json())
+    assert 200 <= response.status_code <= 299
+
+    created, updated, missing = response.json()
+    assert created["status"] == 201
+    assert created["tarefa"]["nome"] == "Task created in batch"
+    assert updated["status"] == 200
+    assert updated["tarefa"]["data_prazo"] == "2030-01-01"
+    assert missing["status"] == 404
+    assert missing["tarefa"] is None
+
+    # The created task is removed in another batch.
+    operations = [{"operacao": "deletar", "tarefa_id": created["tarefa_id"]}]
+    response = client.post(url, json={"operacoes": operations})
+    assert response.json()[0]["status"] == 204
+    assert client.get(f"/tarefas/{created['tarefa_id']}").status_code >= 400
+
+    # Operations without the fields they need are rejected.
+    response = client.post(url, json={"operacoes": [{"operacao": "atualizar"}]})
+    assert response.status_code == 422
+
+
 @pytest.mark.dependency(depends=["test_create_task"])
 def test_delete_task():
     """
@@ -0,0 +1,45 @@
+import asyncio
+from datetime import date
+
+import pytest
+from core import mocked_database
+
+from src.api.config import Config
+from src.api.database import session
+from src.benchmarks.carga import ROTAS, executar
+from src.benchmarks.dados import popular
+
+
+@pytest.fixture
+def banco_da_carga(tmp_path, monkeypatch):
+    """Banco SQLite próprio, que a aplicação usa no lugar do configurado."""
+    monkeypatch.setattr(mocked_database, "ARQUIVO_DO_BANCO", str(tmp_path / "carga.db"))
+    mocked_database.criar_banco()
+
+    for nome, valor in {
+        "DB_DRIVERNAME": "sqlite+aiosqlite",
+        "DB_USERNAME": None,
+        "DB_PASSWORD": None,
+        "DB_HOST": None,
+        "DB_PORT": None,
+        "DB_DATABASE": mocked_database.ARQUIVO_DO_BANCO,
+        "DB_SERVERLESS": False,
+        "DB_TRANSACTION_POOLER": False,
+    }.items():
+        monkeypatch.setattr(Config.DB_CONFIG, nome, valor)
+    for nome in ("_engine", "_async_session"):
+        monkeypatch.setattr(session, nome, None)
+
+
+def test_carga_sem_erros_em_nenhuma_rota(banco_da_carga):
+    async def teste():
+        await popular(professores=2, alunos=4, tarefas=20, referencia=date(2025, 1, 1))
+        return await executar(concorrencia=2, requisicoes=2, aquecimento=0)
+
+    resultados = asyncio.run(teste())
+
+    assert list(resultados) == list(ROTAS)
+    assert {rota: r["erros"] for rota, r in resultados.items()} == dict.fromkeys(
+        ROTAS, 0
+    )
+    assert all(r["requisicoes"] == 2 for r in resultados.values())
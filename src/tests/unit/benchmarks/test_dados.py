@@ -0,0 +1,84 @@
+import random
+from datetime import date
+
+import pytest
+
+from src.api.entrypoints.alunos.schema import AlunoInDB, AlunoNovo
+from src.api.entrypoints.professores.schema import ProfessorInDB
+from src.api.schemas.usuario import UsuarioNovo
+from src.api.utils.enums import CursoAlunoEnum, TipoUsuarioEnum
+from src.benchmarks.dados import (
+    gerar_cpf,
+    gerar_matricula,
+    gerar_nome,
+    gerar_tarefas_base,
+    gerar_telefone,
+)
+
+
+@pytest.mark.parametrize(
+    "numero, cpf",
+    [
+        (0, "000.000.001-91"),
+        (111_111_110, "111.111.112-00"),
+        (340_308_906, "340.308.910-04"),
+        (553_303_595, "553.303.600-80"),
+    ],
+)
+def test_gerar_cpf_calcula_digitos_verificadores(numero: int, cpf: str):
+    assert gerar_cpf(numero) == cpf
+
+
+@pytest.mark.parametrize("indice", [0, 1, 999_999, 1_000_000])
+def test_dados_gerados_passam_na_validacao_do_aluno(
+    valid_student_data: dict, indice: int
+):
+    aleatorio = random.Random(indice)
+    dados = {
+        **valid_student_data,
+        "nome": gerar_nome(indice),
+        "cpf": gerar_cpf(indice),
+        "telefone": gerar_telefone(aleatorio),
+        "matricula": gerar_matricula(
+            date(2021, 8, 1), CursoAlunoEnum.DOUTORADO, indice
+        ),
+    }
+    # Sem lattes: a validação dele consulta o CNPq.
+    dados.pop("lattes", None)
+
+    AlunoNovo(**dados)
+    AlunoInDB(**dados, id=1, usuario_id=1)
+
+
+@pytest.mark.parametrize("indice", [0, 1, 223, 224, 1_000_000])
+def test_nomes_gerados_passam_na_validacao_do_usuario(
+    valid_professor_data: dict, indice: int
+):
+    nome = gerar_nome(indice)
+
+    UsuarioNovo(**{**valid_professor_data, "nome": nome})
+    ProfessorInDB(
+        id=1, nome=nome, email="p@ufba.br", tipo_usuario=TipoUsuarioEnum.PROFESSOR
+    )
+
+
+def test_nomes_gerados_sao_distintos():
+    assert len({gerar_nome(i) for i in range(10_000)}) == 10_000
+
+
+def test_gerar_dados_e_deterministico():
+    assert gerar_telefone(random.Random(7)) == gerar_telefone(random.Random(7))
+    assert gerar_tarefas_base(8) == gerar_tarefas_base(8)
+
+
+def test_tarefas_base_cobrem_a_duracao_de_cada_curso():
+    tarefas_base = gerar_tarefas_base(4)
+
+    prazos = {
+        curso: [t["prazo_em_meses"] for t in tarefas_base if t["curso"] == curso]
+        for curso in CursoAlunoEnum
+    }
+    assert prazos == {
+        CursoAlunoEnum.MESTRADO: [6, 12, 18, 24],
+        CursoAlunoEnum.DOUTORADO: [12, 24, 36, 48],
+    }
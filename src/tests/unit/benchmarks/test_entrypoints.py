@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("modulo", ["dados", "carga"])
+def test_script_de_benchmark_inicia(modulo: str):
+    resultado = subprocess.run(
+        [sys.executable, "-m", f"src.benchmarks.{modulo}", "--help"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert resultado.returncode == 0, resultado.stderr
+    assert "usage:" in resultado.stdout
@@ -0,0 +1,94 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+from core.mocked_database import sessao_de_teste
+from sqlalchemy import select
+
+from src.api.database.arquivamento import arquivar_removidos
+from src.api.database.models.arquivo import TABELAS_DE_ARQUIVO
+from src.api.database.models.tarefas_base import TarefaBase
+from src.api.database.remocao_logica import INCLUIR_REMOVIDOS
+from src.api.utils.enums import CursoAlunoEnum
+
+
+def _tarefa_base(nome: str, deleted_at=None) -> TarefaBase:
+    return TarefaBase(
+        nome=nome,
+        descricao="Tarefa de teste do arquivamento",
+        prazo_em_meses=1,
+        curso=CursoAlunoEnum.MESTRADO,
+        deleted_at=deleted_at,
+    )
+
+
+def test_consultas_ignoram_registros_removidos(banco_de_teste):
+    async def teste():
+        async with sessao_de_teste() as session:
+            ativa = _tarefa_base("ativa")
+            removida = _tarefa_base("removida", datetime.utcnow())
+            session.add_all([ativa, removida])
+            await session.flush()
+            query = select(TarefaBase.nome).where(
+                TarefaBase.id.in_([ativa.id, removida.id])
+            )
+            visiveis = (await session.execute(query)).scalars().all()
+            todas = (
+                (
+                    await session.execute(
+                        query.execution_options(**{INCLUIR_REMOVIDOS: True})
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            return visiveis, sorted(todas)
+
+    visiveis, todas = asyncio.run(teste())
+
+    assert visiveis == ["ativa"]
+    assert todas == ["ativa", "removida"]
+
+
+def test_arquivar_removidos_move_apenas_registros_antigos(banco_de_teste):
+    arquivo = TABELAS_DE_ARQUIVO["tarefas_base"]
+
+    async def teste():
+        async with sessao_de_teste() as session:
+            agora = datetime.utcnow()
+            antiga = _tarefa_base("removida há 60 dias", agora - timedelta(days=60))
+            recente = _tarefa_base("removida ontem", agora - timedelta(days=1))
+            session.add_all([antiga, recente])
+            await session.commit()
+            ids = [antiga.id, recente.id]
+
+            # O arquivamento usa a sessão do teste no lugar de uma sessão nova.
+            @asynccontextmanager
+            async def sessoes():
+                yield session
+
+            arquivadas = await arquivar_removidos(dias=30, sessoes=sessoes)
+
+            restantes = (
+                (
+                    await session.execute(
+                        select(TarefaBase.id)
+                        .where(TarefaBase.id.in_(ids))
+                        .execution_options(**{INCLUIR_REMOVIDOS: True})
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            no_arquivo = (
+                await session.execute(
+                    select(arquivo.c.id, arquivo.c.curso).where(arquivo.c.id.in_(ids))
+                )
+            ).all()
+            return arquivadas, restantes, no_arquivo, antiga.id, recente.id
+
+    arquivadas, restantes, no_arquivo, antiga_id, recente_id = asyncio.run(teste())
+
+    assert arquivadas["tarefas_base"] == 1
+    assert restantes == [recente_id]
+    assert no_arquivo == [(antiga_id, CursoAlunoEnum.MESTRADO.name)]
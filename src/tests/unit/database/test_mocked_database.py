@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+from core.mocked_database import mocked_database, sessao_de_teste
+from sqlalchemy import select
+
+from src.api.app import get_app
+from src.api.database.models.tarefas_base import TarefaBase
+from src.api.database.session import get_session
+from src.api.utils.enums import CursoAlunoEnum
+
+
+def test_commits_do_teste_sao_desfeitos_ao_final(banco_de_teste):
+    async def teste():
+        async with sessao_de_teste() as session:
+            session.add(
+                TarefaBase(
+                    nome="Temporária",
+                    descricao="Criada dentro do teste",
+                    prazo_em_meses=1,
+                    curso=CursoAlunoEnum.MESTRADO,
+                )
+            )
+            await session.commit()
+            durante = await session.scalar(
+                select(TarefaBase.id).where(TarefaBase.nome == "Temporária")
+            )
+        async with sessao_de_teste() as session:
+            depois = await session.scalar(
+                select(TarefaBase.id).where(TarefaBase.nome == "Temporária")
+            )
+        return durante, depois
+
+    durante, depois = asyncio.run(teste())
+
+    assert durante is not None
+    assert depois is None
+
+
+def test_rotas_usam_a_sessao_do_teste(banco_de_teste, valid_professor_data):
+    app = get_app()
+
+    async def teste():
+        async with sessao_de_teste() as session:
+            app.dependency_overrides[get_session] = mocked_database(session)
+            transporte = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transporte, base_url="http://teste"
+            ) as cliente:
+                criado = await cliente.post("/professores/", json=valid_professor_data)
+                todos = await cliente.get("/professores/todos")
+        return criado, todos
+
+    try:
+        criado, todos = asyncio.run(teste())
+    finally:
+        app.dependency_overrides.clear()
+
+    assert criado.status_code == 201
+    assert criado.json()["id"] in [professor["id"] for professor in todos.json()]
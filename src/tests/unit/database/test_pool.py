@@ -0,0 +1,34 @@
+import asyncio
+
+from core.mocked_database import SQLALCHEMY_DATABASE_URL
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.config import Config
+from src.api.database.pool import AsyncAdaptedQueuePoolMedido
+from src.api.database.session import preaquecer_pool
+from src.api.monitoring import metrics
+
+
+def test_preaquecer_pool_abre_conexoes_e_mede_espera(banco_de_teste, monkeypatch):
+    monkeypatch.setattr(Config.DB_CONFIG, "DB_ENABLE_CONNECTION_POOLING", True)
+    monkeypatch.setattr(Config.DB_CONFIG, "DB_SERVERLESS", False)
+    monkeypatch.setattr(Config.DB_CONFIG, "DB_POOL_SIZE", 3)
+    observacoes = sum(metrics.DB_POOL_WAIT._contagens)
+
+    async def preaquecer():
+        # O banco SQLite dos testes, com o pool da aplicação.
+        engine = create_async_engine(
+            SQLALCHEMY_DATABASE_URL,
+            poolclass=AsyncAdaptedQueuePoolMedido,
+            pool_size=Config.DB_CONFIG.DB_POOL_SIZE,
+        )
+        try:
+            return await preaquecer_pool(engine), engine.pool.checkedout()
+        finally:
+            await engine.dispose()
+
+    abertas, em_uso = asyncio.run(preaquecer())
+
+    assert abertas == 3
+    assert em_uso == 0
+    assert sum(metrics.DB_POOL_WAIT._contagens) >= observacoes + abertas
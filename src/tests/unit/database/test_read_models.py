@@ -0,0 +1,69 @@
+from datetime import date
+
+from src.api.database.read_models import AlunoLeitura
+from src.api.entrypoints.alunos.schema import AlunoInDB
+from src.api.utils.enums import CursoAlunoEnum, TipoUsuarioEnum
+
+
+def _aluno(**kwargs) -> AlunoLeitura:
+    dados = dict(
+        nome="Jean Loui Bernard",
+        email="alunojeanjesus@ufba.br",
+        tipo_usuario=TipoUsuarioEnum.ALUNO,
+        cpf="34030891004",
+        telefone="(71) 99166-3737",
+        matricula="123456789",
+        lattes=None,
+        curso=CursoAlunoEnum.MESTRADO,
+        data_ingresso=date(2021, 1, 1),
+        data_qualificacao=None,
+        data_defesa=None,
+        id=1,
+        usuario_id=3,
+        orientador_id=2,
+        orientador_nome="Professor Xavier",
+        orientador_email="xavier@ufba.br",
+        orientador_tipo_usuario=TipoUsuarioEnum.PROFESSOR,
+        total_tarefas=4,
+        tarefas_concluidas=1,
+        proximo_prazo=date(2025, 3, 1),
+    )
+    dados.update(kwargs)
+    return AlunoLeitura(**dados)
+
+
+def test_aluno_leitura_tem_os_campos_de_aluno_in_db():
+    aluno = _aluno().como_dict()
+
+    assert set(aluno) == set(AlunoInDB.model_fields)
+    assert aluno["orientador"] == {
+        "nome": "Professor Xavier",
+        "email": "xavier@ufba.br",
+        "tipo_usuario": TipoUsuarioEnum.PROFESSOR,
+        "id": 2,
+    }
+
+
+def test_aluno_leitura_sem_orientador():
+    aluno = _aluno(
+        orientador_id=None,
+        orientador_nome=None,
+        orientador_email=None,
+        orientador_tipo_usuario=None,
+    )
+
+    assert aluno.como_dict()["orientador"] is None
+
+
+def test_aluno_leitura_inclui_progresso():
+    progresso = _aluno().como_dict()["progresso"]
+
+    assert progresso == {
+        "aluno_id": 1,
+        "total_tarefas": 4,
+        "tarefas_concluidas": 1,
+        "proximo_prazo": date(2025, 3, 1),
+        "percentual_concluido": 25.0,
+    }
+    aluno = _aluno(total_tarefas=None, tarefas_concluidas=None, proximo_prazo=None)
+    assert aluno.como_dict()["progresso"] is None
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+from core.mocked_database import sessao_de_teste
+from sqlalchemy import select
+
+from src.api.database.models.progresso_aluno import ProgressoAluno
+from src.api.database.models.tarefa import Tarefa
+from src.api.database.models.tarefas_base import TarefaBase
+from src.api.database.repository import PGCopRepository
+from src.api.utils.enums import CursoAlunoEnum
+
+# Com `False`, o dialeto se comporta como o MySQL, sem RETURNING no UPDATE.
+COM_E_SEM_RETURNING = pytest.mark.parametrize("returning", [True, False])
+
+
+def _tarefa_base(nome: str) -> TarefaBase:
+    return TarefaBase(
+        nome=nome,
+        descricao="Criada dentro do teste",
+        prazo_em_meses=6,
+        curso=CursoAlunoEnum.MESTRADO,
+    )
+
+
+@COM_E_SEM_RETURNING
+def test_atualizar_por_id_retorna_a_linha_atualizada(banco_de_teste, returning):
+    async def teste():
+        async with sessao_de_teste() as session:
+            session.get_bind().dialect.update_returning = returning
+            repo = PGCopRepository(session)
+            ativa = await repo.criar(_tarefa_base("Ativa"))
+            removida = _tarefa_base("Removida")
+            removida.deleted_at = datetime(2024, 1, 1)
+            removida = await repo.criar(removida)
+
+            linha = await repo.atualizar_por_id(ativa.id, TarefaBase, prazo_em_meses=9)
+            return (
+                linha,
+                await repo.atualizar_por_id(removida.id, TarefaBase, prazo_em_meses=9),
+                await repo.atualizar_por_id(-1, TarefaBase, prazo_em_meses=9),
+                await session.scalar(
+                    select(TarefaBase.prazo_em_meses)
+                    .where(TarefaBase.id == removida.id)
+                    .execution_options(incluir_removidos=True)
+                ),
+            )
+
+    linha, removida, inexistente, prazo_da_removida = asyncio.run(teste())
+
+    assert linha.nome == "Ativa" and linha.prazo_em_meses == 9
+    assert removida is None and inexistente is None
+    assert prazo_da_removida == 6
+
+
+@pytest.mark.parametrize("em_lote", [True, False])
+def test_criar_em_lote_retorna_os_ids_na_ordem(banco_de_teste, em_lote):
+    nomes = ["Primeira", "Segunda", "Terceira"]
+
+    async def teste():
+        async with sessao_de_teste() as session:
+            dialeto = session.get_bind().dialect
+            dialeto.insert_executemany_returning_sort_by_parameter_order = em_lote
+            ids = await PGCopRepository(session).criar_em_lote(
+                TarefaBase,
+                [
+                    {
+                        "nome": nome,
+                        "descricao": "Criada dentro do teste",
+                        "prazo_em_meses": 6,
+                        "curso": CursoAlunoEnum.MESTRADO,
+                    }
+                    for nome in nomes
+                ],
+            )
+            por_id = dict(
+                (
+                    await session.execute(
+                        select(TarefaBase.id, TarefaBase.nome).where(
+                            TarefaBase.id.in_(ids)
+                        )
+                    )
+                ).all()
+            )
+            return ids, por_id
+
+    ids, por_id = asyncio.run(teste())
+
+    assert [por_id[id] for id in ids] == nomes
+
+
+def test_progresso_do_aluno_recalculado_na_mesma_linha(banco_de_teste):
+    # O SQLite dos testes não confere as chaves estrangeiras: o aluno é só um id.
+    aluno_id = 999
+
+    def tarefa(data_prazo: date, concluida: bool) -> Tarefa:
+        return Tarefa(
+            aluno_id=aluno_id,
+            nome="Tarefa",
+            descricao="Criada dentro do teste",
+            data_prazo=data_prazo,
+            concluida=concluida,
+        )
+
+    async def teste():
+        async with sessao_de_teste() as session:
+            repo = PGCopRepository(session)
+            await repo.criar(tarefa(date(2025, 3, 1), False))
+            await repo.atualizar_progresso_aluno(aluno_id)
+            await repo.criar(tarefa(date(2025, 1, 1), False))
+            await repo.criar(tarefa(date(2024, 6, 1), True))
+            await repo.atualizar_progresso_aluno(aluno_id)
+            return (
+                await session.execute(
+                    select(
+                        ProgressoAluno.total_tarefas,
+                        ProgressoAluno.tarefas_concluidas,
+                        ProgressoAluno.proximo_prazo,
+                    ).where(ProgressoAluno.aluno_id == aluno_id)
+                )
+            ).all()
+
+    assert asyncio.run(teste()) == [(3, 1, date(2025, 1, 1))]
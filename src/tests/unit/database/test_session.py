@@ -0,0 +1,22 @@
+from sqlalchemy.pool import NullPool
+
+from src.api.config import Config
+from src.api.database import session
+
+
+def test_pooler_em_modo_transacao_desativa_prepared_statements(monkeypatch):
+    monkeypatch.setattr(Config.DB_CONFIG, "DB_DRIVERNAME", "postgresql+asyncpg")
+    monkeypatch.setattr(Config.DB_CONFIG, "DB_TRANSACTION_POOLER", True)
+
+    connect_args = session._opcoes_de_conexao()["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert session._url().query["prepared_statement_cache_size"] == "0"
+    nomes = {connect_args["prepared_statement_name_func"]() for _ in range(2)}
+    assert len(nomes) == 2
+
+
+def test_modo_serverless_nao_mantem_conexoes(monkeypatch):
+    monkeypatch.setattr(Config.DB_CONFIG, "DB_SERVERLESS", True)
+
+    assert session._opcoes_do_pool() == {"poolclass": NullPool}
@@ -0,0 +1,89 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
+
+from core.mocked_database import sessao_de_teste
+from sqlalchemy import select
+
+from src.api.database.models.aluno import Aluno
+from src.api.database.models.tarefa import Tarefa
+from src.api.database.models.usuario import Usuario
+from src.api.mailsender.workers import task as modulo_worker
+from src.api.mailsender.workers.task import TaskMailerWorker
+from src.api.utils.enums import CursoAlunoEnum
+
+EMAIL_COM_FALHA = "falha@ufba.br"
+
+
+def test_falha_de_envio_nao_desfaz_os_avisos_enviados(banco_de_teste, monkeypatch):
+    monkeypatch.setattr(modulo_worker, "TAMANHO_DO_LOTE", 2)
+    vencido_ha = datetime.utcnow() - timedelta(days=1)
+    enviados_para = []
+
+    def send_message(dest_email, subject, html_content):
+        if dest_email == EMAIL_COM_FALHA:
+            raise RuntimeError("SendGrid fora do ar")
+        enviados_para.append(dest_email)
+
+    async def criar_tarefa(session, indice: int, email: str) -> int:
+        usuario = Usuario(nome="Aluno", email=email, senha_hash="-", tipo_usuario_id=3)
+        session.add(usuario)
+        await session.flush()
+        aluno = Aluno(
+            cpf=f"000.000.00{indice}-00",
+            telefone="(71) 90000-0000",
+            matricula=f"00000000{indice}",
+            curso=CursoAlunoEnum.MESTRADO,
+            data_ingresso=date(2023, 3, 1),
+            orientador_id=1,
+            usuario_id=usuario.id,
+        )
+        session.add(aluno)
+        await session.flush()
+        tarefa = Tarefa(
+            aluno_id=aluno.id,
+            nome="Tarefa",
+            descricao="Criada dentro do teste",
+            data_prazo=date(2024, 1, 1),
+            data_proxima_notificacao=vencido_ha + timedelta(minutes=indice),
+        )
+        session.add(tarefa)
+        await session.flush()
+        return tarefa.id
+
+    async def teste():
+        async with sessao_de_teste() as session:
+            # A primeira tarefa do primeiro lote falha; a do segundo lote só é
+            # buscada porque a tarefa com falha fica de fora da nova consulta.
+            ids = [
+                await criar_tarefa(session, 0, EMAIL_COM_FALHA),
+                await criar_tarefa(session, 1, "primeiro@ufba.br"),
+                await criar_tarefa(session, 2, "segundo@ufba.br"),
+            ]
+
+            @asynccontextmanager
+            async def sessoes():
+                yield session
+
+            worker = TaskMailerWorker()
+            monkeypatch.setattr(worker, "send_message", send_message)
+            enviados = await worker.notificar_tarefas_devidas(sessoes)
+            # Só o que o worker confirmou sobrevive a um rollback.
+            await session.rollback()
+
+            notificadas = (
+                await session.execute(
+                    select(Tarefa.id, Tarefa.data_proxima_notificacao).where(
+                        Tarefa.id.in_(ids)
+                    )
+                )
+            ).all()
+            return ids, enviados, dict(notificadas)
+
+    ids, enviados, proxima_notificacao = asyncio.run(teste())
+
+    assert enviados == 2
+    assert enviados_para == ["primeiro@ufba.br", "segundo@ufba.br"]
+    # Depois do aviso de atraso não há outro; a tarefa com falha segue devida.
+    assert proxima_notificacao[ids[0]] == vencido_ha
+    assert proxima_notificacao[ids[1]] is None and proxima_notificacao[ids[2]] is None
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+from src.api.monitoring.importtime import MODULO_APLICACAO, medir_imports, tempo_total
+
+# Orçamento para o import a frio de `src.api.app`; ajustável por ambiente (CI lenta).
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "2.5"))
+
+MODULOS_CARREGADOS_SOB_DEMANDA = ("sendgrid", "httpx", "jose", "passlib", "bcrypt")
+
+
+def test_import_a_frio_dentro_do_orcamento():
+    tempos = medir_imports(MODULO_APLICACAO)
+
+    assert tempo_total(tempos) < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_clientes_pesados_nao_sao_importados_com_a_aplicacao():
+    processo = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {MODULO_APLICACAO}; "
+            f"print(' '.join(m for m in {MODULOS_CARREGADOS_SOB_DEMANDA!r} "
+            "if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert processo.stdout.strip() == ""
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+from loguru import logger
+
+from src.api.monitoring import logs
+
+
+def registro(nivel: str) -> dict:
+    return {"level": SimpleNamespace(no=logger.level(nivel).no), "extra": {}}
+
+
+def test_taxas_de_amostragem_priorizam_o_prefixo_mais_longo():
+    taxas = logs.taxas_de_amostragem(" /alunos=0.5, /alunos/me=0,, /token=1")
+
+    assert taxas[0] == ("/alunos/me", 0.0)
+    assert set(taxas) == {("/alunos/me", 0.0), ("/alunos", 0.5), ("/token", 1.0)}
+
+
+def test_request_id_recebido_e_validado():
+    request_id, tokens = logs.iniciar_contexto("/alunos/", "abc-123")
+    assert request_id == "abc-123" == logs.id_da_requisicao.get()
+    logs.encerrar_contexto(tokens)
+    assert logs.id_da_requisicao.get() is None
+
+    request_id, tokens = logs.iniciar_contexto("/alunos/", "quebra\nde linha")
+    assert request_id != "quebra\nde linha" and len(request_id) == 32
+    logs.encerrar_contexto(tokens)
+
+
+def test_requisicao_fora_da_amostra_mantem_apenas_avisos(monkeypatch):
+    monkeypatch.setattr(logs, "_taxas", [("/alunos", 0.0)])
+
+    _, tokens = logs.iniciar_contexto("/alunos/1")
+    try:
+        assert not logs._filtrar(registro("INFO"))
+        assert logs._filtrar(registro("WARNING"))
+    finally:
+        logs.encerrar_contexto(tokens)
+
+    _, tokens = logs.iniciar_contexto("/tarefas/1")
+    try:
+        assert logs._filtrar(registro("INFO"))
+    finally:
+        logs.encerrar_contexto(tokens)
+
+
+def test_registro_recebe_o_id_da_requisicao():
+    sem_requisicao = registro("INFO")
+    logs._adicionar_contexto(sem_requisicao)
+    assert sem_requisicao["extra"]["request_id"] == "-"
+
+    _, tokens = logs.iniciar_contexto("/", "req-1")
+    try:
+        com_requisicao = registro("INFO")
+        logs._adicionar_contexto(com_requisicao)
+        assert com_requisicao["extra"]["request_id"] == "req-1"
+    finally:
+        logs.encerrar_contexto(tokens)
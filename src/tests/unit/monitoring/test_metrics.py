@@ -0,0 +1,38 @@
+from src.api.monitoring.metrics import Counter, Gauge, Histogram, Registry
+
+
+def test_counter_with_labels():
+    registry = Registry()
+    contador = registry.register(Counter("eventos", "Eventos.", ("tipo",)))
+    contador.labels(tipo="a").inc()
+    contador.labels(tipo="a").inc(2)
+    contador.labels(tipo="b").inc()
+
+    texto = registry.render()
+
+    assert "# TYPE eventos counter" in texto
+    assert 'eventos_total{tipo="a"} 3' in texto
+    assert 'eventos_total{tipo="b"} 1' in texto
+
+
+def test_gauge_function():
+    registry = Registry()
+    medidor = registry.register(Gauge("em_uso", "Em uso."))
+    medidor.set_function(lambda: 7)
+
+    assert "em_uso 7" in registry.render()
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    histograma = registry.register(Histogram("latencia", "Latência.", buckets=(1, 5)))
+    for valor in (0.5, 2, 10):
+        histograma.observe(valor)
+
+    texto = registry.render()
+
+    assert 'latencia_bucket{le="1"} 1' in texto
+    assert 'latencia_bucket{le="5"} 2' in texto
+    assert 'latencia_bucket{le="+Inf"} 3' in texto
+    assert "latencia_count 3" in texto
+    assert "latencia_sum 12.5" in texto
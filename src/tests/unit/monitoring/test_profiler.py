@@ -0,0 +1,48 @@
+import threading
+import time
+
+import pytest
+
+from src.api.monitoring import profiler
+
+
+def _funcao_ocupada(parar: threading.Event) -> None:
+    while not parar.is_set():
+        sum(range(1000))
+
+
+def test_amostragem_encontra_a_funcao_ocupada():
+    parar = threading.Event()
+    thread = threading.Thread(
+        target=_funcao_ocupada, args=(parar,), name="ocupada", daemon=True
+    )
+    thread.start()
+    try:
+        contagens = profiler.amostrar(0.2, intervalo=0.001)
+    finally:
+        parar.set()
+        thread.join()
+
+    pilhas = [pilha for pilha in contagens if pilha.startswith("ocupada;")]
+    assert pilhas
+    assert all(f"{__name__}:_funcao_ocupada" in pilha for pilha in pilhas)
+    assert not any("profiler:amostrar" in pilha for pilha in contagens)
+
+
+def test_formato_collapsed_ordenado_por_amostras():
+    contagens = profiler.Counter({"MainThread;a:f": 1, "MainThread;a:f;b:g": 3})
+
+    assert profiler.formatar_collapsed(contagens) == (
+        "MainThread;a:f;b:g 3\nMainThread;a:f 1\n"
+    )
+
+
+def test_uma_coleta_por_vez():
+    coleta = threading.Thread(target=profiler.amostrar, args=(0.3,), daemon=True)
+    coleta.start()
+    time.sleep(0.05)
+    try:
+        with pytest.raises(profiler.ProfilerEmAndamentoError):
+            profiler.amostrar(0.01)
+    finally:
+        coleta.join()
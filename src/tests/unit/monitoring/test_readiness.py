@@ -0,0 +1,25 @@
+import asyncio
+
+from src.api.config import Config
+from src.api.monitoring.readiness import VerificadorProntidao
+
+
+def test_verificador_usado_em_mais_de_um_event_loop(monkeypatch):
+    monkeypatch.setattr(Config, "READINESS_CACHE_SECONDS", 0)
+    verificador = VerificadorProntidao(obter_engine=None)
+    execucoes = []
+
+    async def executar_verificacoes():
+        # Mantém o lock ocupado para que a segunda chamada tenha de esperar.
+        await asyncio.sleep(0.01)
+        execucoes.append(1)
+        return {"status": "ready"}
+
+    monkeypatch.setattr(verificador, "_executar_verificacoes", executar_verificacoes)
+
+    async def verificar_em_paralelo():
+        return await asyncio.gather(verificador.verificar(), verificador.verificar())
+
+    for _ in range(2):
+        assert asyncio.run(verificar_em_paralelo()) == [{"status": "ready"}] * 2
+    assert len(execucoes) == 4
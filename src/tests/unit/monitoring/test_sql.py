@@ -0,0 +1,22 @@
+from collections import Counter
+
+from src.api.monitoring.sql import EstatisticasConsultas, formato_do_comando
+
+
+def test_formato_do_comando_ignora_valores():
+    primeiro = formato_do_comando(
+        "SELECT * FROM tarefas\n  WHERE aluno_id = $1 AND id IN ($2, $3) LIMIT 10"
+    )
+    segundo = formato_do_comando(
+        "SELECT * FROM tarefas WHERE aluno_id = $1 AND id IN ($2, $3, $4) LIMIT 20"
+    )
+
+    assert primeiro == segundo
+
+
+def test_formatos_repetidos():
+    estatisticas = EstatisticasConsultas()
+    estatisticas.formatos = Counter({"SELECT N": 5, "SELECT * FROM alunos": 1})
+
+    assert estatisticas.formatos_repetidos(3) == [("SELECT N", 5)]
+    assert estatisticas.formatos_repetidos(5) == []
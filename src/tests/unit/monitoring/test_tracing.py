@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+
+from src.api.monitoring import tracing
+from src.api.monitoring.logs import id_do_trace
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+@pytest.fixture
+def exportador(tmp_path):
+    exportador = tracing.ExportadorOTLP(arquivo=str(tmp_path / "spans.jsonl"))
+    tracing.configurar_tracing(exportador)
+    yield exportador
+    tracing.encerrar_tracing()
+
+
+def test_ler_traceparent():
+    assert tracing.ler_traceparent(TRACEPARENT) == (
+        TRACE_ID,
+        "00f067aa0ba902b7",
+        True,
+    )
+    assert tracing.ler_traceparent(TRACEPARENT[:-1] + "0")[2] is False
+    assert tracing.ler_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+    assert tracing.ler_traceparent("lixo") is None
+
+
+def test_spans_sem_trace_nao_sao_registrados():
+    with tracing.iniciar_span("fora") as span:
+        assert span is None
+
+
+def test_trace_recebido_e_continuado_nos_spans_filhos(exportador):
+    @tracing.rastrear("ServicoAluno.criar")
+    async def criar():
+        tracing.registrar_span("SELECT", tracing.CLIENTE, 0.002, {"db.system": "x"})
+        return tracing.cabecalhos_de_propagacao()["traceparent"]
+
+    with tracing.iniciar_trace("POST /alunos/", TRACEPARENT) as raiz:
+        assert id_do_trace.get() == TRACE_ID
+        traceparent_externo = asyncio.run(criar())
+    assert id_do_trace.get() is None
+
+    spans = {span.nome: span for span in exportador._spans}
+    servico, consulta = spans["ServicoAluno.criar"], spans["SELECT"]
+    assert raiz.pai_id == "00f067aa0ba902b7"
+    assert servico.pai_id == raiz.span_id and consulta.pai_id == servico.span_id
+    assert traceparent_externo == f"00-{TRACE_ID}-{servico.span_id}-01"
+    assert consulta.fim_ns - consulta.inicio_ns == 2_000_000
+
+
+def test_trace_fora_da_amostra_nao_registra_filhos(exportador):
+    with tracing.iniciar_trace("GET /", TRACEPARENT[:-1] + "0") as raiz:
+        with tracing.iniciar_span("filho") as filho:
+            assert raiz is None and filho is None
+
+    assert exportador.exportar() == 0
+
+
+def test_exportacao_em_otlp_json(exportador):
+    with pytest.raises(ValueError):
+        with tracing.iniciar_trace("GET /", atributos={"http.status_code": 500}):
+            raise ValueError()
+
+    assert exportador.exportar() == 1
+    with open(exportador.arquivo, encoding="utf-8") as arquivo:
+        lote = json.loads(arquivo.readline())
+    span = lote["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert span["kind"] == tracing.SERVIDOR and "parentSpanId" not in span
+    assert span["status"] == {"code": 2, "message": "ValueError"}
+    assert span["attributes"] == [
+        {"key": "http.status_code", "value": {"intValue": "500"}}
+    ]
@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.config import Config
+from src.api.database.revogacao import ListaDeRevogacao, lista_de_revogacao
+from src.api.exceptions.credentials_exception import CredenciaisInvalidasException
+from src.api.services.auth import ServicoAuth
+from src.api.utils.tokens import cache_de_tokens
+
+
+class RepositorioDeRevogacoes:
+    def __init__(self):
+        self.revogados = set()
+        self.usuarios = {
+            "prof@ufba.br": SimpleNamespace(
+                email="prof@ufba.br",
+                tipo_usuario=SimpleNamespace(titulo="PROFESSOR"),
+                senha_alterada_em=None,
+            )
+        }
+
+    async def buscar_usuario_por_email(self, email: str):
+        return self.usuarios.get(email)
+
+    async def revogar_token(self, jti: str, expira_em: datetime) -> bool:
+        if jti in self.revogados:
+            return False
+        self.revogados.add(jti)
+        return True
+
+
+@pytest.fixture(autouse=True)
+def configuracao_de_teste(monkeypatch):
+    monkeypatch.setattr(Config.AUTH, "SECRET_KEY", "chave-de-teste")
+    monkeypatch.setattr(Config.AUTH, "ALGORITHM", "HS256")
+    monkeypatch.setattr(Config.AUTH, "ACCESS_TOKEN_EXPIRE_MINUTES", 30)
+    cache_de_tokens.limpar()
+
+
+def test_refresh_token_renova_uma_unica_vez():
+    auth = ServicoAuth(RepositorioDeRevogacoes())
+    tokens = auth._emitir_tokens("prof@ufba.br", "PROFESSOR")
+
+    renovados = asyncio.run(auth.renovar_token(tokens.refresh_token))
+
+    assert asyncio.run(auth.verificar_token(renovados.access_token)) == "prof@ufba.br"
+    with pytest.raises(CredenciaisInvalidasException):
+        asyncio.run(auth.renovar_token(tokens.refresh_token))
+
+
+def test_refresh_token_nao_autentica_requisicoes():
+    auth = ServicoAuth(RepositorioDeRevogacoes())
+    tokens = auth._emitir_tokens("prof@ufba.br", "PROFESSOR")
+
+    with pytest.raises(CredenciaisInvalidasException):
+        asyncio.run(auth.verificar_token(tokens.refresh_token))
+    with pytest.raises(CredenciaisInvalidasException):
+        asyncio.run(auth.renovar_token(tokens.access_token))
+
+
+def test_refresh_token_de_usuario_removido_e_recusado():
+    repo = RepositorioDeRevogacoes()
+    auth = ServicoAuth(repo)
+    tokens = auth._emitir_tokens("prof@ufba.br", "PROFESSOR")
+    del repo.usuarios["prof@ufba.br"]
+
+    with pytest.raises(CredenciaisInvalidasException):
+        asyncio.run(auth.renovar_token(tokens.refresh_token))
+
+
+def test_refresh_token_anterior_a_troca_de_senha_e_recusado():
+    repo = RepositorioDeRevogacoes()
+    auth = ServicoAuth(repo)
+    anterior = auth._emitir_tokens("prof@ufba.br", "PROFESSOR")
+    usuario = repo.usuarios["prof@ufba.br"]
+    usuario.senha_alterada_em = datetime.utcnow() + timedelta(seconds=1)
+
+    with pytest.raises(CredenciaisInvalidasException):
+        asyncio.run(auth.renovar_token(anterior.refresh_token))
+
+    usuario.senha_alterada_em -= timedelta(seconds=2)
+    posterior = auth._emitir_tokens("prof@ufba.br", "PROFESSOR")
+    asyncio.run(auth.renovar_token(posterior.refresh_token))
+
+
+def test_access_token_revogado_e_recusado_mesmo_em_cache():
+    auth = ServicoAuth(RepositorioDeRevogacoes())
+    tokens = auth._emitir_tokens("prof@ufba.br", "PROFESSOR")
+    asyncio.run(auth.verificar_token(tokens.access_token))
+
+    asyncio.run(auth.revogar_tokens(tokens.access_token, tokens.refresh_token))
+
+    with pytest.raises(CredenciaisInvalidasException):
+        asyncio.run(auth.verificar_token(tokens.access_token))
+    with pytest.raises(CredenciaisInvalidasException):
+        asyncio.run(auth.renovar_token(tokens.refresh_token))
+    assert len(lista_de_revogacao) >= 2
+
+
+def test_lista_de_revogacao_descarta_vencidos_e_os_mais_proximos_do_vencimento():
+    lista = ListaDeRevogacao(tamanho_maximo=2)
+    agora = datetime.utcnow()
+    lista.adicionar("vencido", agora - timedelta(minutes=1))
+    lista.adicionar("longo", agora + timedelta(days=1))
+    lista.adicionar("curto", agora + timedelta(minutes=1))
+    lista.adicionar("medio", agora + timedelta(hours=1))
+
+    assert "vencido" not in lista
+    assert "curto" not in lista
+    assert "longo" in lista and "medio" in lista
+    assert None not in lista
@@ -0,0 +1,33 @@
+from datetime import date, datetime
+
+from src.api.utils.notificacao import (
+    calcular_proxima_notificacao,
+    proxima_notificacao_apos_aviso,
+)
+
+AGORA = datetime(2024, 9, 1, 10, 30)
+
+
+def test_primeiro_aviso_na_entrada_da_janela_de_prazo_proximo():
+    proxima = calcular_proxima_notificacao(date(2024, 12, 31), False, AGORA)
+
+    assert proxima == datetime(2024, 12, 1)
+
+
+def test_primeiro_aviso_imediato_para_tarefa_dentro_da_janela_ou_atrasada():
+    assert calcular_proxima_notificacao(date(2024, 9, 10), False, AGORA) == AGORA
+    assert calcular_proxima_notificacao(date(2024, 8, 1), False, AGORA) == AGORA
+
+
+def test_tarefa_concluida_nao_tem_aviso():
+    assert calcular_proxima_notificacao(date(2024, 12, 31), True, AGORA) is None
+
+
+def test_apos_aviso_de_prazo_proximo_agenda_aviso_de_atraso():
+    proxima = proxima_notificacao_apos_aviso(date(2024, 9, 10), AGORA)
+
+    assert proxima == datetime(2024, 9, 11)
+
+
+def test_apos_aviso_de_atraso_nao_ha_outro():
+    assert proxima_notificacao_apos_aviso(date(2024, 8, 1), AGORA) is None
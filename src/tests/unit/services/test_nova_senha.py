@@ -0,0 +1,81 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from core.mocked_database import sessao_de_teste
+
+from src.api.config import Config
+from src.api.database.models.usuario import Usuario
+from src.api.database.repository import PGCopRepository
+from src.api.entrypoints.new_password.errors import AuthenticationException
+from src.api.services.nova_senha import ServicoNovaSenha, generate_token, hash_do_token
+
+EMAIL = "nova.senha@ufba.br"
+CODIGO = "A1B2C3D4"
+
+# Com `False`, o dialeto se comporta como o MySQL, sem RETURNING no UPDATE.
+COM_E_SEM_RETURNING = pytest.mark.parametrize("returning", [True, False])
+
+
+@pytest.fixture(autouse=True)
+def configuracao_de_teste(monkeypatch):
+    monkeypatch.setattr(Config.AUTH, "SECRET_KEY", "chave-de-teste")
+    monkeypatch.setattr(Config.AUTH, "NOVA_SENHA_MAX_TENTATIVAS", 3)
+
+
+def validar(codigos: list[str], expira_em: datetime, returning=True) -> list[bool]:
+    """Confere cada código, em ordem, contra um código pendente no banco."""
+
+    async def teste():
+        async with sessao_de_teste() as session:
+            session.get_bind().dialect.update_returning = returning
+            repo = PGCopRepository(session)
+            usuario = await repo.criar(
+                Usuario(
+                    nome="Nova Senha", email=EMAIL, senha_hash="-", tipo_usuario_id=3
+                )
+            )
+            await repo.salvar_token_nova_senha(
+                usuario.id, hash_do_token(CODIGO), expira_em
+            )
+
+            # As tentativas usam a sessão do teste no lugar de uma sessão nova.
+            @asynccontextmanager
+            async def sessoes():
+                yield session
+
+            servico = ServicoNovaSenha(repo, sessoes=sessoes)
+            aceitos = []
+            for codigo in codigos:
+                try:
+                    await servico.autenticar_usuario_com_token(EMAIL, codigo)
+                    aceitos.append(True)
+                except AuthenticationException:
+                    aceitos.append(False)
+            return aceitos
+
+    return asyncio.run(teste())
+
+
+def test_codigo_guardado_apenas_como_hash():
+    token = generate_token()
+
+    assert len(token) == 8 and token.isalnum()
+    assert hash_do_token(token) != token
+    assert hash_do_token(token.lower()) == hash_do_token(token)
+
+
+@COM_E_SEM_RETURNING
+def test_codigo_bloqueado_depois_das_tentativas(banco_de_teste, returning):
+    valido_em = datetime.utcnow() + timedelta(minutes=5)
+
+    assert validar(["ERRADO00", CODIGO.lower()], valido_em, returning) == [
+        False,
+        True,
+    ]
+    assert validar(["ERRADO00"] * 3 + [CODIGO], valido_em, returning) == [False] * 4
+
+
+def test_codigo_vencido_e_recusado(banco_de_teste):
+    assert validar([CODIGO], datetime.utcnow() - timedelta(seconds=1)) == [False]
@@ -0,0 +1,28 @@
+import json
+from datetime import date
+
+from src.api.entrypoints.tarefas.schema import TarefaInDB
+from src.api.utils.enums import StatusSolicitacaoEnum
+from src.api.utils.respostas import RespostaJSONRapida
+
+
+def test_resposta_rapida_equivale_ao_response_model():
+    linha = {
+        "nome": "Qualificação",
+        "descricao": "Defesa do projeto",
+        "data_prazo": date(2025, 3, 1),
+        "aluno_id": 1,
+        "concluida": False,
+        "data_conclusao": None,
+        "id": 7,
+    }
+
+    corpo = RespostaJSONRapida([linha]).body
+
+    assert json.loads(corpo) == [TarefaInDB(**linha).model_dump(mode="json")]
+
+
+def test_resposta_rapida_serializa_enums():
+    corpo = RespostaJSONRapida({"status": StatusSolicitacaoEnum.PENDENTE}).body
+
+    assert json.loads(corpo) == {"status": StatusSolicitacaoEnum.PENDENTE.value}
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from src.api.utils import tokens
+from src.api.utils.tokens import CacheDeTokens, TokenInvalidoError
+
+
+@pytest.fixture(autouse=True)
+def chave_de_teste(monkeypatch):
+    monkeypatch.setattr(tokens.Config.AUTH, "SECRET_KEY", "chave-de-teste")
+    monkeypatch.setattr(tokens.Config.AUTH, "ALGORITHM", "HS256")
+    tokens.cache_de_tokens.limpar()
+    yield
+    tokens.cache_de_tokens.limpar()
+
+
+def test_token_valido_e_guardado_no_cache():
+    token = tokens.codificar_token({"sub": "a@ufba.br", "exp": time.time() + 60})
+
+    assert tokens.decodificar_token(token)["sub"] == "a@ufba.br"
+    assert tokens.cache_de_tokens.buscar(token)["sub"] == "a@ufba.br"
+
+
+def test_token_invalido_nao_e_guardado_no_cache():
+    token = tokens.codificar_token({"sub": "a@ufba.br", "exp": time.time() + 60})
+    adulterado = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    with pytest.raises(TokenInvalidoError):
+        tokens.decodificar_token(adulterado)
+    assert len(tokens.cache_de_tokens) == 0
+
+
+def test_cache_respeita_o_exp_do_token():
+    cache = CacheDeTokens(tamanho=10)
+    cache.guardar("expirado", {"sub": "a@ufba.br", "exp": time.time() - 1})
+    cache.guardar("valido", {"sub": "b@ufba.br", "exp": time.time() + 60})
+
+    assert cache.buscar("expirado") is None
+    assert cache.buscar("valido")["sub"] == "b@ufba.br"
+    assert len(cache) == 1
+
+
+def test_cache_descarta_o_menos_usado_recentemente():
+    cache = CacheDeTokens(tamanho=2)
+    exp = time.time() + 60
+    cache.guardar("a", {"exp": exp})
+    cache.guardar("b", {"exp": exp})
+    cache.buscar("a")
+    cache.guardar("c", {"exp": exp})
+
+    assert cache.buscar("b") is None
+    assert cache.buscar("a") is not None
+    assert cache.buscar("c") is not None
+
+
+def test_cache_com_tamanho_zero_fica_desativado():
+    cache = CacheDeTokens(tamanho=0)
+    cache.guardar("a", {"exp": time.time() + 60})
+
+    assert cache.buscar("a") is None